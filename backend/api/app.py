@@ -1,36 +1,73 @@
 """
 CompanyWise API — FastAPI application serving Companies House financial data.
 
-9 endpoints:
-  GET /api/health                        — database stats
+13 endpoints:
+  GET /api/health                        — database stats (?exact=1 recounts)
   GET /api/search                        — company name search
+  GET /api/suggest                       — typeahead (in-memory prefix index)
   GET /api/company/{number}              — company profile + filings
-  GET /api/filing/{id}/facts             — raw filing facts
+  GET /api/company/{number}/report       — profile + filings + latest report facts
+  GET /api/filing/{id}/facts             — raw filing facts (?format=columnar|msgpack)
+  GET /api/filing/{id}/summary           — precomputed headline figures
   GET /api/batch/{batch_id}              — batch metadata
   GET /api/concepts                      — browse concepts
   GET /api/concepts/search               — search concepts by name
   GET /api/filing/by-source/{filename}   — lookup filing by source filename
   GET /api/facts/by-concept/{concept}    — cross-filing concept query
+  GET /api/facts/by-concept/{concept}/export — streamed NDJSON/CSV, keyset paged
+
+Routes are async and await backend.db.async_queries, which runs each query on
+a bounded "lookup" or "analytical" executor lane with its own connection pool,
+so slow scans cannot starve cheap lookups.
+
+GET responses are cached in-process and carry an ETag derived from the latest
+processed batch (backend.api.cache), so repeat requests skip SQLite entirely.
+
+JSON is encoded with orjson when installed (backend.api.responses); filing
+facts can also be fetched dictionary-encoded, as JSON or msgpack.
 """
 
+import threading
+from contextlib import asynccontextmanager
+from datetime import date
+from typing import Literal
+
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 
-from backend.db.queries import (
-    get_batch,
-    get_all_concepts,
-    get_company,
-    get_database_stats,
-    get_facts_by_concept,
-    get_filing_by_source,
-    get_filing_with_facts,
-    get_filings_for_company,
-    search_companies,
-    search_concepts,
+from backend.api.cache import CacheMiddleware
+from backend.api.export import (
+    CSV_MEDIA_TYPE, NDJSON_MEDIA_TYPE, attachment_disposition, csv_chunks, ndjson_chunks
+)
+from backend.api.responses import FastJSONResponse, MsgpackResponse, msgpack
+from backend.api.suggest import SuggestIndex, keep_fresh
+from backend.db import async_queries as db
+from backend.db.queries import FACT_EXPORT_COLUMNS
+
+suggest_index = SuggestIndex()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    stop = threading.Event()
+    refresher = threading.Thread(
+        target=keep_fresh, args=(suggest_index, stop), name="suggest-index", daemon=True
+    )
+    refresher.start()
+    yield
+    stop.set()
+    db.shutdown()
+
+
+app = FastAPI(
+    title="CompanyWise API",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
-app = FastAPI(title="CompanyWise API", version="0.1.0")
-
+app.middleware("http")(CacheMiddleware(api_version=app.version))
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -45,63 +82,121 @@ app.add_middleware(
 
 
 @app.get("/api/health")
-def health():
-    return get_database_stats()
+async def health(exact: bool = Query(False)):
+    return await db.get_database_stats(exact)
 
 
 @app.get("/api/search")
-def search(q: str = Query(..., min_length=1), limit: int = Query(20, ge=1, le=100)):
-    pattern = f"%{q}%"
-    return search_companies(pattern, limit)
+async def search(q: str = Query(..., min_length=1), limit: int = Query(20, ge=1, le=100)):
+    return await db.search_companies(q, limit)
+
+
+@app.get("/api/suggest")
+async def suggest(q: str = Query(..., min_length=1), limit: int = Query(10, ge=1, le=50)):
+    if not suggest_index.ready:
+        # Index still building at startup; fall back to the indexed DB search
+        return await db.search_companies(q, limit)
+    return suggest_index.suggest(q, limit)
 
 
 @app.get("/api/company/{number}")
-def company(number: str):
-    comp = get_company(number)
+async def company(number: str):
+    comp = await db.get_company(number)
     if not comp:
         raise HTTPException(status_code=404, detail="Company not found")
-    filings = get_filings_for_company(number)
+    filings = await db.get_filings_for_company(number)
     return {"company": comp, "filings": filings}
 
 
+@app.get("/api/company/{number}/report")
+async def company_report(number: str):
+    data = await db.get_company_report(number)
+    if not data:
+        raise HTTPException(status_code=404, detail="Company not found")
+    return data
+
+
 @app.get("/api/filing/by-source/{filename}")
-def filing_by_source(filename: str):
-    data = get_filing_by_source(filename)
+async def filing_by_source(filename: str):
+    data = await db.get_filing_by_source(filename)
     if not data:
         raise HTTPException(status_code=404, detail="Filing not found")
     return data
 
 
 @app.get("/api/filing/{filing_id}/facts")
-def filing_facts(filing_id: int):
-    data = get_filing_with_facts(filing_id)
+async def filing_facts(
+    filing_id: int,
+    format: Literal["json", "columnar", "msgpack"] = Query("json"),
+):
+    if format == "msgpack" and msgpack is None:
+        raise HTTPException(status_code=406, detail="msgpack encoding not available")
+    if format == "json":
+        data = await db.get_filing_with_facts(filing_id)
+    else:
+        data = await db.get_filing_with_facts_columnar(filing_id)
     if not data:
         raise HTTPException(status_code=404, detail="Filing not found")
+    # Rows are plain SQLite values: encode directly, skipping jsonable_encoder
+    if format == "msgpack":
+        return MsgpackResponse(data)
+    return FastJSONResponse(data)
+
+
+@app.get("/api/filing/{filing_id}/summary")
+async def filing_summary(filing_id: int):
+    data = await db.get_filing_summary(filing_id)
+    if not data:
+        raise HTTPException(status_code=404, detail="Filing summary not found")
     return data
 
 
 @app.get("/api/batch/{batch_id}")
-def batch(batch_id: int):
-    data = get_batch(batch_id)
+async def batch(batch_id: int):
+    data = await db.get_batch(batch_id)
     if not data:
         raise HTTPException(status_code=404, detail="Batch not found")
     return data
 
 
 @app.get("/api/concepts/search")
-def concepts_search(q: str = Query(..., min_length=1), limit: int = Query(50, ge=1, le=500)):
+async def concepts_search(q: str = Query(..., min_length=1), limit: int = Query(50, ge=1, le=500)):
     pattern = f"%{q}%"
-    return search_concepts(pattern, limit)
+    return await db.search_concepts(pattern, limit)
 
 
 @app.get("/api/concepts")
-def concepts(limit: int = Query(100, ge=1, le=1000), offset: int = Query(0, ge=0)):
-    return get_all_concepts(limit, offset)
+async def concepts(limit: int = Query(100, ge=1, le=1000), offset: int = Query(0, ge=0)):
+    return await db.get_all_concepts(limit, offset)
 
 
 @app.get("/api/facts/by-concept/{concept}")
-def facts_by_concept(concept: str, limit: int = Query(1000, ge=1, le=10000)):
-    return get_facts_by_concept(concept, limit)
+async def facts_by_concept(concept: str, limit: int = Query(1000, ge=1, le=10000)):
+    return await db.get_facts_by_concept(concept, limit)
+
+
+@app.get("/api/facts/by-concept/{concept}/export")
+async def facts_by_concept_export(
+    concept: str,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    after_id: int = Query(0, ge=0),
+    limit: int | None = Query(None, ge=1),
+    company: str | None = None,
+    date_from: date | None = None,
+    date_to: date | None = None,
+):
+    pages = db.iter_facts_by_concept(
+        concept, after_id, limit, company,
+        date_from.isoformat() if date_from else None,
+        date_to.isoformat() if date_to else None,
+    )
+    if format == "csv":
+        return StreamingResponse(
+            csv_chunks(pages, FACT_EXPORT_COLUMNS),
+            media_type=CSV_MEDIA_TYPE,
+            headers={"Content-Disposition": attachment_disposition(f"{concept}.csv")},
+        )
+    return StreamingResponse(ndjson_chunks(pages), media_type=NDJSON_MEDIA_TYPE)
 
 
 if __name__ == "__main__":
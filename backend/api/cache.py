@@ -0,0 +1,218 @@
+"""
+HTTP response cache for the API, keyed on the batch watermark.
+
+The data only changes when the loader marks a batch processed, or when a
+write outside a batch (summary backfill, db_stats refresh) bumps
+data_version, so every GET response is a pure function of (URL, data
+version). The data version is the latest processed batch plus data_version
+(queries.get_batch_watermark), re-read at most every WATERMARK_CHECK_SECONDS:
+
+- ETag: strong, derived from the API version + watermark. A request for an
+  existing route whose If-None-Match matches gets 304 without touching
+  SQLite; paths no route matches are passed to the app (for its 404).
+- Cache: successful JSON/msgpack GET bodies kept in-process in an LRU bounded by a
+  byte budget, each entry expiring after RESPONSE_CACHE_TTL seconds. Cleared
+  as soon as the watermark moves. Other media types (streamed exports) pass
+  through unbuffered.
+
+Cacheable responses carry Cache-Control: public, max-age=RESPONSE_CACHE_MAX_AGE
+plus the ETag, so a reverse proxy (nginx proxy_cache) can cache and revalidate
+too. Everything else the middleware sees - UNCACHED_PATHS and streamed
+exports - is sent with Cache-Control: no-store and no ETag, so proxies never
+store unbounded exports or a stale /api/health.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response
+from starlette.routing import Match
+
+from backend.db import async_queries as db
+
+logger = logging.getLogger(__name__)
+
+# Memory budget for cached bodies (MB), per API process
+RESPONSE_CACHE_MB = int(os.environ.get("COMPANYWISE_RESPONSE_CACHE_MB", "64"))
+RESPONSE_CACHE_TTL = float(os.environ.get("COMPANYWISE_RESPONSE_CACHE_TTL", "300"))
+RESPONSE_CACHE_MAX_AGE = 60   # Cache-Control max-age for browsers/proxies (seconds)
+WATERMARK_CHECK_SECONDS = 2.0  # How stale the in-process data version may be
+MAX_ENTRY_FRACTION = 8         # Don't cache a body larger than budget / N
+
+# Never cached: served from their own in-memory state (suggest), or must
+# reflect the live backend (health)
+UNCACHED_PATHS = ("/api/suggest", "/api/health")
+
+# Bodies of these types are buffered and cached; anything else is streamed
+CACHEABLE_MEDIA_TYPES = ("application/json", "application/msgpack")
+
+_ENTRY_OVERHEAD = 256  # Rough per-entry bytes for key, headers, bookkeeping
+
+_NO_STORE = "no-store"
+
+
+@dataclass
+class _Entry:
+    body: bytes
+    media_type: str | None
+    expires_at: float
+    size: int
+
+
+class ResponseCache:
+    """LRU + TTL cache of response bodies, bounded by total size in bytes.
+
+    Only touched from the event loop thread, so it needs no locking.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> _Entry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, body: bytes, media_type: str | None) -> None:
+        size = len(body) + len(key) + _ENTRY_OVERHEAD
+        if size > self.max_bytes // MAX_ENTRY_FRACTION:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _Entry(body, media_type, time.monotonic() + self.ttl, size)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        self._bytes -= self._entries.pop(key).size
+
+
+def _matches_route(request: Request) -> bool:
+    """Whether a route of the app handles this request (else it 404s)."""
+    return any(
+        route.matches(request.scope)[0] == Match.FULL for route in request.app.router.routes
+    )
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison (RFC 9110 13.1.2), as proxies may weaken our ETag.
+
+    "*" is not special-cased: it would turn any path, even one that 404s,
+    into a 304 before routing.
+    """
+    tags = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+class CacheMiddleware:
+    """HTTP middleware adding watermark ETags, 304s and the response cache.
+
+    Usage:
+        app.middleware("http")(CacheMiddleware(api_version=app.version))
+    """
+
+    def __init__(self, api_version: str, max_bytes: int | None = None, ttl: float | None = None):
+        self.api_version = api_version
+        self.cache = ResponseCache(
+            max_bytes if max_bytes is not None else RESPONSE_CACHE_MB * 1024 * 1024,
+            ttl if ttl is not None else RESPONSE_CACHE_TTL,
+        )
+        self.etag: str | None = None
+        self._watermark: tuple | None = None
+        self._next_check = 0.0
+
+    async def _current_etag(self) -> str:
+        """ETag for the current data version, re-reading the watermark if due."""
+        now = time.monotonic()
+        if self.etag is None or now >= self._next_check:
+            # Set before awaiting so concurrent requests don't all re-check
+            self._next_check = now + WATERMARK_CHECK_SECONDS
+            mark = await db.get_batch_watermark()
+            watermark = (mark["batch_id"], mark["processed_at"], mark["data_version"])
+            if watermark != self._watermark:
+                if self._watermark is not None:
+                    logger.info(
+                        f"Data version changed to batch {watermark[0]} "
+                        f"(data_version {watermark[2]}): "
+                        f"dropping {len(self.cache):,} cached responses"
+                    )
+                self.cache.clear()
+                self._watermark = watermark
+                digest = hashlib.sha1(
+                    f"{self.api_version}|{watermark[0]}|{watermark[1]}|{watermark[2]}".encode()
+                ).hexdigest()[:16]
+                self.etag = f'"{digest}"'
+        return self.etag
+
+    def _headers(self, etag: str) -> dict[str, str]:
+        return {"ETag": etag, "Cache-Control": f"public, max-age={RESPONSE_CACHE_MAX_AGE}"}
+
+    async def __call__(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        path = request.url.path
+        if request.method != "GET" or not path.startswith("/api/"):
+            return await call_next(request)
+        if path.startswith(UNCACHED_PATHS):
+            response = await call_next(request)
+            response.headers["Cache-Control"] = _NO_STORE
+            return response
+        if not _matches_route(request):
+            return await call_next(request)
+
+        etag = await self._current_etag()
+        if _etag_matches(request.headers.get("if-none-match", ""), etag):
+            return Response(status_code=304, headers=self._headers(etag))
+
+        key = f"{path}?{'&'.join(sorted(request.url.query.split('&')))}"
+        entry = self.cache.get(key)
+        if entry is not None:
+            return Response(entry.body, media_type=entry.media_type, headers=self._headers(etag))
+
+        response = await call_next(request)
+        if response.status_code != 200:
+            return response
+
+        media_type = response.headers.get("content-type")
+        if media_type not in CACHEABLE_MEDIA_TYPES:
+            # Streamed exports: pass through unbuffered, never stored by proxies
+            response.headers["Cache-Control"] = _NO_STORE
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        # Only cache if the data version didn't move while the query ran
+        if etag == self.etag:
+            self.cache.put(key, body, media_type)
+        headers = {
+            k: v for k, v in response.headers.items()
+            if k.lower() not in ("content-length", "content-type")
+        }
+        headers.update(self._headers(etag))
+        return Response(body, status_code=200, media_type=media_type, headers=headers)
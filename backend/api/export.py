@@ -0,0 +1,57 @@
+"""
+Streaming serialisers for bulk exports (e.g. /api/facts/by-concept/{c}/export).
+
+Each takes an async iterator of row pages (lists of dicts, as yielded by
+async_queries.iter_facts_by_concept) and yields one encoded chunk per page,
+so a response never holds more than one page in memory.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import re
+from typing import AsyncIterator, Sequence
+from urllib.parse import quote
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+CSV_MEDIA_TYPE = "text/csv"
+
+# Characters kept in the plain filename= fallback of Content-Disposition
+_UNSAFE_FILENAME_RE = re.compile(r"[^A-Za-z0-9._-]")
+
+
+def attachment_disposition(filename: str) -> str:
+    """
+    Content-Disposition value for a download named `filename`.
+
+    Header values must be Latin-1 and `filename` may come from the URL, so
+    the quoted filename= is reduced to safe ASCII and the exact name is
+    sent as RFC 5987 filename*=UTF-8''..., which browsers prefer.
+    """
+    fallback = _UNSAFE_FILENAME_RE.sub("_", filename)
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename, safe='')}"
+
+
+async def ndjson_chunks(pages: AsyncIterator[list[dict]]) -> AsyncIterator[bytes]:
+    """One JSON object per line."""
+    async for page in pages:
+        yield "".join(json.dumps(row) + "\n" for row in page).encode()
+
+
+async def csv_chunks(
+    pages: AsyncIterator[list[dict]], columns: Sequence[str]
+) -> AsyncIterator[bytes]:
+    """CSV with a header row; `columns` fixes the column order."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+    async for page in pages:
+        writer.writerows(page)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        # Header only: nothing matched
+        yield buffer.getvalue().encode()
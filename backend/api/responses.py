@@ -0,0 +1,46 @@
+"""
+Response classes for the API: fast JSON and msgpack encodings.
+
+Both encoders are optional dependencies:
+- orjson: FastJSONResponse serialises with orjson when it is installed
+  (several times faster than the stdlib on large fact lists), otherwise falls
+  back to Starlette's json.dumps. Output is the same compact JSON either way.
+- msgpack: MsgpackResponse is only available when msgpack is installed;
+  check `msgpack is not None` before using it.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.responses import JSONResponse, Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when available."""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content)
+
+
+class MsgpackResponse(Response):
+    """msgpack-encoded response (requires the msgpack package)."""
+
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, use_bin_type=True)
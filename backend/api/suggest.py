@@ -0,0 +1,303 @@
+"""
+In-memory typeahead index for GET /api/suggest.
+
+Company names and numbers are normalised (ASCII, upper case, punctuation
+collapsed to single spaces) into search keys held in one sorted, packed
+array and searched with bisect. A prefix lookup is two binary searches plus
+a short scan, so suggestions never touch SQLite.
+
+Layout (per key: ~key length + 8 bytes, no per-key Python objects):
+- keys: _PackedKeys (one bytes blob + array of offsets), sorted
+- refs: array('I') mapping each key to a company record index
+- records: parallel lists of company_number / name / jurisdiction, append-only
+  so refs stay valid across refreshes
+
+The index is built once at API startup from the companies table, then
+refreshed incrementally: when a new batch has been marked processed, only
+companies with filings in that batch are merged in. Refreshes only touch a
+small sorted delta (new keys), a set of dropped main keys and a rename
+overlay, so their cost follows the batch, not the register; the delta is
+folded into the packed arrays once it outgrows 1/COMPACT_FRACTION of them.
+Everything a lookup reads is one immutable _Snapshot, swapped in whole.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+
+from backend.db.connection import get_connection
+from backend.db.queries import get_batch_watermark
+
+logger = logging.getLogger(__name__)
+
+SUGGEST_REFRESH_SECONDS = 60  # How often to poll for newly processed batches
+COMPACT_FRACTION = 8          # Fold the delta into the packed keys once over 1/N of them
+
+_ELIDED_RE = re.compile(r"[.']+")  # Dropped without a word break: "A.B.C" -> "ABC"
+_NON_ALNUM_RE = re.compile(r"[^A-Z0-9]+")
+
+
+def normalise(text: str) -> str:
+    """Normalise a company name, number or query into a search key.
+
+    "Café & Co. (U.K.) Ltd" -> "CAFE CO UK LTD"
+    """
+    ascii_text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    ascii_text = _ELIDED_RE.sub("", ascii_text.upper())
+    return _NON_ALNUM_RE.sub(" ", ascii_text).strip()
+
+
+class _PackedKeys:
+    """Sorted ASCII keys stored in one bytes blob, indexable for bisect."""
+
+    def __init__(self, keys: Iterable[bytes] = ()):
+        blob = bytearray()
+        offsets = array("Q", [0])
+        for key in keys:
+            blob += key
+            offsets.append(len(blob))
+        self._blob = bytes(blob)
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> bytes:
+        return self._blob[self._offsets[i]:self._offsets[i + 1]]
+
+    def __iter__(self) -> Iterator[bytes]:
+        blob, offsets = self._blob, self._offsets
+        for i in range(len(offsets) - 1):
+            yield blob[offsets[i]:offsets[i + 1]]
+
+
+class _Snapshot(NamedTuple):
+    """What lookups read. Replaced whole on refresh; the record lists are
+    only ever appended to, so an older snapshot's refs stay valid."""
+    keys: _PackedKeys                     # Main run, sorted by (key, ref)
+    refs: array
+    delta: list[tuple[bytes, int]]        # (key, ref) merged since the last compaction, sorted
+    dropped: frozenset                    # Main-run (key, ref) of renamed companies
+    renamed: dict[int, tuple[str | None, str | None]]  # ref -> (name, jurisdiction) since compaction
+    numbers: list[str]
+    names: list[str | None]
+    jurisdictions: list[str | None]
+
+    def record(self, ref: int) -> tuple[str | None, str | None]:
+        renamed = self.renamed.get(ref)
+        return renamed if renamed is not None else (self.names[ref], self.jurisdictions[ref])
+
+    def entries(self, prefix: bytes) -> Iterator[tuple[bytes, int]]:
+        """(key, ref) of keys starting with `prefix`, in key order."""
+        return heapq.merge(self._main_entries(prefix), self._delta_entries(prefix))
+
+    def _main_entries(self, prefix: bytes) -> Iterator[tuple[bytes, int]]:
+        keys, refs = self.keys, self.refs
+        i = bisect_left(keys, prefix)
+        while i < len(keys):
+            key = keys[i]
+            if not key.startswith(prefix):
+                return
+            if not self.dropped or (key, refs[i]) not in self.dropped:
+                yield key, refs[i]
+            i += 1
+
+    def _delta_entries(self, prefix: bytes) -> Iterator[tuple[bytes, int]]:
+        delta = self.delta
+        i = bisect_left(delta, (prefix,))
+        while i < len(delta) and delta[i][0].startswith(prefix):
+            yield delta[i]
+            i += 1
+
+
+class SuggestIndex:
+    """Prefix index over company names and numbers.
+
+    Lookups read an immutable _Snapshot, so they need no lock; refreshes
+    build a new snapshot and swap it in with one assignment.
+    """
+
+    def __init__(self):
+        self._snapshot = _Snapshot(
+            _PackedKeys(), array("I"), [], frozenset(), {}, [], [], []
+        )
+        self._write_lock = threading.Lock()
+        self.watermark: int | None = None  # Highest processed batch id indexed
+        self.ready = False
+
+    def __len__(self) -> int:
+        return len(self._snapshot.numbers)
+
+    def suggest(self, query: str, limit: int = 10) -> list[dict]:
+        """Return up to `limit` companies whose name or number starts with `query`.
+
+        Results are in key order, so an exact name/number match comes first.
+        """
+        prefix = normalise(query).encode()
+        if not prefix:
+            return []
+
+        snapshot = self._snapshot
+        results: list[dict] = []
+        seen: set[int] = set()
+        for _, ref in snapshot.entries(prefix):
+            if ref in seen:
+                continue
+            seen.add(ref)
+            name, jurisdiction = snapshot.record(ref)
+            results.append({
+                "company_number": snapshot.numbers[ref],
+                "name": name,
+                "jurisdiction": jurisdiction,
+            })
+            if len(results) >= limit:
+                break
+        return results
+
+    def _find_number(self, number: str) -> int | None:
+        """Record index for a company number, via its number key."""
+        key = normalise(number).encode()
+        snapshot = self._snapshot
+        for entry_key, ref in snapshot.entries(key):
+            if entry_key != key:
+                break
+            if snapshot.numbers[ref] == number:
+                return ref
+        return None
+
+    def _merge(self, rows: Iterable[tuple[str, str | None, str | None]]) -> int:
+        """Add or update companies in a new snapshot. Returns rows applied."""
+        snapshot = self._snapshot
+        numbers, names, jurisdictions = snapshot.numbers, snapshot.names, snapshot.jurisdictions
+        renamed = dict(snapshot.renamed)
+        added: list[tuple[bytes, int]] = []
+        stale: set[tuple[bytes, int]] = set()
+        applied = 0
+
+        for number, name, jurisdiction in rows:
+            ref = self._find_number(number) if self.ready else None
+            if ref is None:
+                # Appended past every ref the current snapshot can hold
+                ref = len(numbers)
+                numbers.append(number)
+                names.append(name)
+                jurisdictions.append(jurisdiction)
+                added.append((normalise(number).encode(), ref))
+            else:
+                old_name, old_jurisdiction = renamed.get(ref) or (names[ref], jurisdictions[ref])
+                if (old_name, old_jurisdiction) == (name, jurisdiction):
+                    continue
+                renamed[ref] = (name, jurisdiction)
+                if old_name == name:
+                    applied += 1
+                    continue
+                if old_name:
+                    stale.add((normalise(old_name).encode(), ref))
+            if name:
+                key = normalise(name).encode()
+                if key:
+                    added.append((key, ref))
+            applied += 1
+
+        if not added and not stale:
+            if renamed != snapshot.renamed:
+                self._snapshot = snapshot._replace(renamed=renamed)
+            return applied
+
+        # Both runs are sorted, so this is a linear merge inside sort()
+        delta = sorted([e for e in snapshot.delta if e not in stale] + added)
+        new = snapshot._replace(
+            delta=delta, dropped=snapshot.dropped | stale, renamed=renamed
+        )
+        if len(delta) * COMPACT_FRACTION > len(new.keys):
+            new = self._compact(new)
+        self._snapshot = new
+        return applied
+
+    @staticmethod
+    def _compact(snapshot: _Snapshot) -> _Snapshot:
+        """Fold the delta, dropped keys and renames into new packed arrays."""
+        names = list(snapshot.names)
+        jurisdictions = list(snapshot.jurisdictions)
+        for ref, (name, jurisdiction) in snapshot.renamed.items():
+            names[ref] = name
+            jurisdictions[ref] = jurisdiction
+        dropped = snapshot.dropped
+        main = zip(snapshot.keys, snapshot.refs)
+        if dropped:
+            main = (e for e in main if e not in dropped)
+        entries = list(heapq.merge(main, snapshot.delta))
+        return _Snapshot(
+            _PackedKeys(key for key, _ in entries),
+            array("I", (ref for _, ref in entries)),
+            [], frozenset(), {},
+            snapshot.numbers, names, jurisdictions,
+        )
+
+    def build(self, conn: sqlite3.Connection) -> None:
+        """Load every company from the database."""
+        with self._write_lock:
+            start = time.perf_counter()
+            watermark = get_batch_watermark(conn=conn)["batch_id"]
+            cursor = conn.execute("SELECT company_number, name, jurisdiction FROM companies")
+            self._merge(tuple(row) for row in cursor)
+            self.watermark = watermark
+            self.ready = True
+            logger.info(
+                f"Suggest index built: {len(self):,} companies, {len(self._snapshot.keys):,} keys "
+                f"in {time.perf_counter() - start:.1f}s"
+            )
+
+    def refresh(self, conn: sqlite3.Connection) -> int:
+        """Merge in companies from batches processed since the last build/refresh.
+
+        Returns:
+            Number of companies added or renamed
+        """
+        with self._write_lock:
+            watermark = get_batch_watermark(conn=conn)["batch_id"]
+            if watermark is None or watermark == self.watermark:
+                return 0
+            cursor = conn.execute(
+                """
+                SELECT DISTINCT c.company_number, c.name, c.jurisdiction
+                FROM filings f
+                JOIN companies c ON c.company_number = f.company_number
+                WHERE f.batch_id > ? AND f.batch_id <= ?
+                """,
+                (self.watermark or 0, watermark)
+            )
+            applied = self._merge(tuple(row) for row in cursor)
+            self.watermark = watermark
+            logger.info(f"Suggest index refreshed to batch {watermark}: {applied:,} companies updated")
+            return applied
+
+
+def keep_fresh(index: SuggestIndex, stop: threading.Event, db_path: Path | None = None) -> None:
+    """Build the index, then poll for new batches until `stop` is set.
+
+    Runs on its own thread with its own connection, so neither the initial
+    build nor refreshes occupy an API query lane.
+    """
+    conn = get_connection(db_path, read_only=True)
+    try:
+        index.build(conn)
+        while not stop.wait(SUGGEST_REFRESH_SECONDS):
+            try:
+                index.refresh(conn)
+            except sqlite3.Error as e:
+                logger.warning(f"Suggest index refresh failed: {e}")
+    except sqlite3.Error as e:
+        logger.error(f"Suggest index build failed: {e}")
+    finally:
+        conn.close()
@@ -0,0 +1,211 @@
+# Async data access layer - mirrors queries.py for async API routes
+"""
+Async wrappers around the query functions in backend.db.queries.
+
+SQLite calls are blocking, so each query runs on a dedicated, bounded thread
+executor ("lane") instead of Starlette's shared default threadpool. There are
+two lanes, each with its own read-only ConnectionPool sized to its workers:
+
+- lookup: cheap indexed queries (company, company report, filings, filing
+  summary, batch, concepts, company name search, database stats).
+- analytical: heavy scans and large result sets (facts by concept and its
+  streaming export, full filing facts, exact database stats).
+
+Requests beyond a lane's worker count wait in that lane's own queue, so a
+burst of 10,000-row scans can only ever occupy the analytical workers and
+company lookups keep a low tail latency.
+
+Usage:
+    from backend.db import async_queries
+
+    company = await async_queries.get_company("12345678")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, TypeVar
+
+from backend.db import queries
+from backend.db.connection import READ_POOL_SIZE, ConnectionPool
+
+T = TypeVar("T")
+
+# Lane sizes (threads == pooled connections per lane); the lookup lane takes
+# the read pool's COMPANYWISE_DB_POOL_SIZE unless given its own size
+LOOKUP_WORKERS = int(os.environ.get("COMPANYWISE_LOOKUP_WORKERS", READ_POOL_SIZE))
+ANALYTICAL_WORKERS = int(os.environ.get("COMPANYWISE_ANALYTICAL_WORKERS", "2"))
+
+EXPORT_PAGE_SIZE = 1000  # Rows per keyset page when streaming exports
+
+
+class QueryLane:
+    """A bounded thread executor paired with its own read-only connection pool."""
+
+    def __init__(self, name: str, workers: int):
+        self.name = name
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"db-{name}")
+        # One connection per worker, so a worker never waits on the pool
+        self._pool = ConnectionPool(size=workers)
+
+    def _call(self, fn: Callable[..., T], args: tuple, kwargs: dict) -> T:
+        with self._pool.connection() as conn:
+            return fn(*args, conn=conn, **kwargs)
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a sync query function (taking a `conn` keyword) on this lane."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(self._call, fn, args, kwargs)
+        )
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+        self._pool.close()
+
+
+_lanes: dict[str, QueryLane] = {}
+_lanes_lock = threading.Lock()
+
+
+def _lane(name: str) -> QueryLane:
+    lane = _lanes.get(name)
+    if lane is None:
+        with _lanes_lock:
+            lane = _lanes.get(name)
+            if lane is None:
+                workers = LOOKUP_WORKERS if name == "lookup" else ANALYTICAL_WORKERS
+                lane = _lanes[name] = QueryLane(name, workers)
+    return lane
+
+
+def shutdown() -> None:
+    """Stop both lanes and close their connections (e.g. on API shutdown)."""
+    with _lanes_lock:
+        for lane in _lanes.values():
+            lane.shutdown()
+        _lanes.clear()
+
+
+# ---------------------------------------------------------------------------
+# Lookup lane
+# ---------------------------------------------------------------------------
+
+
+async def get_company(company_number: str) -> dict | None:
+    return await _lane("lookup").run(queries.get_company, company_number)
+
+
+async def get_company_report(company_number: str) -> dict | None:
+    return await _lane("lookup").run(queries.get_company_report, company_number)
+
+
+async def get_filings_for_company(company_number: str) -> list[dict]:
+    return await _lane("lookup").run(queries.get_filings_for_company, company_number)
+
+
+async def get_latest_filing(company_number: str) -> dict | None:
+    return await _lane("lookup").run(queries.get_latest_filing, company_number)
+
+
+async def get_filing_by_source(source_file: str) -> dict | None:
+    return await _lane("lookup").run(queries.get_filing_by_source, source_file)
+
+
+async def get_filing_summary(filing_id: int) -> dict | None:
+    return await _lane("lookup").run(queries.get_filing_summary, filing_id)
+
+
+async def get_batch(batch_id: int) -> dict | None:
+    return await _lane("lookup").run(queries.get_batch, batch_id)
+
+
+async def get_batch_watermark() -> dict:
+    return await _lane("lookup").run(queries.get_batch_watermark)
+
+
+async def get_all_concepts(limit: int = 100, offset: int = 0) -> list[dict]:
+    return await _lane("lookup").run(queries.get_all_concepts, limit, offset)
+
+
+async def search_concepts(name_pattern: str, limit: int = 50) -> list[dict]:
+    return await _lane("lookup").run(queries.search_concepts, name_pattern, limit)
+
+
+async def search_companies(query: str, limit: int = 100) -> list[dict]:
+    return await _lane("lookup").run(queries.search_companies, query, limit)
+
+
+# ---------------------------------------------------------------------------
+# Analytical lane
+# ---------------------------------------------------------------------------
+
+
+async def get_numeric_facts(filing_id: int, concept: str | None = None) -> list[dict]:
+    return await _lane("analytical").run(queries.get_numeric_facts, filing_id, concept)
+
+
+async def get_text_facts(filing_id: int, concept: str | None = None) -> list[dict]:
+    return await _lane("analytical").run(queries.get_text_facts, filing_id, concept)
+
+
+async def get_contexts(filing_id: int) -> list[dict]:
+    return await _lane("analytical").run(queries.get_contexts, filing_id)
+
+
+async def get_units(filing_id: int) -> list[str]:
+    return await _lane("analytical").run(queries.get_units, filing_id)
+
+
+async def get_filing_with_facts(filing_id: int) -> dict | None:
+    return await _lane("analytical").run(queries.get_filing_with_facts, filing_id)
+
+
+async def get_filing_with_facts_columnar(filing_id: int) -> dict | None:
+    return await _lane("analytical").run(queries.get_filing_with_facts_columnar, filing_id)
+
+
+async def get_facts_by_concept(concept: str, limit: int = 1000) -> list[dict]:
+    return await _lane("analytical").run(queries.get_facts_by_concept, concept, limit)
+
+
+async def iter_facts_by_concept(
+    concept: str,
+    after_id: int = 0,
+    limit: int | None = None,
+    company_number: str | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+) -> AsyncIterator[list[dict]]:
+    """Yield pages of get_facts_by_concept_page until exhausted (or `limit` rows).
+
+    Each page is its own keyset query on the analytical lane, so no connection
+    or cursor is held between pages, other queries interleave with a long
+    export, and the next page is only read once the consumer asks for it.
+    """
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = EXPORT_PAGE_SIZE if remaining is None else min(EXPORT_PAGE_SIZE, remaining)
+        page = await _lane("analytical").run(
+            queries.get_facts_by_concept_page,
+            concept, after_id, size, company_number, date_from, date_to,
+        )
+        if page:
+            yield page
+        if len(page) < size:
+            return
+        after_id = page[-1]["id"]
+        if remaining is not None:
+            remaining -= len(page)
+
+
+async def get_database_stats(exact: bool = False) -> dict[str, Any]:
+    # The default reads db_stats (a few index lookups), so health probes don't
+    # queue behind exports; only the COUNT(*) recount is analytical
+    lane = "analytical" if exact else "lookup"
+    return await _lane(lane).run(queries.get_database_stats, exact)
@@ -6,11 +6,20 @@ SQLite Configuration (from ARCHITECTURE_PROPOSAL.md Section 9.1):
 - Foreign keys enabled for referential integrity
 - 64MB cache for performance
 - NORMAL synchronous for balance of safety/speed
+
+Read-only API traffic goes through ConnectionPool, which keeps a small set of
+pre-configured connections alive instead of opening one per query.
 """
 
+import hashlib
+import os
+import queue
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 # Default database location
 DEFAULT_DB_DIR = Path(__file__).parent.parent.parent / "database"
@@ -19,10 +28,20 @@ DEFAULT_DB_PATH = DEFAULT_DB_DIR / "companies_house.db"
 # Schema file location
 SCHEMA_PATH = Path(__file__).parent / "schema.sql"
 
+# Read-only connection pool settings (see ConnectionPool). READ_POOL_SIZE sizes
+# get_read_pool() (queries.py calls without a conn) and, by default, the API's
+# lookup lane (async_queries.LOOKUP_WORKERS)
+READ_POOL_SIZE = int(os.environ.get("COMPANYWISE_DB_POOL_SIZE", "8"))
+READ_POOL_TIMEOUT = 10.0            # Seconds to wait for a free connection
+READ_POOL_HEALTH_CHECK_AFTER = 30.0  # Re-validate connections idle longer than this
+READ_POOL_CACHED_STATEMENTS = 256   # Prepared statements kept per pooled connection
+
 
 def get_connection(
     db_path: Optional[Path] = None,
-    read_only: bool = False
+    read_only: bool = False,
+    check_same_thread: bool = True,
+    cached_statements: int = 128,
 ) -> sqlite3.Connection:
     """
     Get a configured SQLite connection.
@@ -30,6 +49,9 @@ def get_connection(
     Args:
         db_path: Path to database file. Defaults to database/companies_house.db
         read_only: If True, open in read-only mode (useful for queries)
+        check_same_thread: Passed to sqlite3.connect. Pooled connections disable
+            this because they are handed between threadpool workers (one user at a time).
+        cached_statements: Size of sqlite3's per-connection prepared statement cache
 
     Returns:
         Configured sqlite3.Connection with PRAGMA settings applied
@@ -47,17 +69,25 @@ def get_connection(
     # Build connection URI
     if read_only:
         uri = f"file:{db_path}?mode=ro"
-        conn = sqlite3.connect(uri, uri=True)
+        conn = sqlite3.connect(
+            uri, uri=True,
+            check_same_thread=check_same_thread,
+            cached_statements=cached_statements,
+        )
     else:
-        conn = sqlite3.connect(db_path)
+        conn = sqlite3.connect(
+            db_path,
+            check_same_thread=check_same_thread,
+            cached_statements=cached_statements,
+        )
 
     # Apply PRAGMA settings for optimal performance
-    _configure_connection(conn)
+    _configure_connection(conn, read_only=read_only)
 
     return conn
 
 
-def _configure_connection(conn: sqlite3.Connection) -> None:
+def _configure_connection(conn: sqlite3.Connection, read_only: bool = False) -> None:
     """
     Apply SQLite PRAGMA settings for optimal performance.
 
@@ -66,11 +96,18 @@ def _configure_connection(conn: sqlite3.Connection) -> None:
     - synchronous NORMAL: Good balance of safety and speed
     - cache_size -64000: 64MB cache (negative = KB)
     - foreign_keys ON: Enforce referential integrity
+
+    Read-only connections skip journal_mode/synchronous/foreign_keys: the
+    journal mode is persistent in the file (set by the writer), and switching
+    it is a write attempt on a read-only handle.
     """
-    conn.execute("PRAGMA journal_mode = WAL")
-    conn.execute("PRAGMA synchronous = NORMAL")
+    if read_only:
+        conn.execute("PRAGMA query_only = ON")
+    else:
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA foreign_keys = ON")
     conn.execute("PRAGMA cache_size = -64000")  # 64MB (negative value = KB)
-    conn.execute("PRAGMA foreign_keys = ON")
 
     # Additional performance settings
     conn.execute("PRAGMA temp_store = MEMORY")  # Keep temp tables in memory
@@ -131,7 +168,9 @@ def init_db(db_path: Optional[Path] = None, force: bool = False) -> Path:
     # Create connection and execute schema
     conn = get_connection(db_path)
     try:
+        previous_version = get_schema_version(conn)
         conn.executescript(schema_sql)
+        _apply_migrations(conn, previous_version)
         conn.commit()
     finally:
         conn.close()
@@ -139,6 +178,128 @@ def init_db(db_path: Optional[Path] = None, force: bool = False) -> Path:
     return db_path
 
 
+def rebuild_company_search_index(conn: sqlite3.Connection) -> None:
+    """Rebuild the companies_fts trigram index from the companies table."""
+    conn.execute("INSERT INTO companies_fts(companies_fts) VALUES ('rebuild')")
+
+
+# Tables whose row counts are kept in db_stats (served by /api/health)
+STATS_TABLES = (
+    "companies", "filings", "numeric_facts", "text_facts",
+    "concepts", "dimension_patterns", "context_definitions", "batches",
+)
+
+
+def refresh_db_stats(conn: sqlite3.Connection) -> None:
+    """Recount every STATS_TABLES table into db_stats (full scans; slow on a large DB)."""
+    for table in STATS_TABLES:
+        count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        conn.execute(
+            "INSERT OR REPLACE INTO db_stats (table_name, row_count) VALUES (?, ?)",
+            (table, count)
+        )
+    bump_data_version(conn)
+
+
+def bump_data_version(conn: sqlite3.Connection) -> None:
+    """
+    Mark data changed outside a batch, so API ETags and cached responses move on.
+
+    Call in the same transaction as the write. A no-op on databases without
+    the data_version table (pre-v11, e.g. while migrating to v5).
+    """
+    try:
+        conn.execute("UPDATE data_version SET version = version + 1 WHERE id = 1")
+    except sqlite3.OperationalError:
+        pass
+
+
+# Lookup dedup keys: BLAKE2b digests of this many bytes, stored as BLOBs
+LOOKUP_KEY_BYTES = 16
+
+
+def dimension_pattern_hash(dims_json: str) -> bytes:
+    """Dedup key for dimension_patterns.pattern_hash (canonical dimensions JSON)."""
+    return hashlib.blake2b(dims_json.encode(), digest_size=LOOKUP_KEY_BYTES).digest()
+
+
+def context_definition_hash(
+    period_type: Optional[str],
+    instant_date: Optional[str],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    pattern_hash: Optional[bytes],
+) -> bytes:
+    """
+    Dedup key for context_definitions.definition_hash.
+
+    Built only from the context's own values (ISO dates, and the dimension
+    pattern's pattern_hash rather than its row id), so parser workers can
+    compute it without database access.
+    """
+    def_parts = "|".join([
+        period_type or "",
+        instant_date or "",
+        start_date or "",
+        end_date or "",
+        pattern_hash.hex() if pattern_hash else "",
+    ])
+    return hashlib.blake2b(def_parts.encode(), digest_size=LOOKUP_KEY_BYTES).digest()
+
+
+def rekey_lookup_hashes(conn: sqlite3.Connection) -> None:
+    """
+    Recompute pattern_hash and definition_hash for existing rows.
+
+    v7: 16-byte BLAKE2b BLOB keys replace 64-char SHA-256 hex strings (and
+    covers v6, which made definition_hash ID-free). Also drops
+    idx_context_def_hash, which duplicated the UNIQUE index.
+    """
+    conn.execute("DROP INDEX IF EXISTS idx_context_def_hash")
+    conn.executemany(
+        "UPDATE dimension_patterns SET pattern_hash = ? WHERE id = ?",
+        [
+            (dimension_pattern_hash(dims_json), pattern_id)
+            for pattern_id, dims_json in conn.execute("SELECT id, dimensions FROM dimension_patterns")
+        ]
+    )
+    rows = conn.execute(
+        """
+        SELECT cd.id, cd.period_type, cd.instant_date, cd.start_date, cd.end_date,
+               dp.pattern_hash
+        FROM context_definitions cd
+        LEFT JOIN dimension_patterns dp ON cd.dimension_pattern_id = dp.id
+        """
+    ).fetchall()
+    conn.executemany(
+        "UPDATE context_definitions SET definition_hash = ? WHERE id = ?",
+        [(context_definition_hash(*row[1:]), row[0]) for row in rows]
+    )
+
+
+def _apply_migrations(conn: sqlite3.Connection, previous_version: Optional[int]) -> None:
+    """
+    Backfill data for schema versions added since the database was created.
+
+    schema.sql creates any new tables/indexes (IF NOT EXISTS); this step
+    populates them from existing rows. Fresh databases (no previous version)
+    have nothing to backfill.
+    """
+    if previous_version is None:
+        return
+    for version, migrate in _MIGRATIONS:
+        if previous_version < version:
+            migrate(conn)
+
+
+# (version, backfill function) in ascending version order
+_MIGRATIONS = [
+    (3, rebuild_company_search_index),
+    (5, refresh_db_stats),
+    (7, rekey_lookup_hashes),  # Also covers v6
+]
+
+
 def get_schema_version(conn: sqlite3.Connection) -> Optional[int]:
     """
     Get the current schema version from the database.
@@ -186,6 +347,11 @@ def verify_schema(conn: sqlite3.Connection) -> dict:
         "context_definitions",
         "numeric_facts",
         "text_facts",
+        "companies_fts",
+        "filing_summaries",
+        "db_stats",
+        "source_file_filter",
+        "text_fact_sources",
     }
 
     # Get actual tables
@@ -212,6 +378,163 @@ def verify_schema(conn: sqlite3.Connection) -> dict:
     }
 
 
+class ConnectionPool:
+    """
+    Thread-safe pool of pre-configured read-only connections.
+
+    Connections are opened lazily up to `size` and reused LIFO, so the most
+    recently used (warmest page cache, populated statement cache) connection
+    is handed out first. Each connection keeps sqlite3's prepared statement
+    cache across requests, so repeated queries skip re-preparation.
+
+    A connection idle for longer than `health_check_after` seconds, or one
+    returned after a sqlite3 error, is validated with `SELECT 1` on its next
+    checkout and replaced if the check fails.
+
+    Example:
+        pool = ConnectionPool(size=4)
+        with pool.connection() as conn:
+            conn.execute("SELECT COUNT(*) FROM companies")
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        size: int = READ_POOL_SIZE,
+        timeout: float = READ_POOL_TIMEOUT,
+        health_check_after: float = READ_POOL_HEALTH_CHECK_AFTER,
+        cached_statements: int = READ_POOL_CACHED_STATEMENTS,
+    ):
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}")
+        self.db_path = db_path
+        self.size = size
+        self.timeout = timeout
+        self.health_check_after = health_check_after
+        self.cached_statements = cached_statements
+        # (connection, last_checked) pairs; LIFO keeps hot connections in use
+        self._idle: queue.LifoQueue[tuple[sqlite3.Connection, float]] = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._opened = 0
+        self._closed = False
+
+    def _open(self) -> sqlite3.Connection:
+        return get_connection(
+            self.db_path,
+            read_only=True,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+        )
+
+    def _is_healthy(self, conn: sqlite3.Connection) -> bool:
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        with self._lock:
+            self._opened -= 1
+
+    def acquire(self) -> sqlite3.Connection:
+        """Check out a connection, opening one if the pool is not yet full."""
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+
+        while True:
+            try:
+                conn, last_checked = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    can_open = self._opened < self.size
+                    if can_open:
+                        self._opened += 1
+                if can_open:
+                    try:
+                        return self._open()
+                    except BaseException:
+                        with self._lock:
+                            self._opened -= 1
+                        raise
+                try:
+                    conn, last_checked = self._idle.get(timeout=self.timeout)
+                except queue.Empty:
+                    raise TimeoutError(
+                        f"No database connection available after {self.timeout}s "
+                        f"(pool size {self.size})"
+                    ) from None
+
+            if time.monotonic() - last_checked < self.health_check_after:
+                return conn
+            if self._is_healthy(conn):
+                return conn
+            self._discard(conn)
+
+    def release(self, conn: sqlite3.Connection, healthy: bool = True) -> None:
+        """Return a connection to the pool.
+
+        Pass healthy=False after an error to force a health check on the
+        connection's next checkout.
+        """
+        if self._closed:
+            self._discard(conn)
+            return
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle.put((conn, time.monotonic() if healthy else 0.0))
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Context manager that checks a connection out and returns it afterwards."""
+        conn = self.acquire()
+        healthy = True
+        try:
+            yield conn
+        except sqlite3.Error:
+            healthy = False
+            raise
+        finally:
+            self.release(conn, healthy)
+
+    def close(self) -> None:
+        """Close all idle connections. Checked-out connections close on release."""
+        self._closed = True
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+
+
+_read_pool: Optional[ConnectionPool] = None
+_read_pool_lock = threading.Lock()
+
+
+def get_read_pool() -> ConnectionPool:
+    """Return the process-wide read-only pool for the default database."""
+    global _read_pool
+    if _read_pool is None:
+        with _read_pool_lock:
+            if _read_pool is None:
+                _read_pool = ConnectionPool()
+    return _read_pool
+
+
+def close_read_pool() -> None:
+    """Close the process-wide read-only pool (e.g. on API shutdown)."""
+    global _read_pool
+    with _read_pool_lock:
+        if _read_pool is not None:
+            _read_pool.close()
+            _read_pool = None
+
+
 # Convenience function for context manager usage
 class DatabaseConnection:
     """
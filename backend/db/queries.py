@@ -8,16 +8,41 @@ dimension_patterns) via INTEGER foreign keys. All fact queries use JOINs
 to return human-readable data.
 
 All functions use read-only connections and return dicts/lists for easy serialization.
+Every function takes an optional `conn`; when omitted, a connection is borrowed
+from the process-wide read-only pool (see connection.ConnectionPool) for the
+duration of the call.
 """
 
 from __future__ import annotations
 
-from typing import Any
+import json
+import sqlite3
+from contextlib import contextmanager
+from typing import Any, Iterator
 
-from backend.db.connection import get_connection
+from backend.db.connection import STATS_TABLES, get_read_pool
+from backend.db.text_values import text_values
 
 
-def get_company(company_number: str) -> dict | None:
+def _resolve_text_values(conn: sqlite3.Connection, facts: list[dict]) -> list[dict]:
+    """Replace compressed/deferred text fact values with the text (see text_values)."""
+    values = text_values(conn, [f["id"] for f in facts], [f["value"] for f in facts])
+    for fact, value in zip(facts, values):
+        fact["value"] = value
+    return facts
+
+
+@contextmanager
+def _read_connection(conn: sqlite3.Connection | None) -> Iterator[sqlite3.Connection]:
+    """Use the caller's connection, or borrow one from the read pool."""
+    if conn is not None:
+        yield conn
+        return
+    with get_read_pool().connection() as pooled:
+        yield pooled
+
+
+def get_company(company_number: str, conn: sqlite3.Connection | None = None) -> dict | None:
     """
     Get a company by registration number.
 
@@ -29,19 +54,19 @@ def get_company(company_number: str) -> dict | None:
     """
     company_number = company_number.strip().upper()
 
-    conn = get_connection(read_only=True)
-    try:
+    with _read_connection(conn) as conn:
         cursor = conn.execute(
             "SELECT company_number, name, jurisdiction FROM companies WHERE company_number = ?",
             (company_number,)
         )
         row = cursor.fetchone()
         return dict(row) if row else None
-    finally:
-        conn.close()
 
 
-def get_filings_for_company(company_number: str) -> list[dict]:
+def get_filings_for_company(
+    company_number: str,
+    conn: sqlite3.Connection | None = None,
+) -> list[dict]:
     """
     Get all filings for a company, ordered by balance sheet date descending.
 
@@ -53,8 +78,7 @@ def get_filings_for_company(company_number: str) -> list[dict]:
     """
     company_number = company_number.strip().upper()
 
-    conn = get_connection(read_only=True)
-    try:
+    with _read_connection(conn) as conn:
         cursor = conn.execute(
             """
             SELECT id, company_number, batch_id, source_file, source_type,
@@ -66,11 +90,9 @@ def get_filings_for_company(company_number: str) -> list[dict]:
             (company_number,)
         )
         return [dict(row) for row in cursor.fetchall()]
-    finally:
-        conn.close()
 
 
-def get_latest_filing(company_number: str) -> dict | None:
+def get_latest_filing(company_number: str, conn: sqlite3.Connection | None = None) -> dict | None:
     """
     Get the most recent filing for a company.
 
@@ -82,8 +104,7 @@ def get_latest_filing(company_number: str) -> dict | None:
     """
     company_number = company_number.strip().upper()
 
-    conn = get_connection(read_only=True)
-    try:
+    with _read_connection(conn) as conn:
         cursor = conn.execute(
             """
             SELECT id, company_number, batch_id, source_file, source_type,
@@ -97,11 +118,13 @@ def get_latest_filing(company_number: str) -> dict | None:
         )
         row = cursor.fetchone()
         return dict(row) if row else None
-    finally:
-        conn.close()
 
 
-def get_numeric_facts(filing_id: int, concept: str | None = None) -> list[dict]:
+def get_numeric_facts(
+    filing_id: int,
+    concept: str | None = None,
+    conn: sqlite3.Connection | None = None,
+) -> list[dict]:
     """
     Get numeric facts for a filing, optionally filtered by concept.
 
@@ -112,8 +135,7 @@ def get_numeric_facts(filing_id: int, concept: str | None = None) -> list[dict]:
     Returns:
         List of numeric fact dicts with value, unit, concept info, and period info
     """
-    conn = get_connection(read_only=True)
-    try:
+    with _read_connection(conn) as conn:
         base_query = """
             SELECT
                 nf.id, nf.filing_id, nf.value, nf.unit,
@@ -134,11 +156,13 @@ def get_numeric_facts(filing_id: int, concept: str | None = None) -> list[dict]:
         else:
             cursor = conn.execute(base_query, (filing_id,))
         return [dict(row) for row in cursor.fetchall()]
-    finally:
-        conn.close()
 
 
-def get_text_facts(filing_id: int, concept: str | None = None) -> list[dict]:
+def get_text_facts(
+    filing_id: int,
+    concept: str | None = None,
+    conn: sqlite3.Connection | None = None,
+) -> list[dict]:
     """
     Get text facts for a filing, optionally filtered by concept.
 
@@ -147,10 +171,11 @@ def get_text_facts(filing_id: int, concept: str | None = None) -> list[dict]:
         concept: Optional normalized concept name to filter by
 
     Returns:
-        List of text fact dicts with value, concept info, and period info
+        List of text fact dicts with value, concept info, and period info.
+        Values are always text: those stored compressed or deferred by the
+        loader are decompressed or read back (see backend.db.text_values).
     """
-    conn = get_connection(read_only=True)
-    try:
+    with _read_connection(conn) as conn:
         base_query = """
             SELECT
                 tf.id, tf.filing_id, tf.value,
@@ -170,12 +195,10 @@ def get_text_facts(filing_id: int, concept: str | None = None) -> list[dict]:
             )
         else:
             cursor = conn.execute(base_query, (filing_id,))
-        return [dict(row) for row in cursor.fetchall()]
-    finally:
-        conn.close()
+        return _resolve_text_values(conn, [dict(row) for row in cursor.fetchall()])
 
 
-def get_contexts(filing_id: int) -> list[dict]:
+def get_contexts(filing_id: int, conn: sqlite3.Connection | None = None) -> list[dict]:
     """
     Get all context definitions used by facts in a filing.
 
@@ -185,8 +208,7 @@ def get_contexts(filing_id: int) -> list[dict]:
     Returns:
         List of context dicts with period and dimension info
     """
-    conn = get_connection(read_only=True)
-    try:
+    with _read_connection(conn) as conn:
         cursor = conn.execute(
             """
             SELECT DISTINCT
@@ -203,11 +225,9 @@ def get_contexts(filing_id: int) -> list[dict]:
             (filing_id, filing_id)
         )
         return [dict(row) for row in cursor.fetchall()]
-    finally:
-        conn.close()
 
 
-def get_units(filing_id: int) -> list[str]:
+def get_units(filing_id: int, conn: sqlite3.Connection | None = None) -> list[str]:
     """
     Get all distinct units used in numeric facts for a filing.
 
@@ -217,18 +237,15 @@ def get_units(filing_id: int) -> list[str]:
     Returns:
         List of unit strings (e.g., ["GBP", "shares"])
     """
-    conn = get_connection(read_only=True)
-    try:
+    with _read_connection(conn) as conn:
         cursor = conn.execute(
             "SELECT DISTINCT unit FROM numeric_facts WHERE filing_id = ? AND unit IS NOT NULL",
             (filing_id,)
         )
         return [row["unit"] for row in cursor.fetchall()]
-    finally:
-        conn.close()
 
 
-def get_filing_with_facts(filing_id: int) -> dict | None:
+def get_filing_with_facts(filing_id: int, conn: sqlite3.Connection | None = None) -> dict | None:
     """
     Get a filing with all related data (contexts, units, numeric facts, text facts).
 
@@ -241,8 +258,7 @@ def get_filing_with_facts(filing_id: int) -> dict | None:
         Dict with filing data plus nested lists for contexts, units,
         numeric_facts, and text_facts. Returns None if filing not found.
     """
-    conn = get_connection(read_only=True)
-    try:
+    with _read_connection(conn) as conn:
         # Get filing
         cursor = conn.execute(
             """
@@ -326,14 +342,289 @@ def get_filing_with_facts(filing_id: int) -> dict | None:
             """,
             (filing_id,)
         )
-        result["text_facts"] = [dict(row) for row in cursor.fetchall()]
+        result["text_facts"] = _resolve_text_values(conn, [dict(row) for row in cursor.fetchall()])
 
         return result
-    finally:
-        conn.close()
 
 
-def get_filing_by_source(source_file: str) -> dict | None:
+def get_filing_with_facts_columnar(
+    filing_id: int,
+    conn: sqlite3.Connection | None = None,
+) -> dict | None:
+    """
+    Get the same data as get_filing_with_facts, dictionary-encoded.
+
+    Concepts, contexts and units are sent once as column tables and facts
+    are columns of integer references (0-based positions) into them, so the
+    repeated concept names, period dates and dimension JSON of the row format
+    appear once per filing. Fact rows are read without JOINs; the lookup rows
+    they reference are fetched once each.
+
+    Args:
+        filing_id: Database ID of the filing
+
+    Returns:
+        Dict with filing (filing fields plus company_name), concepts
+        (concept/concept_raw/namespace columns), contexts (id/period_type/
+        instant_date/start_date/end_date/dimensions columns), units (list),
+        numeric_facts (id/concept/context/unit/value columns) and text_facts
+        (id/concept/context/value columns). Returns None if filing not found.
+    """
+    with _read_connection(conn) as conn:
+        cursor = conn.execute(
+            """
+            SELECT f.id, f.company_number, f.batch_id, f.source_file, f.source_type,
+                   f.balance_sheet_date, f.period_start_date, f.period_end_date,
+                   f.loaded_at, f.file_hash, c.name AS company_name
+            FROM filings f
+            LEFT JOIN companies c ON c.company_number = f.company_number
+            WHERE f.id = ?
+            """,
+            (filing_id,)
+        )
+        filing_row = cursor.fetchone()
+        if not filing_row:
+            return None
+
+        concept_refs: dict[int, int] = {}   # concept_id -> position
+        context_refs: dict[int, int] = {}   # context_id -> position
+        unit_refs: dict[str, int] = {}      # unit -> position
+
+        numeric: dict[str, list] = {"id": [], "concept": [], "context": [], "unit": [], "value": []}
+        cursor = conn.execute(
+            "SELECT id, concept_id, context_id, unit, value FROM numeric_facts WHERE filing_id = ?",
+            (filing_id,)
+        )
+        for fact_id, concept_id, context_id, unit, value in cursor:
+            numeric["id"].append(fact_id)
+            numeric["concept"].append(concept_refs.setdefault(concept_id, len(concept_refs)))
+            numeric["context"].append(context_refs.setdefault(context_id, len(context_refs)))
+            numeric["unit"].append(
+                unit_refs.setdefault(unit, len(unit_refs)) if unit is not None else None
+            )
+            numeric["value"].append(value)
+
+        text: dict[str, list] = {"id": [], "concept": [], "context": [], "value": []}
+        cursor = conn.execute(
+            "SELECT id, concept_id, context_id, value FROM text_facts WHERE filing_id = ?",
+            (filing_id,)
+        )
+        for fact_id, concept_id, context_id, value in cursor:
+            text["id"].append(fact_id)
+            text["concept"].append(concept_refs.setdefault(concept_id, len(concept_refs)))
+            text["context"].append(context_refs.setdefault(context_id, len(context_refs)))
+            text["value"].append(value)
+        text["value"] = text_values(conn, text["id"], text["value"])
+
+        # Lookup tables, laid out in reference order
+        concepts: dict[str, list] = {
+            "concept": [None] * len(concept_refs),
+            "concept_raw": [None] * len(concept_refs),
+            "namespace": [None] * len(concept_refs),
+        }
+        cursor = conn.execute(
+            """
+            SELECT id, concept, concept_raw, namespace FROM concepts
+            WHERE id IN (SELECT value FROM json_each(?))
+            """,
+            (json.dumps(list(concept_refs)),)
+        )
+        for concept_id, concept, concept_raw, namespace in cursor:
+            pos = concept_refs[concept_id]
+            concepts["concept"][pos] = concept
+            concepts["concept_raw"][pos] = concept_raw
+            concepts["namespace"][pos] = namespace
+
+        context_columns = ("id", "period_type", "instant_date", "start_date", "end_date", "dimensions")
+        contexts: dict[str, list] = {col: [None] * len(context_refs) for col in context_columns}
+        cursor = conn.execute(
+            """
+            SELECT cd.id, cd.period_type, cd.instant_date, cd.start_date, cd.end_date,
+                   dp.dimensions
+            FROM context_definitions cd
+            LEFT JOIN dimension_patterns dp ON cd.dimension_pattern_id = dp.id
+            WHERE cd.id IN (SELECT value FROM json_each(?))
+            """,
+            (json.dumps(list(context_refs)),)
+        )
+        for row in cursor:
+            pos = context_refs[row[0]]
+            for col, value in zip(context_columns, row):
+                contexts[col][pos] = value
+
+        return {
+            "filing": dict(filing_row),
+            "concepts": concepts,
+            "contexts": contexts,
+            "units": list(unit_refs),
+            "numeric_facts": numeric,
+            "text_facts": text,
+        }
+
+
+def get_filing_summary(filing_id: int, conn: sqlite3.Connection | None = None) -> dict | None:
+    """
+    Get a filing's precomputed financial summary (filing_summaries row).
+
+    Args:
+        filing_id: Database ID of the filing
+
+    Returns:
+        Dict with filing_id, prior period dates, and current/prior values for
+        each headline figure, or None if the filing has no summary (not found,
+        or loaded before summaries existed and not yet backfilled)
+    """
+    with _read_connection(conn) as conn:
+        cursor = conn.execute(
+            "SELECT * FROM filing_summaries WHERE filing_id = ?",
+            (filing_id,)
+        )
+        row = cursor.fetchone()
+        return dict(row) if row else None
+
+
+# Concepts read by the premium report (frontend premium-report/transformer.js)
+REPORT_CONCEPTS = (
+    # Financials: current and prior period
+    "TurnoverRevenue", "GrossProfitLoss", "OperatingProfitLoss", "ProfitLoss",
+    "NetAssetsLiabilities", "Equity", "CurrentAssets", "CreditorsDueWithinOneYear",
+    "CashCashEquivalents", "CashBankOnHand", "DebtorsDueWithinOneYear", "Stocks",
+    "FixedAssets", "NetCurrentAssetsLiabilities", "TotalAssetsLessCurrentLiabilities",
+    "Creditors", "CreditorsAmountsFallingDueAfterOneYear",
+    "AverageNumberEmployeesDuringPeriod",
+    # Company overview
+    "EntityIncorporationDate", "EntityDormantTruefalse", "DescriptionPrincipalActivities",
+    "AddressLine1", "AddressLine2", "PrincipalLocation-CityOrTown", "CountyRegion",
+    "PostalCodeZip",
+)
+
+
+def get_company_report(company_number: str, conn: sqlite3.Connection | None = None) -> dict | None:
+    """
+    Get everything the premium report needs for a company in one call.
+
+    Same data as get_company + get_filings_for_company + get_filing_with_facts
+    for the latest filing, but facts are limited to REPORT_CONCEPTS. The latest
+    filing's facts include its prior-period comparatives, so current and prior
+    values come from a single query over (filing_id, concept_id).
+
+    Args:
+        company_number: Companies House registration number
+
+    Returns:
+        Dict with company, filings, facts (shaped like get_filing_with_facts,
+        with contexts limited to those of the returned facts plus every
+        duration context of the filing, and units to those of the returned
+        facts) and the
+        latest filing's summary (see get_filing_summary); facts and summary
+        are None if the company has no filings. Returns None if company not found.
+    """
+    with _read_connection(conn) as conn:
+        company = get_company(company_number, conn=conn)
+        if not company:
+            return None
+
+        filings = get_filings_for_company(company_number, conn=conn)
+        if not filings:
+            return {"company": company, "filings": filings, "facts": None, "summary": None}
+
+        latest = filings[0]
+        placeholders = ",".join("?" * len(REPORT_CONCEPTS))
+        cursor = conn.execute(
+            f"""
+            WITH wanted AS (
+                SELECT id, concept, concept_raw, namespace
+                FROM concepts
+                WHERE concept IN ({placeholders})
+            )
+            SELECT
+                'numeric' AS kind, nf.id, nf.value, nf.unit,
+                w.concept, w.concept_raw, w.namespace,
+                cd.id AS context_id, cd.period_type, cd.instant_date, cd.start_date, cd.end_date,
+                dp.dimensions
+            FROM wanted w
+            JOIN numeric_facts nf ON nf.filing_id = ? AND nf.concept_id = w.id
+            JOIN context_definitions cd ON nf.context_id = cd.id
+            LEFT JOIN dimension_patterns dp ON cd.dimension_pattern_id = dp.id
+            UNION ALL
+            SELECT
+                'text', tf.id, tf.value, NULL,
+                w.concept, w.concept_raw, w.namespace,
+                cd.id, cd.period_type, cd.instant_date, cd.start_date, cd.end_date,
+                dp.dimensions
+            FROM wanted w
+            JOIN text_facts tf ON tf.filing_id = ? AND tf.concept_id = w.id
+            JOIN context_definitions cd ON tf.context_id = cd.id
+            LEFT JOIN dimension_patterns dp ON cd.dimension_pattern_id = dp.id
+            """,
+            (*REPORT_CONCEPTS, latest["id"], latest["id"])
+        )
+
+        contexts: dict[int, dict] = {}
+        numeric_facts: list[dict] = []
+        text_facts: list[dict] = []
+        for row in cursor:
+            context = {
+                "period_type": row["period_type"],
+                "instant_date": row["instant_date"],
+                "start_date": row["start_date"],
+                "end_date": row["end_date"],
+                "dimensions": row["dimensions"],
+            }
+            contexts.setdefault(row["context_id"], {"id": row["context_id"], **context})
+            fact = {
+                "id": row["id"],
+                "filing_id": latest["id"],
+                "value": row["value"],
+                "concept": row["concept"],
+                "concept_raw": row["concept_raw"],
+                "namespace": row["namespace"],
+                **context,
+            }
+            if row["kind"] == "numeric":
+                fact["unit"] = row["unit"]
+                numeric_facts.append(fact)
+            else:
+                text_facts.append(fact)
+
+        # Every duration context, too: the frontend finds the prior period
+        # among them (derivePriorPeriod), and it may only be used by facts
+        # outside REPORT_CONCEPTS. A filing has a handful.
+        for row in conn.execute(
+            """
+            SELECT cd.id, cd.period_type, cd.instant_date, cd.start_date, cd.end_date,
+                   dp.dimensions
+            FROM context_definitions cd
+            LEFT JOIN dimension_patterns dp ON cd.dimension_pattern_id = dp.id
+            WHERE cd.period_type = 'duration' AND cd.id IN (
+                SELECT context_id FROM numeric_facts WHERE filing_id = ?
+                UNION
+                SELECT context_id FROM text_facts WHERE filing_id = ?
+            )
+            ORDER BY cd.id
+            """,
+            (latest["id"], latest["id"])
+        ):
+            contexts.setdefault(row["id"], dict(row))
+
+        _resolve_text_values(conn, text_facts)
+        facts = {
+            **latest,
+            "company_name": company["name"],
+            "contexts": list(contexts.values()),
+            "units": sorted({f["unit"] for f in numeric_facts if f["unit"] is not None}),
+            "numeric_facts": numeric_facts,
+            "text_facts": text_facts,
+        }
+        return {
+            "company": company,
+            "filings": filings,
+            "facts": facts,
+            "summary": get_filing_summary(latest["id"], conn=conn),
+        }
+
+
+def get_filing_by_source(source_file: str, conn: sqlite3.Connection | None = None) -> dict | None:
     """
     Get a filing by its source filename.
 
@@ -343,8 +634,7 @@ def get_filing_by_source(source_file: str) -> dict | None:
     Returns:
         Filing dict or None if not found
     """
-    conn = get_connection(read_only=True)
-    try:
+    with _read_connection(conn) as conn:
         cursor = conn.execute(
             """
             SELECT id, company_number, batch_id, source_file, source_type,
@@ -356,38 +646,88 @@ def get_filing_by_source(source_file: str) -> dict | None:
         )
         row = cursor.fetchone()
         return dict(row) if row else None
-    finally:
-        conn.close()
 
 
-def search_companies(name_pattern: str, limit: int = 100) -> list[dict]:
+def search_companies(
+    query: str,
+    limit: int = 100,
+    conn: sqlite3.Connection | None = None,
+) -> list[dict]:
     """
-    Search companies by name pattern.
+    Search companies by name, ranked exact > prefix > infix match.
+
+    Each tier is a separate LIMITed query so no tier scans the whole table:
+    exact and prefix matches use the NOCASE index on companies.name, infix
+    matches use the companies_fts trigram index (queries of 3+ characters;
+    trigrams cannot match anything shorter).
 
     Args:
-        name_pattern: SQL LIKE pattern (e.g., "%ACME%")
+        query: Free-text name fragment (e.g., "ACME"), matched case-insensitively
         limit: Maximum results to return
 
     Returns:
-        List of company dicts matching the pattern
+        List of company dicts, best matches first
     """
-    conn = get_connection(read_only=True)
-    try:
-        cursor = conn.execute(
-            """
-            SELECT company_number, name, jurisdiction
-            FROM companies
-            WHERE name LIKE ?
+    query = " ".join(query.split())
+    if not query:
+        return []
+
+    columns = "c.company_number, c.name, c.jurisdiction"
+    like_prefix = _escape_like(query) + "%"
+    fts_phrase = '"' + query.replace('"', '""') + '"'
+
+    tiers = [
+        (
+            f"SELECT {columns} FROM companies c WHERE c.name = ? COLLATE NOCASE LIMIT ?",
+            (query,),
+        ),
+        (
+            f"""
+            SELECT {columns} FROM companies c
+            WHERE c.name LIKE ? ESCAPE '\\'
+            ORDER BY c.name COLLATE NOCASE
             LIMIT ?
             """,
-            (name_pattern, limit)
-        )
-        return [dict(row) for row in cursor.fetchall()]
-    finally:
-        conn.close()
-
-
-def get_facts_by_concept(concept: str, limit: int = 1000) -> list[dict]:
+            (like_prefix,),
+        ),
+    ]
+    if len(query) >= 3:
+        tiers.append((
+            f"""
+            SELECT {columns} FROM companies_fts
+            JOIN companies c ON c.rowid = companies_fts.rowid
+            WHERE companies_fts MATCH ?
+            LIMIT ?
+            """,
+            (fts_phrase,),
+        ))
+
+    results: list[dict] = []
+    seen: set[str] = set()
+    with _read_connection(conn) as conn:
+        for sql, params in tiers:
+            # Over-fetch by the rows already taken, since they repeat across tiers
+            cursor = conn.execute(sql, params + (limit + len(seen),))
+            for row in cursor:
+                if row["company_number"] in seen:
+                    continue
+                seen.add(row["company_number"])
+                results.append(dict(row))
+                if len(results) >= limit:
+                    return results
+    return results
+
+
+def _escape_like(text: str) -> str:
+    """Escape LIKE wildcards so user input matches literally (ESCAPE '\\')."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def get_facts_by_concept(
+    concept: str,
+    limit: int = 1000,
+    conn: sqlite3.Connection | None = None,
+) -> list[dict]:
     """
     Get all numeric facts for a given concept across all filings.
 
@@ -400,8 +740,7 @@ def get_facts_by_concept(concept: str, limit: int = 1000) -> list[dict]:
     Returns:
         List of fact dicts with company/filing context
     """
-    conn = get_connection(read_only=True)
-    try:
+    with _read_connection(conn) as conn:
         cursor = conn.execute(
             """
             SELECT
@@ -421,11 +760,128 @@ def get_facts_by_concept(concept: str, limit: int = 1000) -> list[dict]:
             (concept, limit)
         )
         return [dict(row) for row in cursor.fetchall()]
-    finally:
-        conn.close()
 
 
-def get_batch(batch_id: int) -> dict | None:
+# Columns of get_facts_by_concept / get_facts_by_concept_page rows, in order
+FACT_EXPORT_COLUMNS = (
+    "id", "filing_id", "value", "unit", "concept", "concept_raw",
+    "company_number", "balance_sheet_date", "company_name",
+    "period_type", "instant_date", "start_date", "end_date",
+)
+
+
+def get_facts_by_concept_page(
+    concept: str,
+    after_id: int = 0,
+    limit: int = 1000,
+    company_number: str | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    conn: sqlite3.Connection | None = None,
+) -> list[dict]:
+    """
+    Get one keyset page of numeric facts for a concept, ordered by fact id.
+
+    Same rows as get_facts_by_concept, but resumable: pass the last row's id
+    as `after_id` to get the next page.
+
+    Cost per page:
+    - Unfiltered: each concept_id (one per namespace prefix) is read in id
+      order from idx_numeric_concept, so a page costs O(limit) no matter
+      how deep into the corpus it starts.
+    - company_number: driven from the company's filings (idx_filings_company,
+      then idx_numeric_filing_concept), so a page costs O(the company's facts
+      for the concept), however many other companies report it.
+    - Date filters alone: the id-ordered scan skips facts from filings outside
+      the range, so a page costs O(facts scanned to find `limit` matches),
+      up to every fact of the concept for a narrow range.
+
+    Args:
+        concept: Normalized concept name (e.g., "TurnoverRevenue")
+        after_id: Only return facts with id greater than this
+        limit: Maximum results to return
+        company_number: Only facts from this company's filings
+        date_from: Only filings with balance_sheet_date >= this (ISO)
+        date_to: Only filings with balance_sheet_date <= this (ISO)
+
+    Returns:
+        List of fact dicts with company/filing context, ascending by id
+    """
+    with _read_connection(conn) as conn:
+        concept_ids = [
+            row[0] for row in conn.execute("SELECT id FROM concepts WHERE concept = ?", (concept,))
+        ]
+        if not concept_ids:
+            return []
+
+        filters = ""
+        filter_params: list[Any] = []
+        if date_from:
+            filters += " AND f.balance_sheet_date >= ?"
+            filter_params.append(date_from)
+        if date_to:
+            filters += " AND f.balance_sheet_date <= ?"
+            filter_params.append(date_to)
+
+        if company_number:
+            # CROSS JOIN keeps filings as the outer loop: the company's filings
+            # by idx_filings_company, then their facts for the concept
+            placeholders = ",".join("?" * len(concept_ids))
+            cursor = conn.execute(
+                f"""
+                SELECT
+                    nf.id, nf.filing_id, nf.value, nf.unit,
+                    c.concept, c.concept_raw,
+                    f.company_number, f.balance_sheet_date,
+                    co.name as company_name,
+                    cd.period_type, cd.instant_date, cd.start_date, cd.end_date
+                FROM filings f
+                CROSS JOIN numeric_facts nf
+                JOIN concepts c ON nf.concept_id = c.id
+                LEFT JOIN companies co ON f.company_number = co.company_number
+                JOIN context_definitions cd ON nf.context_id = cd.id
+                WHERE f.company_number = ?{filters}
+                  AND nf.filing_id = f.id
+                  AND nf.concept_id IN ({placeholders})
+                  AND nf.id > ?
+                ORDER BY nf.id
+                LIMIT ?
+                """,
+                (company_number.strip().upper(), *filter_params, *concept_ids, after_id, limit)
+            )
+            return [dict(row) for row in cursor.fetchall()]
+
+        # One id-ordered, LIMITed scan per concept_id, merged by the outer ORDER BY
+        per_concept = f"""
+            SELECT * FROM (
+                SELECT
+                    nf.id, nf.filing_id, nf.value, nf.unit,
+                    c.concept, c.concept_raw,
+                    f.company_number, f.balance_sheet_date,
+                    co.name as company_name,
+                    cd.period_type, cd.instant_date, cd.start_date, cd.end_date
+                FROM numeric_facts nf
+                JOIN concepts c ON nf.concept_id = c.id
+                JOIN filings f ON nf.filing_id = f.id
+                LEFT JOIN companies co ON f.company_number = co.company_number
+                JOIN context_definitions cd ON nf.context_id = cd.id
+                WHERE nf.concept_id = ? AND nf.id > ?{filters}
+                ORDER BY nf.id
+                LIMIT ?
+            )
+        """
+        params: list[Any] = []
+        for concept_id in concept_ids:
+            params += [concept_id, after_id, *filter_params, limit]
+
+        cursor = conn.execute(
+            " UNION ALL ".join([per_concept] * len(concept_ids)) + " ORDER BY id LIMIT ?",
+            (*params, limit)
+        )
+        return [dict(row) for row in cursor.fetchall()]
+
+
+def get_batch(batch_id: int, conn: sqlite3.Connection | None = None) -> dict | None:
     """
     Get a batch by ID.
 
@@ -436,19 +892,49 @@ def get_batch(batch_id: int) -> dict | None:
         Dict with id, filename, source_url, downloaded_at, file_count, processed_at
         or None if not found
     """
-    conn = get_connection(read_only=True)
-    try:
+    with _read_connection(conn) as conn:
         cursor = conn.execute(
             "SELECT id, filename, source_url, downloaded_at, file_count, processed_at FROM batches WHERE id = ?",
             (batch_id,)
         )
         row = cursor.fetchone()
         return dict(row) if row else None
-    finally:
-        conn.close()
 
 
-def get_all_concepts(limit: int = 100, offset: int = 0) -> list[dict]:
+def get_batch_watermark(conn: sqlite3.Connection | None = None) -> dict:
+    """
+    Get the most recent completed batch, i.e. the current data version.
+
+    Data changes when a batch is marked processed, or when a write outside
+    a batch (summary backfill, db_stats refresh) bumps data_version, so
+    together these identify the version of everything the API serves.
+
+    Returns:
+        Dict with batch_id and processed_at of the latest processed batch
+        (both None if no batch has completed) and data_version (None on a
+        database without the table, pre-v11)
+    """
+    with _read_connection(conn) as conn:
+        cursor = conn.execute(
+            "SELECT MAX(id), MAX(processed_at) FROM batches WHERE processed_at IS NOT NULL"
+        )
+        row = cursor.fetchone()
+        try:
+            version = conn.execute("SELECT version FROM data_version WHERE id = 1").fetchone()
+        except sqlite3.OperationalError:
+            version = None
+        return {
+            "batch_id": row[0],
+            "processed_at": row[1],
+            "data_version": version[0] if version else None,
+        }
+
+
+def get_all_concepts(
+    limit: int = 100,
+    offset: int = 0,
+    conn: sqlite3.Connection | None = None,
+) -> list[dict]:
     """
     Get concepts with pagination, ordered alphabetically.
 
@@ -459,18 +945,19 @@ def get_all_concepts(limit: int = 100, offset: int = 0) -> list[dict]:
     Returns:
         List of concept dicts with id, concept_raw, concept, namespace
     """
-    conn = get_connection(read_only=True)
-    try:
+    with _read_connection(conn) as conn:
         cursor = conn.execute(
             "SELECT id, concept_raw, concept, namespace FROM concepts ORDER BY concept LIMIT ? OFFSET ?",
             (limit, offset)
         )
         return [dict(row) for row in cursor.fetchall()]
-    finally:
-        conn.close()
 
 
-def search_concepts(name_pattern: str, limit: int = 50) -> list[dict]:
+def search_concepts(
+    name_pattern: str,
+    limit: int = 50,
+    conn: sqlite3.Connection | None = None,
+) -> list[dict]:
     """
     Search concepts by name pattern.
 
@@ -481,34 +968,53 @@ def search_concepts(name_pattern: str, limit: int = 50) -> list[dict]:
     Returns:
         List of concept dicts matching the pattern
     """
-    conn = get_connection(read_only=True)
-    try:
+    with _read_connection(conn) as conn:
         cursor = conn.execute(
             "SELECT id, concept_raw, concept, namespace FROM concepts WHERE concept LIKE ? ORDER BY concept LIMIT ?",
             (name_pattern, limit)
         )
         return [dict(row) for row in cursor.fetchall()]
-    finally:
-        conn.close()
 
 
-def get_database_stats() -> dict[str, Any]:
+def get_database_stats(
+    exact: bool = False,
+    conn: sqlite3.Connection | None = None,
+) -> dict[str, Any]:
     """
     Get statistics about the database contents.
 
+    Row counts come from the db_stats table maintained by the bulk loader, so
+    this is a handful of index lookups regardless of database size. On a
+    database that predates db_stats (the API never migrates) every table is
+    counted as with exact=True.
+
+    Args:
+        exact: Recount every table with COUNT(*) instead (full scans; slow
+            on a large database)
+
     Returns:
         Dict with counts for companies, filings, facts, lookup tables, etc.
     """
-    conn = get_connection(read_only=True)
-    try:
+    with _read_connection(conn) as conn:
         stats = {}
 
-        for table in ["companies", "filings", "numeric_facts", "text_facts",
-                      "concepts", "dimension_patterns", "context_definitions", "batches"]:
-            cursor = conn.execute(f"SELECT COUNT(*) FROM {table}")
-            stats[f"{table}_count"] = cursor.fetchone()[0]
-
-        # Date range
+        maintained = {}
+        if not exact:
+            try:
+                cursor = conn.execute("SELECT table_name, row_count FROM db_stats")
+                maintained = {row["table_name"]: row["row_count"] for row in cursor}
+            except sqlite3.OperationalError:
+                # No db_stats table yet: fall back to COUNT(*)
+                pass
+
+        for table in STATS_TABLES:
+            if table in maintained:
+                stats[f"{table}_count"] = maintained[table]
+            else:
+                cursor = conn.execute(f"SELECT COUNT(*) FROM {table}")
+                stats[f"{table}_count"] = cursor.fetchone()[0]
+
+        # Date range (MIN/MAX are idx_filings_date lookups)
         cursor = conn.execute(
             "SELECT MIN(balance_sheet_date), MAX(balance_sheet_date) FROM filings"
         )
@@ -517,8 +1023,6 @@ def get_database_stats() -> dict[str, Any]:
         stats["latest_filing"] = row[1]
 
         return stats
-    finally:
-        conn.close()
 
 
 if __name__ == "__main__":
@@ -55,7 +55,7 @@ CREATE TABLE IF NOT EXISTS filings (
     period_start_date TEXT,
     period_end_date TEXT,
     loaded_at TEXT NOT NULL,
-    file_hash TEXT
+    file_hash TEXT  -- bulk_loader.content_hash(): hex BLAKE2b-128 of the source document
 );
 
 -- ============================================================================
@@ -80,7 +80,7 @@ CREATE TABLE IF NOT EXISTS concepts (
 CREATE TABLE IF NOT EXISTS dimension_patterns (
     id INTEGER PRIMARY KEY,
     dimensions TEXT NOT NULL UNIQUE,
-    pattern_hash TEXT NOT NULL UNIQUE
+    pattern_hash BLOB NOT NULL UNIQUE  -- connection.dimension_pattern_hash()
 );
 
 -- ============================================================================
@@ -96,7 +96,7 @@ CREATE TABLE IF NOT EXISTS context_definitions (
     start_date TEXT,
     end_date TEXT,
     dimension_pattern_id INTEGER REFERENCES dimension_patterns(id),
-    definition_hash TEXT NOT NULL UNIQUE
+    definition_hash BLOB NOT NULL UNIQUE  -- connection.context_definition_hash()
 );
 
 -- ============================================================================
@@ -119,6 +119,8 @@ CREATE TABLE IF NOT EXISTS numeric_facts (
 -- ============================================================================
 -- Dropped: concept_raw, concept (moved to concepts lookup), context_ref (resolved),
 --          format, escape
+-- value is TEXT, or a zlib BLOB / NULL for large escaped facts loaded under the
+-- compressed / deferred text-fact policies (see backend/db/text_values.py)
 
 CREATE TABLE IF NOT EXISTS text_facts (
     id INTEGER PRIMARY KEY,
@@ -136,12 +138,13 @@ CREATE TABLE IF NOT EXISTS text_facts (
 CREATE INDEX IF NOT EXISTS idx_filings_company ON filings(company_number);
 CREATE INDEX IF NOT EXISTS idx_filings_date ON filings(balance_sheet_date);
 CREATE INDEX IF NOT EXISTS idx_filings_batch ON filings(batch_id);
+-- Kept during bulk loads: workers look up file_hash for every document
+CREATE INDEX IF NOT EXISTS idx_filings_file_hash ON filings(file_hash);
 
 -- Concept lookup
 CREATE INDEX IF NOT EXISTS idx_concepts_name ON concepts(concept);
 
--- Context definition lookup
-CREATE INDEX IF NOT EXISTS idx_context_def_hash ON context_definitions(definition_hash);
+-- Context definition lookup (definition_hash: UNIQUE constraint index)
 CREATE INDEX IF NOT EXISTS idx_context_def_period ON context_definitions(period_type, instant_date);
 
 -- Numeric facts indexes
@@ -154,10 +157,141 @@ CREATE INDEX IF NOT EXISTS idx_numeric_context ON numeric_facts(context_id);
 CREATE INDEX IF NOT EXISTS idx_text_filing ON text_facts(filing_id);
 CREATE INDEX IF NOT EXISTS idx_text_concept ON text_facts(concept_id);
 
+-- Company name search: exact and prefix matches (case-insensitive range scans)
+CREATE INDEX IF NOT EXISTS idx_companies_name ON companies(name COLLATE NOCASE);
+
+-- ============================================================================
+-- Company Name Search Index (v3)
+-- ============================================================================
+-- Trigram FTS5 shadow index over companies.name for infix (substring) search,
+-- which no B-tree index can serve. External content: names are read from
+-- companies by rowid, so only the trigram index itself is stored.
+-- Kept in sync by bulk_loader.upsert_company(). VACUUM may renumber the
+-- implicit rowids of companies; run rebuild_company_search_index() after one.
+
+CREATE VIRTUAL TABLE IF NOT EXISTS companies_fts USING fts5(
+    name,
+    content='companies',
+    tokenize='trigram'
+);
+
+-- ============================================================================
+-- Filing Summaries (v4)
+-- ============================================================================
+-- One row per filing: headline figures for the current period and the prior-
+-- period comparatives, precomputed by the loader (backend/loader/summaries.py)
+-- so the report and modal read one row instead of scanning the filing's facts.
+-- Backfill existing filings with: python -m backend.loader.summaries
+
+CREATE TABLE IF NOT EXISTS filing_summaries (
+    filing_id INTEGER PRIMARY KEY REFERENCES filings(id),
+    prior_period_start_date TEXT,
+    prior_period_end_date TEXT,
+    turnover REAL,
+    turnover_prior REAL,
+    gross_profit REAL,
+    gross_profit_prior REAL,
+    operating_profit REAL,
+    operating_profit_prior REAL,
+    profit_loss REAL,
+    profit_loss_prior REAL,
+    employees REAL,
+    employees_prior REAL,
+    net_assets REAL,
+    net_assets_prior REAL,
+    equity REAL,
+    equity_prior REAL,
+    current_assets REAL,
+    current_assets_prior REAL,
+    current_liabilities REAL,
+    current_liabilities_prior REAL,
+    cash REAL,
+    cash_prior REAL,
+    debtors REAL,
+    debtors_prior REAL,
+    stocks REAL,
+    stocks_prior REAL,
+    fixed_assets REAL,
+    fixed_assets_prior REAL,
+    net_current_assets REAL,
+    net_current_assets_prior REAL,
+    total_assets_less_current_liabilities REAL,
+    total_assets_less_current_liabilities_prior REAL,
+    creditors REAL,
+    creditors_prior REAL,
+    creditors_after_one_year REAL,
+    creditors_after_one_year_prior REAL
+);
+
+-- ============================================================================
+-- Row Count Statistics (v5)
+-- ============================================================================
+-- Maintained row counts for /api/health, so health checks never COUNT(*) the
+-- fact tables. The bulk loader adds each chunk's inserts in the same
+-- transaction as the rows; cleanup_incomplete_batch() subtracts its deletes.
+-- connection.refresh_db_stats() recounts from scratch.
+
+CREATE TABLE IF NOT EXISTS db_stats (
+    table_name TEXT PRIMARY KEY,
+    row_count INTEGER NOT NULL
+);
+
+INSERT OR IGNORE INTO db_stats (table_name, row_count) VALUES
+    ('companies', 0), ('filings', 0), ('numeric_facts', 0), ('text_facts', 0),
+    ('concepts', 0), ('dimension_patterns', 0), ('context_definitions', 0), ('batches', 0);
+
+-- ============================================================================
+-- Loader Duplicate Detection (v8)
+-- ============================================================================
+-- Bloom filter over filings.source_file (backend.loader.source_index), covering
+-- filings up to `watermark` (filings.id). Single row; rebuilt if missing.
+
+CREATE TABLE IF NOT EXISTS source_file_filter (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    capacity INTEGER NOT NULL,
+    num_bits INTEGER NOT NULL,
+    num_hashes INTEGER NOT NULL,
+    bits BLOB NOT NULL,
+    item_count INTEGER NOT NULL,
+    watermark INTEGER NOT NULL
+);
+
+-- ============================================================================
+-- Deferred Text Facts (v10)
+-- ============================================================================
+-- Loads under the "deferred" text-fact policy (backend/db/text_values.py)
+-- store large escaped text facts with value NULL and this row instead: the
+-- byte range of the fact's content in its source document, which is read
+-- back from the batch ZIP (batches.filename, filings.source_file).
+
+CREATE TABLE IF NOT EXISTS text_fact_sources (
+    text_fact_id INTEGER PRIMARY KEY REFERENCES text_facts(id),
+    source_offset INTEGER NOT NULL,
+    source_length INTEGER NOT NULL
+);
+
+-- ============================================================================
+-- Data Version (v11)
+-- ============================================================================
+-- The API keys its response ETags on the latest processed batch. Writes made
+-- outside a batch (summary backfill, db_stats refresh) don't move that, so
+-- they bump this counter instead (connection.bump_data_version), which the
+-- watermark includes (queries.get_batch_watermark).
+
+CREATE TABLE IF NOT EXISTS data_version (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL
+);
+
+INSERT OR IGNORE INTO data_version (id, version) VALUES (1, 0);
+
 -- ============================================================================
 -- Convenience Views
 -- ============================================================================
--- Human-readable views that JOIN through lookup tables
+-- Human-readable views that JOIN through lookup tables.
+-- text_facts_v.value is the stored form: under the compressed / deferred
+-- text-fact policies a large escaped value is a zlib BLOB or NULL, which
+-- SQL cannot expand - resolve it with backend/db/text_values.text_values().
 
 CREATE VIEW IF NOT EXISTS numeric_facts_v AS
 SELECT
@@ -187,3 +321,30 @@ LEFT JOIN dimension_patterns dp ON cd.dimension_pattern_id = dp.id;
 
 INSERT OR IGNORE INTO schema_version (version, applied_at)
 VALUES (2, datetime('now'));
+
+INSERT OR IGNORE INTO schema_version (version, applied_at)
+VALUES (3, datetime('now'));
+
+INSERT OR IGNORE INTO schema_version (version, applied_at)
+VALUES (4, datetime('now'));
+
+INSERT OR IGNORE INTO schema_version (version, applied_at)
+VALUES (5, datetime('now'));
+
+INSERT OR IGNORE INTO schema_version (version, applied_at)
+VALUES (6, datetime('now'));
+
+INSERT OR IGNORE INTO schema_version (version, applied_at)
+VALUES (7, datetime('now'));
+
+INSERT OR IGNORE INTO schema_version (version, applied_at)
+VALUES (8, datetime('now'));
+
+INSERT OR IGNORE INTO schema_version (version, applied_at)
+VALUES (9, datetime('now'));
+
+INSERT OR IGNORE INTO schema_version (version, applied_at)
+VALUES (10, datetime('now'));
+
+INSERT OR IGNORE INTO schema_version (version, applied_at)
+VALUES (11, datetime('now'));
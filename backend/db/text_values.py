@@ -0,0 +1,233 @@
+"""
+Storage of text_facts.value under the loader's text-fact policy.
+
+Escaped (escape="true") text facts carry HTML - notes to the accounts,
+policies, directors' reports - and are most of the bytes in text_facts.
+The bulk loader stores those of TEXT_FACT_MIN_LENGTH characters or more
+in one of three ways (COMPANYWISE_TEXT_FACTS, or load_batch's
+text_facts_policy):
+
+- full:       the value as TEXT (the default; every other fact always)
+- compressed: a zlib-compressed BLOB of the UTF-8 value
+- deferred:   value NULL, plus a text_fact_sources row giving the byte range
+              of the element's content within the source document, which is
+              read back from the batch ZIP on demand
+
+queries.py resolves both transparently: BLOBs are decompressed and deferred
+values are read from the ZIPs found under SOURCE_DATA_DIRS. A deferred value
+is the markup as it appears in the source document, so it can differ in
+serialisation (namespace declarations, entity escaping) from the value a
+full load stores; if the batch ZIP is not found, the value stays None and a
+warning is logged (once per ZIP). The most recently read source documents
+are kept in memory (DEFERRED_CACHE_BYTES), so a hot filing's deferred
+values don't re-read the ZIP (and inner CIC ZIP) on every request.
+
+Raw reads of text_facts.value, including the text_facts_v view, see the
+stored form: a BLOB or NULL under the compressed / deferred policies. Pass
+them through text_values() to get the text.
+
+Databases not yet migrated to v10 (the API never runs init_db) have no
+text_fact_sources table, and nothing in them is deferred; NULL values are
+then returned as they are.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import zipfile
+import zlib
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+TEXT_FACT_POLICIES = ("full", "compressed", "deferred")
+TEXT_FACT_POLICY = os.environ.get("COMPANYWISE_TEXT_FACTS", "full")
+TEXT_FACT_MIN_LENGTH = 1024  # Shorter escaped values (characters) are always stored in full
+TEXT_COMPRESSION_LEVEL = 6
+DEFERRED_CACHE_BYTES = int(os.environ.get("COMPANYWISE_DEFERRED_CACHE_MB", "64")) * 1024 * 1024
+
+# Where deferred values are read from: directories holding the batch ZIPs
+_PROJECT_ROOT = Path(__file__).parent.parent.parent
+SOURCE_DATA_DIRS = [
+    Path(d) for d in os.environ.get(
+        "COMPANYWISE_SOURCE_DIRS",
+        os.pathsep.join([
+            str(_PROJECT_ROOT / "scripts" / "data" / "daily"),
+            str(_PROJECT_ROOT / "scripts" / "data" / "monthly"),
+        ]),
+    ).split(os.pathsep) if d
+]
+
+_XML_ENCODING_RE = re.compile(rb'^\s*<\?xml[^>]*encoding=["\']([A-Za-z0-9._-]+)')
+
+# Set once text_fact_sources has been seen; re-checked while it hasn't, as a
+# loader may migrate the database under a running API
+_sources_table_exists = False
+
+# Batch ZIPs already warned about as unreadable (warned once per process)
+_unreadable_zips: set[str] = set()
+
+# (zip path, source_file) -> (document bytes, encoding), least recently used
+# first; shared by the API's query-lane threads
+_documents: OrderedDict[tuple[str, str], tuple[bytes, str]] = OrderedDict()
+_documents_size = 0
+_documents_lock = threading.Lock()
+
+
+def compress_text(value: str) -> bytes:
+    """text_facts.value BLOB for a compressed-policy value."""
+    return zlib.compress(value.encode("utf-8"), TEXT_COMPRESSION_LEVEL)
+
+
+def decompress_text(blob: bytes) -> str:
+    """The value stored by compress_text()."""
+    return zlib.decompress(blob).decode("utf-8")
+
+
+def _document_encoding(content: bytes) -> str:
+    """Encoding from the XML declaration, if it names one Python knows."""
+    match = _XML_ENCODING_RE.match(content)
+    if match:
+        try:
+            return codecs.lookup(match.group(1).decode("ascii")).name
+        except LookupError:
+            pass
+    return "utf-8"
+
+
+def _find_batch_zip(filename: str) -> Path | None:
+    for data_dir in SOURCE_DATA_DIRS:
+        path = data_dir / filename
+        if path.exists():
+            return path
+    return None
+
+
+def _read_source_document(zf: zipfile.ZipFile, source_file: str) -> bytes:
+    """A filing's document bytes; CIC inner files are 'outer.zip!inner'."""
+    outer, _, inner = source_file.partition("!")
+    content = zf.read(outer)
+    if inner:
+        with zipfile.ZipFile(BytesIO(content)) as inner_zip:
+            content = inner_zip.read(inner)
+    return content
+
+
+def _cached_document(zip_path: Path, source_file: str) -> tuple[bytes, str]:
+    """A source document and its encoding, from the LRU or the batch ZIP."""
+    global _documents_size
+    key = (str(zip_path), source_file)
+    with _documents_lock:
+        cached = _documents.get(key)
+        if cached is not None:
+            _documents.move_to_end(key)
+            return cached
+
+    # Read outside the lock; two threads missing on one document both read it
+    with zipfile.ZipFile(zip_path) as zf:
+        content = _read_source_document(zf, source_file)
+    document = (content, _document_encoding(content))
+    if len(content) > DEFERRED_CACHE_BYTES:
+        return document
+
+    with _documents_lock:
+        if key not in _documents:
+            _documents[key] = document
+            _documents_size += len(content)
+            while _documents_size > DEFERRED_CACHE_BYTES:
+                _, (evicted, _) = _documents.popitem(last=False)
+                _documents_size -= len(evicted)
+    return document
+
+
+def _has_sources_table(conn: sqlite3.Connection) -> bool:
+    global _sources_table_exists
+    if not _sources_table_exists:
+        _sources_table_exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'text_fact_sources'"
+        ).fetchone() is not None
+    return _sources_table_exists
+
+
+def _warn_unreadable(filename: str, fact_count: int, reason: str) -> None:
+    if filename not in _unreadable_zips:
+        _unreadable_zips.add(filename)
+        logger.warning(
+            f"Deferred text facts not resolved: {reason} "
+            f"({fact_count} facts; searched {', '.join(map(str, SOURCE_DATA_DIRS))})"
+        )
+
+
+def read_deferred_text(conn: sqlite3.Connection, fact_ids: list[int]) -> dict[int, str]:
+    """
+    Values of deferred text facts, read from their source documents.
+
+    Args:
+        fact_ids: text_facts ids; those without a text_fact_sources row are ignored
+
+    Returns:
+        Dict of text fact id -> value, for facts whose batch ZIP was found
+    """
+    if not _has_sources_table(conn):
+        return {}
+    cursor = conn.execute(
+        """
+        SELECT s.text_fact_id, s.source_offset, s.source_length, f.source_file, b.filename
+        FROM text_fact_sources s
+        JOIN text_facts tf ON tf.id = s.text_fact_id
+        JOIN filings f ON f.id = tf.filing_id
+        JOIN batches b ON b.id = f.batch_id
+        WHERE s.text_fact_id IN (SELECT value FROM json_each(?))
+        """,
+        (json.dumps(fact_ids),)
+    )
+    # Group by document, so each is read once
+    documents: dict[tuple[str, str], list[tuple[int, int, int]]] = {}
+    for fact_id, offset, length, source_file, filename in cursor:
+        documents.setdefault((filename, source_file), []).append((fact_id, offset, length))
+
+    values: dict[int, str] = {}
+    for (filename, source_file), ranges in documents.items():
+        zip_path = _find_batch_zip(filename)
+        if zip_path is None:
+            _warn_unreadable(filename, len(ranges), f"batch ZIP {filename} not found")
+            continue
+        try:
+            content, encoding = _cached_document(zip_path, source_file)
+        except (KeyError, OSError, zipfile.BadZipFile) as e:
+            _warn_unreadable(filename, len(ranges), f"cannot read {source_file} from {zip_path}: {e}")
+            continue
+        for fact_id, offset, length in ranges:
+            values[fact_id] = content[offset:offset + length].decode(encoding, errors="replace")
+    return values
+
+
+def text_values(
+    conn: sqlite3.Connection,
+    ids: list[int],
+    values: list[str | bytes | None],
+) -> list[str | None]:
+    """
+    Stored text_facts values (parallel to ids) as strings, whatever the policy.
+
+    BLOBs are decompressed; NULLs are looked up in text_fact_sources (one
+    query, only if there are any) and read from the source documents.
+    """
+    values = [decompress_text(v) if isinstance(v, bytes) else v for v in values]
+    missing = [fact_id for fact_id, value in zip(ids, values) if value is None]
+    if missing:
+        deferred = read_deferred_text(conn, missing)
+        if deferred:
+            values = [
+                deferred.get(fact_id) if value is None else value
+                for fact_id, value in zip(ids, values)
+            ]
+    return values
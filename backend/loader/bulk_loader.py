@@ -15,7 +15,10 @@ v2 changes from v1:
 Performance optimizations:
 - Batch commits (every N files instead of per-file)
 - executemany() for bulk inserts
-- Multiprocessing for parallel parsing
+- Parser workers read ZIP entries themselves and return flat FilingRows
+  (no file bytes or parser dataclasses pickled across processes)
+- Parsing overlaps inserting (bounded in-flight work); the ParserPool is
+  reused across batches (warmed up once, workers recycled periodically)
 - Optimized PRAGMA settings during bulk load
 - Resolution cache pre-loaded at batch start, accumulates during batch
 
@@ -25,23 +28,42 @@ Usage:
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import logging
 import re
 import sqlite3
+import time
 import zipfile
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 from io import BytesIO
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
-
-from backend.db.connection import get_connection, init_db
+from typing import Any, Callable, Iterable, Iterator, NamedTuple
+
+from backend.db.connection import (
+    STATS_TABLES,
+    context_definition_hash,
+    dimension_pattern_hash,
+    get_connection,
+    init_db,
+)
+from backend.db.text_values import (
+    TEXT_FACT_MIN_LENGTH,
+    TEXT_FACT_POLICIES,
+    TEXT_FACT_POLICY,
+    compress_text,
+)
 # Use fast lxml-based parser (14x faster than BeautifulSoup)
-from backend.parser.ixbrl_fast import ParsedIXBRL, parse_ixbrl_fast as parse_ixbrl
-from backend.parser.ixbrl import normalize_concept
+from backend.parser.ixbrl_fast import ParsedIXBRL, parse_ixbrl_fast as parse_ixbrl, text_fact_ranges
+from backend.parser.concepts import intern_concept
+from backend.parser.xbrl import parse_xbrl
+from backend.loader.source_index import SourceFileIndex
+from backend.loader.summaries import insert_summary, summarise_parsed
 
 # Configure logging
 logging.basicConfig(
@@ -53,10 +75,16 @@ logger = logging.getLogger(__name__)
 # Performance tuning constants
 COMMIT_BATCH_SIZE = 500  # Commit every N files
 PARALLEL_WORKERS = 4     # Number of parallel parsing workers (match core count)
-CHUNK_SIZE = 1000        # Process ZIP entries in chunks to limit peak memory
+CHUNK_SIZE = 1000        # Commit (and log progress) every N ZIP entries
+IN_FLIGHT_PER_WORKER = 4 # Files submitted to the parser pool at once, per worker
+WORKER_MAX_TASKS = 2000  # Recycle parser workers after ~N files each (bounds leaks/fragmentation)
+DATE_CACHE_SIZE = 8192   # Distinct date strings memoised by normalize_date_to_iso, per process
+INDEX_BUILD_CACHE_MB = 1024  # Page cache while recreate_indexes() runs
+INDEX_BUILD_THREADS = 4      # PRAGMA threads: sorter helper threads per CREATE INDEX
 
 _ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 _HTML_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
 # Zero-width / invisible Unicode chars that leak from HTML/iXBRL text extraction
 # and silently break strptime. Does NOT include \xa0 (non-breaking space) since
 # that is a space-like separator handled by the \s+ whitespace normalizer.
@@ -64,6 +92,15 @@ _INVISIBLE_CHARS_RE = re.compile(
     r"[\u200b\u200c\u200d\u200e\u200f\ufeff\u2060]"
 )
 
+# strptime fallback, in the order tried
+_DATE_FORMATS = ("%d %B %Y", "%d %m %Y", "%d.%m.%y", "%d.%m.%Y", "%d/%m/%Y", "%d-%m-%Y", "%B %d, %Y")
+_MONTH_NUMBERS = {
+    name: number for number, name in enumerate(
+        ("january", "february", "march", "april", "may", "june", "july",
+         "august", "september", "october", "november", "december"), 1
+    )
+}
+
 
 def normalize_date_to_iso(date_str: str | None) -> str | None:
     """Normalize a date string to ISO format (YYYY-MM-DD).
@@ -80,9 +117,18 @@ def normalize_date_to_iso(date_str: str | None) -> str | None:
     Also strips HTML tags from iXBRL escape-attribute content and removes
     invisible Unicode characters (zero-width spaces, LTR/RTL marks, etc.)
     that leak from HTML text extraction and silently break strptime.
+
+    Called for every filing and context date, so results are memoised (the
+    same few thousand strings recur across millions of contexts) and
+    unparseable dates are only logged the first time they're seen.
     """
     if not date_str:
         return None
+    return _normalize_date(date_str)
+
+
+@functools.lru_cache(maxsize=DATE_CACHE_SIZE)
+def _normalize_date(date_str: str) -> str | None:
     date_str = date_str.strip()
     if not date_str:
         return None
@@ -98,20 +144,79 @@ def normalize_date_to_iso(date_str: str | None) -> str | None:
     # collapse runs of whitespace to a single ASCII space
     date_str = date_str.replace("\u00ad", "-")
     date_str = _INVISIBLE_CHARS_RE.sub("", date_str)
-    date_str = re.sub(r"\s+", " ", date_str).strip()
+    date_str = _WHITESPACE_RE.sub(" ", date_str).strip()
 
     if not date_str:
         return None
     if _ISO_DATE_RE.match(date_str):
         return date_str
 
-    for fmt in ("%d %B %Y", "%d %m %Y", "%d.%m.%y", "%d.%m.%Y", "%d/%m/%Y", "%d-%m-%Y", "%B %d, %Y"):
+    iso = _tokenize_date(date_str) or _strptime_date(date_str)
+    if iso is None:
+        logger.warning(f"Could not parse date: '{date_str}'")
+        return date_str
+    return iso
+
+
+def _tokenize_date(date_str: str) -> str | None:
+    """Split a cleaned date on its separator and match the documented formats.
+
+    Accepts exactly what _DATE_FORMATS would, and gives the same result;
+    returns None for anything else (including invalid dates) so the caller
+    falls back to strptime.
+    """
+    for sep in " ./-":
+        if sep in date_str:
+            break
+    else:
+        return None
+    parts = date_str.split(sep)
+    if len(parts) != 3:
+        return None
+    day, month, year = parts
+
+    if sep == " ":
+        if month.isalpha():                          # 28 February 2023
+            month_number = _MONTH_NUMBERS.get(month.lower())
+        elif day.isalpha() and month.endswith(","):  # February 28, 2023
+            month_number = _MONTH_NUMBERS.get(day.lower())
+            day = month[:-1]
+        else:                                        # 28 02 2023
+            month_number = _date_number(month)
+    else:
+        month_number = _date_number(month)
+
+    day_number = _date_number(day)
+    if month_number is None or day_number is None or not (year.isascii() and year.isdigit()):
+        return None
+    if len(year) == 2 and sep == ".":
+        # strptime %y: 69-99 -> 19xx, 00-68 -> 20xx
+        year_number = int(year) + (1900 if int(year) >= 69 else 2000)
+    elif len(year) == 4 and year >= "1000":
+        year_number = int(year)
+    else:
+        return None
+
+    try:
+        return date(year_number, month_number, day_number).isoformat()
+    except ValueError:
+        return None
+
+
+def _date_number(token: str) -> int | None:
+    """A one- or two-digit day/month field (strptime %d / %m)."""
+    if 1 <= len(token) <= 2 and token.isascii() and token.isdigit():
+        return int(token)
+    return None
+
+
+def _strptime_date(date_str: str) -> str | None:
+    for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt).strftime("%Y-%m-%d")
         except ValueError:
             continue
-    logger.warning(f"Could not parse date: '{date_str}'")
-    return date_str
+    return None
 
 
 @dataclass
@@ -134,13 +239,41 @@ class FileResult:
     error: str | None = None
 
 
+class FilingRows(NamedTuple):
+    """
+    A parsed filing flattened to plain rows, ready for bulk_insert_filing.
+
+    Built in the parser worker (to_filing_rows) so that the result crossing
+    the process boundary is tuples of str/float rather than thousands of
+    parser dataclasses, and so date normalisation, dimension JSON, unit
+    resolution, the context dedup hashes and the summary are computed in
+    parallel. The main process only maps keys to lookup IDs.
+    """
+    company_number: str | None
+    company_name: str | None
+    balance_sheet_date: str               # ISO, or "unknown"
+    period_start_date: str | None
+    period_end_date: str | None
+    # (context_ref, period_type, instant_date, start_date, end_date,
+    #  dimensions_json, pattern_hash, definition_hash)
+    contexts: list[tuple]
+    numeric_facts: list[tuple]            # (concept_raw, context_ref, unit, value)
+    text_facts: list[tuple]               # (concept_raw, context_ref, value); see to_filing_rows
+    summary: dict[str, Any]               # filing_summaries values
+    warnings: list[str]                   # Dropped-fact messages, logged by the writer
+    file_hash: str | None = None          # content_hash() of the source document
+    # Deferred text facts: index into text_facts -> (offset, length) in the document
+    text_sources: dict[int, tuple[int, int]] | None = None
+
+
 @dataclass
 class ParsedFile:
     """Parsed file ready for database insertion."""
     source_file: str
     source_type: str
-    parsed: ParsedIXBRL | None = None
+    rows: FilingRows | None = None
     error: str | None = None
+    duplicate: bool = False  # Content already loaded (matching file_hash); not parsed
 
 
 class ResolutionCache:
@@ -154,8 +287,8 @@ class ResolutionCache:
     def __init__(self, conn: sqlite3.Connection):
         self.conn = conn
         self._concepts: dict[str, int] = {}       # concept_raw -> concept_id
-        self._dim_patterns: dict[str, int] = {}    # pattern_hash -> dimension_pattern_id
-        self._ctx_defs: dict[str, int] = {}        # definition_hash -> context_definition_id
+        self._dim_patterns: dict[bytes, int] = {}  # pattern_hash -> dimension_pattern_id
+        self._ctx_defs: dict[bytes, int] = {}      # definition_hash -> context_definition_id
         self._load_existing()
 
     def _load_existing(self):
@@ -179,8 +312,7 @@ class ResolutionCache:
             return self._concepts[concept_raw]
 
         # Insert new concept
-        concept = normalize_concept(concept_raw)
-        namespace = concept_raw.split(":")[0] if ":" in concept_raw else None
+        _, concept, namespace = intern_concept(concept_raw)
 
         cursor = self.conn.execute(
             "INSERT OR IGNORE INTO concepts (concept_raw, concept, namespace) VALUES (?, ?, ?)",
@@ -196,18 +328,31 @@ class ResolutionCache:
         self._concepts[concept_raw] = concept_id
         return concept_id
 
-    def resolve_context(self, context) -> int:
-        """Resolve a parsed Context object to its context_definition_id.
-
-        1. Hash dimensions JSON -> lookup/insert dimension_pattern
-        2. Hash full context definition -> lookup/insert context_definition
+    def resolve_context(
+        self,
+        period_type: str | None,
+        instant: str | None,
+        start: str | None,
+        end: str | None,
+        dims_json: str | None,
+        pattern_hash: bytes | None,
+        definition_hash: bytes,
+    ) -> int:
+        """Resolve a context (as in FilingRows.contexts) to its context_definition_id.
+
+        The hashes and ISO dates come precomputed from the parser worker
+        (context_keys), so a known context is a single dict lookup.
+
+        1. Lookup/insert dimension_pattern by pattern_hash
+        2. Lookup/insert context_definition by definition_hash
         """
+        ctx_def_id = self._ctx_defs.get(definition_hash)
+        if ctx_def_id is not None:
+            return ctx_def_id
+
         # Step 1: Resolve dimension pattern
         dimension_pattern_id = None
-        if context.dimensions:
-            dims_json = json.dumps(context.dimensions, sort_keys=True)
-            pattern_hash = hashlib.sha256(dims_json.encode()).hexdigest()
-
+        if pattern_hash:
             if pattern_hash in self._dim_patterns:
                 dimension_pattern_id = self._dim_patterns[pattern_hash]
             else:
@@ -223,32 +368,13 @@ class ResolutionCache:
                     dimension_pattern_id = row["id"]
                 self._dim_patterns[pattern_hash] = dimension_pattern_id
 
-        # Step 2: Resolve context definition
-        # Normalize dates to ISO so that e.g. "28 February 2023" and
-        # "2023-02-28" hash identically and share one lookup row.
-        instant = normalize_date_to_iso(context.instant_date)
-        start = normalize_date_to_iso(context.start_date)
-        end = normalize_date_to_iso(context.end_date)
-
-        # Build canonical string for hashing
-        def_parts = "|".join([
-            context.period_type or "",
-            instant or "",
-            start or "",
-            end or "",
-            str(dimension_pattern_id) if dimension_pattern_id is not None else "",
-        ])
-        definition_hash = hashlib.sha256(def_parts.encode()).hexdigest()
-
-        if definition_hash in self._ctx_defs:
-            return self._ctx_defs[definition_hash]
-
+        # Step 2: Insert context definition
         cursor = self.conn.execute(
             """INSERT OR IGNORE INTO context_definitions
                (period_type, instant_date, start_date, end_date, dimension_pattern_id, definition_hash)
                VALUES (?, ?, ?, ?, ?, ?)""",
             (
-                context.period_type,
+                period_type,
                 instant,
                 start,
                 end,
@@ -266,6 +392,23 @@ class ResolutionCache:
         return ctx_def_id
 
 
+def context_keys(
+    period_type: str | None,
+    instant: str | None,
+    start: str | None,
+    end: str | None,
+    dims_json: str | None,
+) -> tuple[bytes | None, bytes]:
+    """
+    Dedup keys for a context: (pattern_hash, definition_hash).
+
+    Dates must already be ISO-normalised, so that e.g. "28 February 2023"
+    and "2023-02-28" hash identically and share one lookup row.
+    """
+    pattern_hash = dimension_pattern_hash(dims_json) if dims_json else None
+    return pattern_hash, context_definition_hash(period_type, instant, start, end, pattern_hash)
+
+
 def detect_source_type(filename: str) -> str:
     """
     Detect the source type based on filename extension.
@@ -285,12 +428,139 @@ def detect_source_type(filename: str) -> str:
     return 'ixbrl_html'  # Default assumption
 
 
-def parse_file_content(args: tuple[str, bytes, str]) -> list[ParsedFile]:
+def content_hash(content: bytes) -> str:
+    """filings.file_hash: hex BLAKE2b-128 of a source document's bytes."""
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def to_filing_rows(
+    parsed: ParsedIXBRL,
+    source_file: str,
+    file_hash: str | None = None,
+    text_facts_policy: str = "full",
+    source_ranges: dict[tuple[str, str], list[tuple[int, int]]] | None = None,
+) -> FilingRows:
+    """
+    Flatten parser output into FilingRows (runs in the parser worker).
+
+    Facts whose context_ref is missing from the filing are dropped, and
+    unknown unit_refs become unit=None, each with a warning message.
+
+    Escaped text facts of TEXT_FACT_MIN_LENGTH or more are stored per
+    text_facts_policy (see backend.db.text_values): compressed here, or,
+    for "deferred", as the fact's range from source_ranges
+    (text_fact_ranges of the document), kept in full if it has none.
     """
-    Parse file content (worker function for multiprocessing).
+    balance_sheet_date = normalize_date_to_iso(parsed.balance_sheet_date) or "unknown"
+    period_start_date = normalize_date_to_iso(parsed.period_start_date)
+    period_end_date = normalize_date_to_iso(parsed.period_end_date)
+    warnings: list[str] = []
+
+    unit_map = {unit.unit_ref: unit.measure for unit in parsed.units}
+
+    contexts = []
+    for ctx in parsed.contexts:
+        values = (
+            ctx.period_type,
+            normalize_date_to_iso(ctx.instant_date),
+            normalize_date_to_iso(ctx.start_date),
+            normalize_date_to_iso(ctx.end_date),
+            json.dumps(ctx.dimensions, sort_keys=True) if ctx.dimensions else None,
+        )
+        contexts.append((ctx.context_ref, *values, *context_keys(*values)))
+    context_refs = {ctx[0] for ctx in contexts}
+
+    numeric_facts = []
+    for f in parsed.numeric_facts:
+        if f.context_ref not in context_refs:
+            warnings.append(
+                f"Skipping numeric fact {f.concept_raw}: "
+                f"context_ref '{f.context_ref}' not found in filing {source_file}"
+            )
+            continue
+
+        unit = None
+        if f.unit_ref:
+            if f.unit_ref in unit_map:
+                unit = unit_map[f.unit_ref]
+            else:
+                warnings.append(
+                    f"unit_ref '{f.unit_ref}' not found in filing {source_file}, setting unit=None"
+                )
+
+        numeric_facts.append((f.concept_raw, f.context_ref, unit, f.value))
+
+    text_facts = []
+    text_sources = {}
+    range_positions: dict[tuple[str, str], int] = {}
+    for f in parsed.text_facts:
+        source_range = None
+        if source_ranges is not None:
+            # Ranges are per (name, contextRef) in document order, like the facts
+            key = (f.concept_raw, f.context_ref)
+            position = range_positions.get(key, 0)
+            range_positions[key] = position + 1
+            key_ranges = source_ranges.get(key, ())
+            if position < len(key_ranges):
+                source_range = key_ranges[position]
+
+        if f.context_ref not in context_refs:
+            warnings.append(
+                f"Skipping text fact {f.concept_raw}: "
+                f"context_ref '{f.context_ref}' not found in filing {source_file}"
+            )
+            continue
+
+        value = f.value
+        if f.escape and value and len(value) >= TEXT_FACT_MIN_LENGTH:
+            if text_facts_policy == "compressed":
+                value = compress_text(value)
+            elif text_facts_policy == "deferred" and source_range and source_range[1]:
+                text_sources[len(text_facts)] = source_range
+                value = None
+        text_facts.append((f.concept_raw, f.context_ref, value))
+
+    # Precomputed headline figures for the report/modal
+    summary = summarise_parsed(
+        parsed, normalize_date_to_iso,
+        balance_sheet_date, period_start_date, period_end_date,
+    )
+
+    return FilingRows(
+        company_number=parsed.company_number,
+        company_name=parsed.company_name,
+        balance_sheet_date=balance_sheet_date,
+        period_start_date=period_start_date,
+        period_end_date=period_end_date,
+        contexts=contexts,
+        numeric_facts=numeric_facts,
+        text_facts=text_facts,
+        summary=summary,
+        warnings=warnings,
+        file_hash=file_hash,
+        text_sources=text_sources or None,
+    )
+
+
+def parse_file_content(
+    args: tuple[str, bytes, str],
+    hash_exists: Callable[[str], bool] | None = None,
+    text_facts_policy: str = "full",
+) -> list[ParsedFile]:
+    """
+    Parse file content into FilingRows.
+
+    xbrl_xml documents go to the XBRL instance parser (backend.parser.xbrl),
+    everything else to the iXBRL parser. Each document's content_hash is computed first; if `hash_exists` says a
+    filing with that hash is already loaded, the document is not parsed and
+    comes back as a duplicate. This catches re-delivered filings under new
+    names, notably CIC inner files, which the source_file check only sees
+    after parsing.
 
     Args:
         args: Tuple of (source_file, content, source_type)
+        hash_exists: Optional lookup of an existing filings.file_hash
+        text_facts_policy: How large escaped text facts are stored (see to_filing_rows)
 
     Returns:
         List of ParsedFile objects (multiple for CIC ZIPs)
@@ -298,6 +568,21 @@ def parse_file_content(args: tuple[str, bytes, str]) -> list[ParsedFile]:
     source_file, content, source_type = args
     results = []
 
+    def parse_document(doc_source: str, doc_type: str, doc_content: bytes) -> ParsedFile:
+        file_hash = content_hash(doc_content)
+        if hash_exists is not None and hash_exists(file_hash):
+            return ParsedFile(source_file=doc_source, source_type=doc_type, duplicate=True)
+        parsed = parse_xbrl(doc_content) if doc_type == 'xbrl_xml' else parse_ixbrl(doc_content)
+        # Only iXBRL has escaped facts, whose content the deferred policy locates
+        source_ranges = None
+        if text_facts_policy == "deferred" and doc_type != 'xbrl_xml':
+            source_ranges = text_fact_ranges(doc_content)
+        return ParsedFile(
+            source_file=doc_source,
+            source_type=doc_type,
+            rows=to_filing_rows(parsed, doc_source, file_hash, text_facts_policy, source_ranges)
+        )
+
     try:
         if source_type == 'cic_zip':
             # Process nested CIC ZIP
@@ -305,28 +590,22 @@ def parse_file_content(args: tuple[str, bytes, str]) -> list[ParsedFile]:
                 for entry in inner_zip.namelist():
                     lower = entry.lower()
                     if lower.endswith(('.xhtml', '.html', '.xml')) and not entry.startswith('__'):
+                        inner_source = f"{source_file}!{entry}"
+                        # Same dispatch as top-level files: .xml instances go to parse_xbrl
+                        inner_type = detect_source_type(entry)
                         try:
-                            inner_content = inner_zip.read(entry)
-                            parsed = parse_ixbrl(inner_content)
-                            results.append(ParsedFile(
-                                source_file=f"{source_file}!{entry}",
-                                source_type='ixbrl_html',
-                                parsed=parsed
+                            results.append(parse_document(
+                                inner_source, inner_type, inner_zip.read(entry)
                             ))
                         except Exception as e:
                             results.append(ParsedFile(
-                                source_file=f"{source_file}!{entry}",
-                                source_type='ixbrl_html',
+                                source_file=inner_source,
+                                source_type=inner_type,
                                 error=str(e)
                             ))
         else:
             # Parse directly
-            parsed = parse_ixbrl(content)
-            results.append(ParsedFile(
-                source_file=source_file,
-                source_type=source_type,
-                parsed=parsed
-            ))
+            results.append(parse_document(source_file, source_type, content))
     except Exception as e:
         results.append(ParsedFile(
             source_file=source_file,
@@ -337,6 +616,238 @@ def parse_file_content(args: tuple[str, bytes, str]) -> list[ParsedFile]:
     return results
 
 
+# Per-worker handles on the batch ZIP and the database, opened on first use
+_worker_zip: zipfile.ZipFile | None = None
+_worker_db: sqlite3.Connection | None = None
+_worker_db_path: str | None = None
+
+
+def _worker_hash_exists(db_path: str) -> Callable[[str], bool]:
+    """file_hash lookup on the worker's read-only connection to db_path."""
+    global _worker_db, _worker_db_path
+    if _worker_db is None or _worker_db_path != db_path:
+        if _worker_db is not None:
+            _worker_db.close()
+        _worker_db = get_connection(Path(db_path), read_only=True)
+        _worker_db_path = db_path
+
+    def hash_exists(file_hash: str) -> bool:
+        return _worker_db.execute(
+            "SELECT 1 FROM filings WHERE file_hash = ? LIMIT 1", (file_hash,)
+        ).fetchone() is not None
+
+    return hash_exists
+
+
+def parse_zip_entry(args: tuple[str, str, str, str | None, str]) -> list[ParsedFile]:
+    """
+    Read one entry from the batch ZIP and parse it (worker function).
+
+    Workers open the archive themselves and keep it open for the batch,
+    so only (zip_path, entry, source_type) is sent to them, rather than
+    every file's bytes being read and pickled by the main process. Given
+    a db_path, they also skip documents whose content is already loaded
+    (see parse_file_content), checked on their own read-only connection;
+    under WAL this sees everything the loader has committed.
+
+    Args:
+        args: Tuple of (zip_path, source_file, source_type, db_path or None,
+            text_facts_policy)
+    """
+    global _worker_zip
+    zip_path, source_file, source_type, db_path, text_facts_policy = args
+    try:
+        if _worker_zip is None or _worker_zip.filename != zip_path:
+            if _worker_zip is not None:
+                _worker_zip.close()
+            _worker_zip = zipfile.ZipFile(zip_path, 'r')
+        content = _worker_zip.read(source_file)
+        hash_exists = _worker_hash_exists(db_path) if db_path else None
+    except Exception as e:
+        return [ParsedFile(source_file=source_file, source_type=source_type, error=str(e))]
+    return parse_file_content((source_file, content, source_type), hash_exists, text_facts_policy)
+
+
+# Smallest document that exercises the lxml HTML parser and the fact path
+_WARM_UP_DOCUMENT = (
+    b'<html xmlns:ix="http://www.xbrl.org/2013/inlineXBRL"><body>'
+    b'<ix:nonFraction name="uk-core:Equity" contextRef="c" unitRef="u">1</ix:nonFraction>'
+    b'</body></html>'
+)
+
+
+def _init_parser_worker() -> None:
+    """Worker initializer: pay lxml/parser start-up once per process."""
+    parse_ixbrl(_WARM_UP_DOCUMENT)
+
+
+def _ping() -> None:
+    pass
+
+
+class ParserPool:
+    """
+    Long-lived process pool for parse_zip_entry.
+
+    Replaces a ProcessPoolExecutor per chunk: the caller creates one pool and
+    passes it to every load_batch call, so workers are forked, imported and
+    warmed up once per run rather than once per CHUNK_SIZE files.
+
+    - Warm-up: each worker parses a tiny document on start, and start()
+      spawns all workers before the first chunk arrives.
+    - Recycling: once the workers have parsed about max_tasks_per_child
+      files each, submission pauses until the pool drains and it is
+      replaced, which bounds memory growth in long backfills. (Done here
+      rather than with ProcessPoolExecutor's max_tasks_per_child, which can
+      deadlock on 3.11 and rules out fork.)
+    - Health: if a worker dies (BrokenProcessPool), the pool is restarted and
+      the in-flight files are retried once; files that break it again are
+      reported as failed instead of aborting the batch.
+
+    Usage:
+        with ParserPool(workers=4) as pool:
+            for zip_path in zips:
+                load_batch(zip_path, conn=conn, cache=cache, pool=pool)
+    """
+
+    def __init__(self, workers: int = PARALLEL_WORKERS, max_tasks_per_child: int = WORKER_MAX_TASKS):
+        self.workers = workers
+        self.max_tasks_per_child = max_tasks_per_child
+        self.files_parsed = 0
+        self.restarts = 0
+        self.recycles = 0
+        self._executor: ProcessPoolExecutor | None = None
+        self._files_since_start = 0
+
+    def __enter__(self) -> "ParserPool":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Create the executor and spawn all workers (idempotent)."""
+        if self._executor is not None:
+            return
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_parser_worker,
+        )
+        self._files_since_start = 0
+        # Workers spawn on demand as tasks queue up; one ping per worker
+        # brings them all up (and through the initializer) now
+        for future in [self._executor.submit(_ping) for _ in range(self.workers)]:
+            future.result()
+        logger.info(
+            f"Parser pool started: {self.workers} workers "
+            f"(recycled every {self.max_tasks_per_child:,} files each)"
+        )
+
+    def close(self) -> None:
+        if self._executor is None:
+            return
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+        logger.info(
+            f"Parser pool closed: {self.files_parsed:,} files parsed, "
+            f"{self.recycles} recycles, {self.restarts} restarts"
+        )
+
+    def _restart(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self.start()
+
+    def iter_parse(
+        self,
+        jobs: Iterable[tuple[str, str, str, str | None, str]],
+        max_in_flight: int | None = None,
+    ) -> Iterator[list[ParsedFile]]:
+        """
+        Parse a stream of parse_zip_entry jobs, yielding each job's results
+        as it completes.
+
+        At most max_in_flight jobs (default IN_FLIGHT_PER_WORKER per worker)
+        are submitted at once, so finished results never pile up faster than
+        the caller inserts them. Yields exactly one list per job (several
+        ParsedFiles for a CIC ZIP), in completion order.
+        """
+        max_in_flight = max_in_flight or self.workers * IN_FLIGHT_PER_WORKER
+        self.start()
+        jobs = iter(jobs)
+        in_flight: dict[Future, tuple[str, str, str, str | None]] = {}
+        retry: list[tuple[str, str, str, str | None]] = []
+        retried: set[str] = set()
+        exhausted = False
+
+        while True:
+            recycle_due = self._files_since_start >= self.workers * self.max_tasks_per_child
+            if recycle_due and not in_flight:
+                # Drained, so this is a clean swap
+                self.recycles += 1
+                self._restart()
+                recycle_due = False
+            while len(in_flight) < max_in_flight and not recycle_due:
+                if retry:
+                    job = retry.pop()
+                elif not exhausted:
+                    job = next(jobs, None)
+                    if job is None:
+                        exhausted = True
+                        break
+                else:
+                    break
+                in_flight[self._executor.submit(parse_zip_entry, job)] = job
+            if not in_flight:
+                return
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            broken = False
+            for future in done:
+                job = in_flight[future]
+                try:
+                    results = future.result()
+                except BrokenProcessPool:
+                    broken = True
+                    continue
+                except Exception as e:
+                    results = [ParsedFile(
+                        source_file=job[1],
+                        source_type='unknown',
+                        error=str(e)
+                    )]
+                else:
+                    self.files_parsed += 1
+                    self._files_since_start += 1
+                del in_flight[future]
+                yield results
+
+            if broken:
+                # Every in-flight job is lost with the pool: retry each once
+                logger.warning(
+                    f"Parser worker died with {len(in_flight)} files in flight; "
+                    f"restarting pool"
+                )
+                failed = []
+                for job in in_flight.values():
+                    if job[1] in retried:
+                        failed.append(ParsedFile(
+                            source_file=job[1],
+                            source_type='unknown',
+                            error="Parser worker process died"
+                        ))
+                    else:
+                        retried.add(job[1])
+                        retry.append(job)
+                in_flight.clear()
+                self.restarts += 1
+                self._restart()
+                for pf in failed:
+                    yield [pf]
+
+
 def configure_for_bulk_load(conn: sqlite3.Connection) -> None:
     """Configure SQLite for maximum bulk load performance.
 
@@ -365,10 +876,11 @@ _BULK_LOAD_INDEXES = [
     ("idx_filings_company", "filings", "company_number"),
     ("idx_filings_date", "filings", "balance_sheet_date"),
     ("idx_filings_batch", "filings", "batch_id"),
+    # Companies
+    ("idx_companies_name", "companies", "name COLLATE NOCASE"),
     # Concepts
     ("idx_concepts_name", "concepts", "concept"),
     # Context definitions
-    ("idx_context_def_hash", "context_definitions", "definition_hash"),
     ("idx_context_def_period", "context_definitions", "period_type, instant_date"),
     # Numeric facts
     ("idx_numeric_filing", "numeric_facts", "filing_id"),
@@ -389,17 +901,51 @@ def drop_indexes_for_bulk_load(conn: sqlite3.Connection) -> None:
     logger.info(f"Dropped {len(_BULK_LOAD_INDEXES)} indexes for bulk load")
 
 
-def recreate_indexes(conn: sqlite3.Connection) -> None:
-    """Recreate indexes after bulk loading."""
-    for idx_name, table, columns in _BULK_LOAD_INDEXES:
-        conn.execute(f"CREATE INDEX IF NOT EXISTS {idx_name} ON {table}({columns})")
-    conn.commit()
-    logger.info(f"Recreated {len(_BULK_LOAD_INDEXES)} indexes")
+def recreate_indexes(conn: sqlite3.Connection) -> dict[str, float]:
+    """Recreate indexes after bulk loading.
+
+    SQLite builds one index at a time per database, so the parallelism is
+    inside each build: PRAGMA threads lets the CREATE INDEX sorter use
+    INDEX_BUILD_THREADS helper threads, with a page cache of
+    INDEX_BUILD_CACHE_MB. Both are restored afterwards. Indexes are built
+    table by table so each table's pages stay hot in the cache.
+
+    Returns:
+        Build time in seconds per index (indexes that already existed are
+        not included)
+    """
+    existing = {
+        row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+    }
+    cache_size = conn.execute("PRAGMA cache_size").fetchone()[0]
+    threads = conn.execute("PRAGMA threads").fetchone()[0]
+    conn.execute(f"PRAGMA cache_size = -{INDEX_BUILD_CACHE_MB * 1024}")
+    conn.execute(f"PRAGMA threads = {INDEX_BUILD_THREADS}")
+
+    timings: dict[str, float] = {}
+    try:
+        for idx_name, table, columns in _BULK_LOAD_INDEXES:
+            if idx_name in existing:
+                continue
+            start = time.perf_counter()
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {idx_name} ON {table}({columns})")
+            conn.commit()
+            timings[idx_name] = time.perf_counter() - start
+            logger.info(f"  {idx_name} on {table}({columns}): {timings[idx_name]:.2f}s")
+    finally:
+        conn.execute(f"PRAGMA cache_size = {cache_size}")
+        conn.execute(f"PRAGMA threads = {threads}")
+
+    logger.info(
+        f"Recreated {len(timings)} indexes in {sum(timings.values()):.1f}s "
+        f"({INDEX_BUILD_THREADS} sorter threads, {INDEX_BUILD_CACHE_MB} MB cache)"
+    )
+    return timings
 
 
 def bulk_insert_filing(
     conn: sqlite3.Connection,
-    parsed: ParsedIXBRL,
+    rows: FilingRows,
     company_number: str,
     batch_id: int,
     source_file: str,
@@ -409,107 +955,99 @@ def bulk_insert_filing(
     """
     Insert a complete filing with all related data using batch operations.
 
-    v2: Uses ResolutionCache to resolve concepts, contexts, and units
-    to lookup table IDs before inserting facts.
+    v2: Uses ResolutionCache to resolve concepts and contexts to lookup
+    table IDs before inserting facts. Also writes the filing's
+    filing_summaries row (see backend.loader.summaries).
 
     Returns:
         The filing ID
     """
+    for message in rows.warnings:
+        logger.warning(message)
+
     # Insert filing record
     cursor = conn.execute(
         """
         INSERT INTO filings (
             company_number, batch_id, source_file, source_type,
-            balance_sheet_date, period_start_date, period_end_date, loaded_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            balance_sheet_date, period_start_date, period_end_date, loaded_at,
+            file_hash
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
         (
             company_number,
             batch_id,
             source_file,
             source_type,
-            normalize_date_to_iso(parsed.balance_sheet_date) or "unknown",
-            normalize_date_to_iso(parsed.period_start_date),
-            normalize_date_to_iso(parsed.period_end_date),
-            datetime.now().isoformat()
+            rows.balance_sheet_date,
+            rows.period_start_date,
+            rows.period_end_date,
+            datetime.now().isoformat(),
+            rows.file_hash,
         )
     )
     filing_id = cursor.lastrowid
 
-    # Build per-filing resolution maps
-    unit_map: dict[str, str] = {}      # unit_ref -> measure string
-    context_map: dict[str, int] = {}   # context_ref -> context_definition_id
-
-    for unit in parsed.units:
-        unit_map[unit.unit_ref] = unit.measure
+    # Per-filing resolution map: context_ref -> context_definition_id
+    context_map = {ctx[0]: cache.resolve_context(*ctx[1:]) for ctx in rows.contexts}
+    resolve_concept = cache.resolve_concept
 
-    for ctx in parsed.contexts:
-        context_map[ctx.context_ref] = cache.resolve_context(ctx)
+    # Facts are inserted in (filing_id, concept_id) order: filing ids only
+    # grow, so rowids follow the key of the fact indexes and those B-trees
+    # are appended to (or, after a bulk load, built from presorted input)
+    # rather than split at random. The sort is stable, so facts for one
+    # concept keep their document order.
+    fact_order = itemgetter(1)
 
     # Bulk insert numeric facts
-    if parsed.numeric_facts:
-        numeric_rows = []
-        for f in parsed.numeric_facts:
-            if f.context_ref not in context_map:
-                logger.warning(
-                    f"Skipping numeric fact {f.concept_raw}: "
-                    f"context_ref '{f.context_ref}' not found in filing {source_file}"
-                )
-                continue
-
-            unit = None
-            if f.unit_ref:
-                if f.unit_ref in unit_map:
-                    unit = unit_map[f.unit_ref]
-                else:
-                    logger.warning(
-                        f"unit_ref '{f.unit_ref}' not found in filing {source_file}, setting unit=None"
-                    )
-
-            numeric_rows.append((
-                filing_id,
-                cache.resolve_concept(f.concept_raw),
-                context_map[f.context_ref],
-                unit,
-                f.value,
-            ))
-
-        if numeric_rows:
-            conn.executemany(
-                """
-                INSERT INTO numeric_facts (filing_id, concept_id, context_id, unit, value)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                numeric_rows
+    if rows.numeric_facts:
+        conn.executemany(
+            """
+            INSERT INTO numeric_facts (filing_id, concept_id, context_id, unit, value)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            sorted(
+                [
+                    (filing_id, resolve_concept(concept_raw), context_map[context_ref], unit, value)
+                    for concept_raw, context_ref, unit, value in rows.numeric_facts
+                ],
+                key=fact_order,
             )
+        )
 
     # Bulk insert text facts
-    if parsed.text_facts:
-        text_rows = []
-        for f in parsed.text_facts:
-            if f.context_ref not in context_map:
-                logger.warning(
-                    f"Skipping text fact {f.concept_raw}: "
-                    f"context_ref '{f.context_ref}' not found in filing {source_file}"
-                )
-                continue
-
-            text_rows.append((
-                filing_id,
-                cache.resolve_concept(f.concept_raw),
-                context_map[f.context_ref],
-                f.value,
-            ))
+    if rows.text_facts:
+        text_rows = [
+            (filing_id, resolve_concept(concept_raw), context_map[context_ref], value)
+            for concept_raw, context_ref, value in rows.text_facts
+        ]
+        order = sorted(range(len(text_rows)), key=lambda i: text_rows[i][1])
+        conn.executemany(
+            """
+            INSERT INTO text_facts (filing_id, concept_id, context_id, value)
+            VALUES (?, ?, ?, ?)
+            """,
+            [text_rows[i] for i in order]
+        )
 
-        if text_rows:
+        # Deferred text facts: this connection is the only writer, so the
+        # rows just inserted took consecutive rowids ending at last_insert_rowid()
+        if rows.text_sources:
+            first_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0] - len(order) + 1
             conn.executemany(
                 """
-                INSERT INTO text_facts (filing_id, concept_id, context_id, value)
-                VALUES (?, ?, ?, ?)
+                INSERT INTO text_fact_sources (text_fact_id, source_offset, source_length)
+                VALUES (?, ?, ?)
                 """,
-                text_rows
+                [
+                    (first_id + position, *rows.text_sources[i])
+                    for position, i in enumerate(order) if i in rows.text_sources
+                ]
             )
 
+    # Precomputed headline figures for the report/modal
+    insert_summary(conn, filing_id, rows.summary)
+
     return filing_id
 
 
@@ -518,21 +1056,46 @@ def upsert_company(
     company_number: str | None,
     company_name: str | None
 ) -> str | None:
-    """Insert or update company record."""
+    """Insert or update company record.
+
+    Keeps the companies_fts search index in sync: a new or renamed company
+    has its old name (if any) removed from the index and the new one added.
+    """
     if not company_number:
         return None
 
     company_number = company_number.strip().upper()
+    name = company_name.strip() if company_name else None
 
-    conn.execute(
-        "INSERT OR IGNORE INTO companies (company_number) VALUES (?)",
+    row = conn.execute(
+        "SELECT rowid, name FROM companies WHERE company_number = ?",
         (company_number,)
-    )
+    ).fetchone()
 
-    if company_name:
+    if row is None:
+        cursor = conn.execute(
+            "INSERT INTO companies (company_number, name) VALUES (?, ?)",
+            (company_number, name)
+        )
+        if name:
+            conn.execute(
+                "INSERT INTO companies_fts (rowid, name) VALUES (?, ?)",
+                (cursor.lastrowid, name)
+            )
+    elif name and name != row["name"]:
+        rowid, old_name = row[0], row["name"]
+        if old_name:
+            conn.execute(
+                "INSERT INTO companies_fts (companies_fts, rowid, name) VALUES ('delete', ?, ?)",
+                (rowid, old_name)
+            )
         conn.execute(
             "UPDATE companies SET name = ? WHERE company_number = ?",
-            (company_name.strip(), company_number)
+            (name, company_number)
+        )
+        conn.execute(
+            "INSERT INTO companies_fts (rowid, name) VALUES (?, ?)",
+            (rowid, name)
         )
 
     return company_number
@@ -550,18 +1113,78 @@ def create_batch(conn: sqlite3.Connection, zip_path: Path, file_count: int) -> i
     return cursor.lastrowid
 
 
-def mark_batch_complete(conn: sqlite3.Connection, batch_id: int) -> None:
-    """Mark a batch as complete with processed timestamp."""
+class StatsTracker:
+    """Keeps db_stats row counts in step with the rows the loader inserts.
+
+    Loader tables are append-only during a batch and SQLite assigns rowids
+    as MAX(rowid) + 1, so rows inserted since the last flush are the growth
+    in MAX(rowid): one index lookup per table instead of a COUNT(*) scan.
+    Call flush() right before each commit so counts and rows are committed
+    in the same transaction.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self._max_rowids = {table: self._max_rowid(table) for table in STATS_TABLES}
+
+    def _max_rowid(self, table: str) -> int:
+        return self.conn.execute(f"SELECT COALESCE(MAX(rowid), 0) FROM {table}").fetchone()[0]
+
+    def flush(self) -> None:
+        """Add rows inserted since the last flush to db_stats."""
+        for table, last in self._max_rowids.items():
+            current = self._max_rowid(table)
+            if current != last:
+                self.conn.execute(
+                    "UPDATE db_stats SET row_count = row_count + ? WHERE table_name = ?",
+                    (current - last, table)
+                )
+                self._max_rowids[table] = current
+
+
+def mark_batch_complete(
+    conn: sqlite3.Connection,
+    batch_id: int,
+    stats: StatsTracker | None = None,
+) -> None:
+    """Mark a batch as complete with processed timestamp.
+
+    If given, `stats` is flushed so the batch's final row counts are
+    committed together with processed_at.
+    """
     conn.execute(
         "UPDATE batches SET processed_at = ? WHERE id = ?",
         (datetime.now().isoformat(), batch_id)
     )
+    if stats is not None:
+        stats.flush()
 
 
-def get_existing_source_files(conn: sqlite3.Connection) -> set[str]:
-    """Return all source_file values already in the filings table."""
-    cursor = conn.execute("SELECT source_file FROM filings")
-    return {row["source_file"] for row in cursor.fetchall()}
+def _database_path(conn: sqlite3.Connection) -> str | None:
+    """File path of conn's main database (None for in-memory)."""
+    for row in conn.execute("PRAGMA database_list"):
+        if row[1] == "main":
+            return row[2] or None
+    return None
+
+
+def file_hash_lookup(conn: sqlite3.Connection) -> Callable[[str], bool]:
+    """file_hash existence check on conn (the sequential loader's hash_exists)."""
+    def hash_exists(file_hash: str) -> bool:
+        return conn.execute(
+            "SELECT 1 FROM filings WHERE file_hash = ? LIMIT 1", (file_hash,)
+        ).fetchone() is not None
+    return hash_exists
+
+
+def get_existing_source_files(conn: sqlite3.Connection) -> SourceFileIndex:
+    """
+    Return a membership index of source_file values already in filings.
+
+    Supports `in` (exact) and len(); see backend.loader.source_index. Call
+    .save(conn) before the batch's final commit.
+    """
+    return SourceFileIndex.load(conn)
 
 
 def load_batch(
@@ -569,6 +1192,8 @@ def load_batch(
     workers: int = PARALLEL_WORKERS,
     conn: sqlite3.Connection | None = None,
     cache: ResolutionCache | None = None,
+    pool: ParserPool | None = None,
+    text_facts_policy: str = TEXT_FACT_POLICY,
 ) -> BatchResult:
     """
     Load a daily ZIP file into the database with optimized performance.
@@ -577,9 +1202,13 @@ def load_batch(
 
     Args:
         zip_path: Path to the ZIP file to process
-        workers: Number of parallel workers for parsing (default: 2)
+        workers: Number of parallel workers for parsing (ignored if pool given)
         conn: Optional external DB connection (caller manages lifecycle)
         cache: Optional external ResolutionCache (persists across batches)
+        pool: Optional external ParserPool (persists across batches);
+            otherwise one is created for this batch and shared by its chunks
+        text_facts_policy: How large escaped text facts are stored: "full",
+            "compressed" or "deferred" (see backend.db.text_values)
 
     Returns:
         BatchResult with statistics and any errors
@@ -588,12 +1217,17 @@ def load_batch(
 
     if not zip_path.exists():
         raise FileNotFoundError(f"ZIP file not found: {zip_path}")
+    if text_facts_policy not in TEXT_FACT_POLICIES:
+        raise ValueError(f"Unknown text fact policy: {text_facts_policy!r}")
 
-    # If caller provides conn/cache, they own the lifecycle
+    # If caller provides conn/cache/pool, they own the lifecycle
     owns_conn = conn is None
     if owns_conn:
         init_db()
         conn = get_connection()
+    owns_pool = pool is None
+    if owns_pool:
+        pool = ParserPool(workers=workers)
 
     errors: list[str] = []
     files_processed = 0
@@ -615,64 +1249,53 @@ def load_batch(
             ]
             files_total = len(entries)
 
-            logger.info(f"Processing {zip_path.name}: {files_total} files with {workers} workers")
+            logger.info(f"Processing {zip_path.name}: {files_total} files with {pool.workers} workers")
 
             # Create batch record
+            stats = StatsTracker(conn)
             batch_id = create_batch(conn, zip_path, files_total)
+            stats.flush()
             conn.commit()
 
             # Load existing source files for duplicate detection
             existing_source_files = get_existing_source_files(conn)
             logger.info(f"Duplicate detection: {len(existing_source_files):,} existing filings in database")
 
-            # Process files in chunks to limit peak memory usage.
-            # Each chunk: read from ZIP -> parse -> insert to DB -> release.
-            logger.info(f"Processing in chunks of {CHUNK_SIZE} (parse + insert per chunk)...")
-
-            total_inserted = 0
+            # Workers check file_hash against the same database file, which
+            # only shows committed filings; batch_hashes covers the rest
+            db_path = _database_path(conn)
+            batch_hashes: set[str] = set()
+
+            # Layer 1: skip non-CIC duplicates before any I/O. Workers read
+            # the remaining entries from the ZIP themselves; the pool keeps a
+            # bounded number in flight and this thread inserts each result
+            # as soon as it completes, so parsing and inserting overlap.
+            jobs = []
+            for entry in entries:
+                source_type = detect_source_type(entry)
+                if source_type != 'cic_zip' and entry in existing_source_files:
+                    files_skipped += 1
+                    continue
+                jobs.append((str(zip_path), entry, source_type, db_path, text_facts_policy))
+            skipped_unread = files_skipped
 
-            for chunk_start in range(0, files_total, CHUNK_SIZE):
-                chunk_entries = entries[chunk_start:chunk_start + CHUNK_SIZE]
-                chunk_num = (chunk_start // CHUNK_SIZE) + 1
-                total_chunks = (files_total + CHUNK_SIZE - 1) // CHUNK_SIZE
+            jobs_done = 0
+            next_commit = CHUNK_SIZE
+            chunk_num = 0
+            total_chunks = (files_total + CHUNK_SIZE - 1) // CHUNK_SIZE
 
-                # Read chunk from ZIP (Layer 1: skip non-CIC duplicates before I/O)
-                parse_jobs = []
-                for entry in chunk_entries:
-                    source_type = detect_source_type(entry)
-                    if source_type != 'cic_zip' and entry in existing_source_files:
-                        files_skipped += 1
-                        continue
-                    content = zf.read(entry)
-                    parse_jobs.append((entry, content, source_type))
-
-                # Parse chunk (parallel)
-                parsed_files: list[ParsedFile] = []
-
-                if parse_jobs:
-                    with ProcessPoolExecutor(max_workers=workers) as executor:
-                        futures = {executor.submit(parse_file_content, job): job[0] for job in parse_jobs}
-
-                        for future in as_completed(futures):
-                            try:
-                                results = future.result()
-                                parsed_files.extend(results)
-                            except Exception as e:
-                                source_file = futures[future]
-                                parsed_files.append(ParsedFile(
-                                    source_file=source_file,
-                                    source_type='unknown',
-                                    error=str(e)
-                                ))
-
-                # Free raw bytes before DB insertion
-                del parse_jobs
-
-                # Insert chunk into DB
+            for parsed_files in pool.iter_parse(jobs):
+                jobs_done += 1
                 for pf in parsed_files:
                     try:
-                        # Layer 2: catch CIC sub-file duplicates after parsing
-                        if pf.source_file in existing_source_files:
+                        # Layer 2: catch CIC sub-file duplicates after parsing,
+                        # and re-delivered content (file_hash, not parsed)
+                        if pf.duplicate or pf.source_file in existing_source_files:
+                            files_skipped += 1
+                            continue
+                        # Same content twice in this batch: hash_exists only
+                        # sees filings inserted before the document was parsed
+                        if pf.rows and pf.rows.file_hash in batch_hashes:
                             files_skipped += 1
                             continue
 
@@ -681,13 +1304,13 @@ def load_batch(
                             errors.append(f"{pf.source_file}: {pf.error}")
                             continue
 
-                        if not pf.parsed:
+                        if not pf.rows:
                             files_failed += 1
                             errors.append(f"{pf.source_file}: No parsed data")
                             continue
 
                         company_number = upsert_company(
-                            conn, pf.parsed.company_number, pf.parsed.company_name
+                            conn, pf.rows.company_number, pf.rows.company_name
                         )
 
                         if not company_number:
@@ -702,28 +1325,34 @@ def load_batch(
                             continue
 
                         bulk_insert_filing(
-                            conn, pf.parsed, company_number,
+                            conn, pf.rows, company_number,
                             batch_id, pf.source_file, pf.source_type,
                             cache
                         )
                         files_processed += 1
+                        if pf.rows.file_hash:
+                            batch_hashes.add(pf.rows.file_hash)
 
                     except Exception as e:
                         files_failed += 1
                         errors.append(f"{pf.source_file}: {str(e)}")
 
-                # Commit after each chunk and free parsed data
-                conn.commit()
-                total_inserted += len(chunk_entries)
-                del parsed_files
-                logger.info(
-                    f"Chunk {chunk_num}/{total_chunks}: "
-                    f"{total_inserted}/{files_total} files "
-                    f"({files_processed} successful, {files_skipped} skipped)"
-                )
+                # Commit every CHUNK_SIZE entries (Layer 1 skips included)
+                entries_done = jobs_done + skipped_unread
+                if entries_done >= next_commit:
+                    next_commit = entries_done + CHUNK_SIZE
+                    chunk_num += 1
+                    stats.flush()
+                    conn.commit()
+                    logger.info(
+                        f"Chunk {chunk_num}/{total_chunks}: "
+                        f"{entries_done}/{files_total} files "
+                        f"({files_processed} successful, {files_skipped} skipped)"
+                    )
 
             # Final commit
-            mark_batch_complete(conn, batch_id)
+            mark_batch_complete(conn, batch_id, stats)
+            existing_source_files.save(conn)
             conn.commit()
 
             logger.info(
@@ -743,6 +1372,8 @@ def load_batch(
             )
 
     finally:
+        if owns_pool:
+            pool.close()
         if owns_conn:
             try:
                 restore_normal_config(conn)
@@ -756,6 +1387,7 @@ def load_batch_sequential(
     zip_path: str | Path,
     conn: sqlite3.Connection | None = None,
     cache: ResolutionCache | None = None,
+    text_facts_policy: str = TEXT_FACT_POLICY,
 ) -> BatchResult:
     """
     Load a batch without multiprocessing (for debugging or when parallel fails).
@@ -766,11 +1398,14 @@ def load_batch_sequential(
         zip_path: Path to the ZIP file to process
         conn: Optional external DB connection (caller manages lifecycle)
         cache: Optional external ResolutionCache (persists across batches)
+        text_facts_policy: As for load_batch
     """
     zip_path = Path(zip_path)
 
     if not zip_path.exists():
         raise FileNotFoundError(f"ZIP file not found: {zip_path}")
+    if text_facts_policy not in TEXT_FACT_POLICIES:
+        raise ValueError(f"Unknown text fact policy: {text_facts_policy!r}")
 
     owns_conn = conn is None
     if owns_conn:
@@ -798,12 +1433,16 @@ def load_batch_sequential(
 
             logger.info(f"Processing {zip_path.name}: {files_total} files (sequential mode)")
 
+            stats = StatsTracker(conn)
             batch_id = create_batch(conn, zip_path, files_total)
+            stats.flush()
             conn.commit()
 
             # Load existing source files for duplicate detection
             existing_source_files = get_existing_source_files(conn)
             logger.info(f"Duplicate detection: {len(existing_source_files):,} existing filings in database")
+            hash_exists = file_hash_lookup(conn)
+            batch_hashes: set[str] = set()
 
             for i, entry in enumerate(entries, 1):
                 source_type = detect_source_type(entry)
@@ -815,11 +1454,19 @@ def load_batch_sequential(
 
                 try:
                     content = zf.read(entry)
-                    parsed_files = parse_file_content((entry, content, source_type))
+                    parsed_files = parse_file_content(
+                        (entry, content, source_type), hash_exists, text_facts_policy
+                    )
 
                     for pf in parsed_files:
-                        # Layer 2: catch CIC sub-file duplicates after parsing
-                        if pf.source_file in existing_source_files:
+                        # Layer 2: catch CIC sub-file duplicates after parsing,
+                        # and re-delivered content (file_hash, not parsed)
+                        if pf.duplicate or pf.source_file in existing_source_files:
+                            files_skipped += 1
+                            continue
+                        # Same content twice in this batch: hash_exists only
+                        # sees filings inserted before the document was parsed
+                        if pf.rows and pf.rows.file_hash in batch_hashes:
                             files_skipped += 1
                             continue
 
@@ -828,12 +1475,12 @@ def load_batch_sequential(
                             errors.append(f"{pf.source_file}: {pf.error}")
                             continue
 
-                        if not pf.parsed:
+                        if not pf.rows:
                             files_failed += 1
                             continue
 
                         company_number = upsert_company(
-                            conn, pf.parsed.company_number, pf.parsed.company_name
+                            conn, pf.rows.company_number, pf.rows.company_name
                         )
 
                         if not company_number:
@@ -848,11 +1495,13 @@ def load_batch_sequential(
                             continue
 
                         bulk_insert_filing(
-                            conn, pf.parsed, company_number,
+                            conn, pf.rows, company_number,
                             batch_id, pf.source_file, pf.source_type,
                             cache
                         )
                         files_processed += 1
+                        if pf.rows.file_hash:
+                            batch_hashes.add(pf.rows.file_hash)
 
                 except Exception as e:
                     files_failed += 1
@@ -860,13 +1509,15 @@ def load_batch_sequential(
 
                 # Batch commit
                 if i % COMMIT_BATCH_SIZE == 0:
+                    stats.flush()
                     conn.commit()
                     logger.info(
                         f"Progress: {i}/{files_total} "
                         f"({files_processed} successful, {files_skipped} skipped)"
                     )
 
-            mark_batch_complete(conn, batch_id)
+            mark_batch_complete(conn, batch_id, stats)
+            existing_source_files.save(conn)
             conn.commit()
 
             logger.info(
@@ -0,0 +1,148 @@
+# Duplicate detection for the bulk loader — Bloom filter over filings.source_file
+"""
+Membership index of already-loaded source files.
+
+load_batch needs "is this ZIP entry already in filings?" for every entry.
+Materialising every source_file into a Python set costs hundreds of MB and
+seconds per batch once there are millions of filings. SourceFileIndex keeps
+a Bloom filter instead:
+
+- Persisted in the source_file_filter table together with a watermark (the
+  highest filings.id it covers), so each batch only adds the filings
+  inserted since, rather than rescanning the table.
+- A negative answer is definitive. A positive answer is confirmed against
+  the UNIQUE index on filings.source_file, so false positives (and filings
+  deleted by cleanup_incomplete_batch, which a Bloom filter can't forget)
+  cost one indexed lookup, never a wrongly skipped file.
+- Rebuilt from a full scan, at twice the size, when the filter outgrows
+  its capacity.
+
+Usage:
+    index = SourceFileIndex.load(conn)
+    if entry in index: ...   # exact
+    index.save(conn)         # after the batch's filings are inserted
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+FALSE_POSITIVE_RATE = 0.001   # Fraction of new files needing the exact lookup
+MIN_CAPACITY = 100_000        # Smallest filter built (filings)
+GROWTH_FACTOR = 2             # Capacity = GROWTH_FACTOR * filings at (re)build
+
+
+class SourceFileIndex:
+    """Bloom filter of filings.source_file with an exact fallback."""
+
+    def __init__(self, capacity: int, num_bits: int, num_hashes: int,
+                 bits: bytearray | None = None, count: int = 0, watermark: int = 0):
+        self.capacity = capacity
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = bits if bits is not None else bytearray((num_bits + 7) // 8)
+        self.count = count            # Names added (approximate filing count)
+        self.watermark = watermark    # Highest filings.id included
+        self._conn: sqlite3.Connection | None = None
+
+    @classmethod
+    def empty(cls, capacity: int) -> "SourceFileIndex":
+        """Size a filter for `capacity` names at FALSE_POSITIVE_RATE."""
+        capacity = max(capacity, MIN_CAPACITY)
+        num_bits = math.ceil(-capacity * math.log(FALSE_POSITIVE_RATE) / math.log(2) ** 2)
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        return cls(capacity, num_bits, num_hashes)
+
+    @classmethod
+    def load(cls, conn: sqlite3.Connection) -> "SourceFileIndex":
+        """Load the persisted filter and catch up on filings added since."""
+        row = conn.execute(
+            "SELECT capacity, num_bits, num_hashes, bits, item_count, watermark "
+            "FROM source_file_filter WHERE id = 1"
+        ).fetchone()
+        max_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM filings").fetchone()[0]
+
+        if row is None:
+            index = cls._build(conn)
+        else:
+            capacity, num_bits, num_hashes, bits, count, watermark = row
+            index = cls(capacity, num_bits, num_hashes, bytearray(bits), count, watermark)
+            # If rows at the top were deleted, their ids get reused: rescan
+            # from the current maximum so reused ids aren't skipped
+            index.watermark = min(index.watermark, max_id)
+            index._catch_up(conn)
+            if index.count > index.capacity:
+                logger.info(
+                    f"Source file filter over capacity ({index.count:,} > "
+                    f"{index.capacity:,}): rebuilding"
+                )
+                index = cls._build(conn)
+
+        index._conn = conn
+        return index
+
+    @classmethod
+    def _build(cls, conn: sqlite3.Connection) -> "SourceFileIndex":
+        total = conn.execute("SELECT COUNT(*) FROM filings").fetchone()[0]
+        index = cls.empty(total * GROWTH_FACTOR)
+        index._catch_up(conn)
+        logger.info(
+            f"Built source file filter: {index.count:,} filings, "
+            f"{len(index.bits) / 1024 / 1024:.1f} MB"
+        )
+        return index
+
+    def _catch_up(self, conn: sqlite3.Connection) -> None:
+        """Add filings with id above the watermark."""
+        cursor = conn.execute(
+            "SELECT id, source_file FROM filings WHERE id > ? ORDER BY id",
+            (self.watermark,)
+        )
+        for filing_id, source_file in cursor:
+            self.add(source_file)
+            self.watermark = filing_id
+
+    def save(self, conn: sqlite3.Connection) -> None:
+        """Catch up on this batch's filings and persist (caller commits)."""
+        self._catch_up(conn)
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO source_file_filter
+                (id, capacity, num_bits, num_hashes, bits, item_count, watermark)
+            VALUES (1, ?, ?, ?, ?, ?, ?)
+            """,
+            (self.capacity, self.num_bits, self.num_hashes, bytes(self.bits),
+             self.count, self.watermark)
+        )
+
+    def _positions(self, name: str) -> list[int]:
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(name.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, name: str) -> None:
+        bits = self.bits
+        for pos in self._positions(name):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def might_contain(self, name: str) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(name))
+
+    def __contains__(self, name: str) -> bool:
+        if not self.might_contain(name):
+            return False
+        return self._conn.execute(
+            "SELECT 1 FROM filings WHERE source_file = ?", (name,)
+        ).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self.count
@@ -0,0 +1,350 @@
+# Precomputed financial summaries — one filing_summaries row per filing
+"""
+Financial summaries for the filing_summaries table.
+
+The report and modal show a handful of headline figures (turnover, profit,
+net assets, cash, ...) for the current period and the prior-period
+comparatives. Rather than scanning every fact of a filing on each view, the
+loader computes them once per filing (in the parser worker, to_filing_rows)
+and bulk_insert_filing stores them as typed columns.
+
+Selection rules match frontend premium-report/transformer.js:
+- Current period: the filing's period_start/period_end (durations) and
+  balance_sheet_date (instants).
+- Prior period: of the duration contexts that end within 5 days of the
+  current period start (and differ from the current period), the one ending
+  closest to it, then the earliest start. Chosen on dates alone, so the
+  order contexts are seen in (document order at load time, stored rows on
+  backfill) doesn't matter.
+- Per concept and period: the consolidated fact (bus:Consolidated with no
+  other dimensions) if present, else the first undimensioned fact.
+- Cash falls back from CashCashEquivalents to CashBankOnHand.
+
+Existing databases are backfilled with:
+    python -m backend.loader.summaries
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from datetime import date
+from typing import Any, Callable, Iterable, NamedTuple
+
+from backend.db.connection import bump_data_version
+from backend.parser.ixbrl_fast import ParsedIXBRL
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_CHUNK_SIZE = 500  # Filings per backfill query/commit
+PRIOR_PERIOD_TOLERANCE_DAYS = 5
+
+# column -> (period kind, concepts in fallback order)
+SUMMARY_CONCEPTS: dict[str, tuple[str, tuple[str, ...]]] = {
+    "turnover": ("duration", ("TurnoverRevenue",)),
+    "gross_profit": ("duration", ("GrossProfitLoss",)),
+    "operating_profit": ("duration", ("OperatingProfitLoss",)),
+    "profit_loss": ("duration", ("ProfitLoss",)),
+    "employees": ("duration", ("AverageNumberEmployeesDuringPeriod",)),
+    "net_assets": ("instant", ("NetAssetsLiabilities",)),
+    "equity": ("instant", ("Equity",)),
+    "current_assets": ("instant", ("CurrentAssets",)),
+    "current_liabilities": ("instant", ("CreditorsDueWithinOneYear",)),
+    "cash": ("instant", ("CashCashEquivalents", "CashBankOnHand")),
+    "debtors": ("instant", ("DebtorsDueWithinOneYear",)),
+    "stocks": ("instant", ("Stocks",)),
+    "fixed_assets": ("instant", ("FixedAssets",)),
+    "net_current_assets": ("instant", ("NetCurrentAssetsLiabilities",)),
+    "total_assets_less_current_liabilities": ("instant", ("TotalAssetsLessCurrentLiabilities",)),
+    "creditors": ("instant", ("Creditors",)),
+    "creditors_after_one_year": ("instant", ("CreditorsAmountsFallingDueAfterOneYear",)),
+}
+
+SUMMARY_CONCEPT_NAMES = frozenset(
+    concept for _, concepts in SUMMARY_CONCEPTS.values() for concept in concepts
+)
+
+SUMMARY_COLUMNS = [
+    "prior_period_start_date",
+    "prior_period_end_date",
+    *(f"{column}{suffix}" for column in SUMMARY_CONCEPTS for suffix in ("", "_prior")),
+]
+
+_INSERT_SQL = (
+    f"INSERT OR REPLACE INTO filing_summaries (filing_id, {', '.join(SUMMARY_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * (len(SUMMARY_COLUMNS) + 1))})"
+)
+
+_CONSOLIDATED_MEMBER = "bus:Consolidated"
+_GROUP_DIMENSION = "bus:GroupCompanyDataDimension"
+
+
+class SummaryFact(NamedTuple):
+    """A numeric fact reduced to what summary selection needs."""
+    concept: str
+    instant_date: str | None
+    start_date: str | None
+    end_date: str | None
+    dimensions: list[dict] | None  # explicit dimensions
+    value: float | None
+
+
+def _parse_date(value: str | None) -> date | None:
+    try:
+        return date.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+def derive_prior_period(
+    durations: Iterable[tuple[str | None, str | None]],
+    period_start: str | None,
+    period_end: str | None,
+) -> tuple[str, str] | None:
+    """Find the prior period (start, end) among a filing's duration contexts."""
+    current_start = _parse_date(period_start)
+    if current_start is None:
+        return None
+
+    best = None
+    for start, end in durations:
+        if not end or end == period_end or start == period_start:
+            continue
+        prior_end = _parse_date(end)
+        if prior_end is None:
+            continue
+        gap = abs((current_start - prior_end).days)
+        if gap <= PRIOR_PERIOD_TOLERANCE_DAYS:
+            key = (gap, start or "", end)
+            if best is None or key < best:
+                best = key
+    return (best[1] or None, best[2]) if best else None
+
+
+def _select_value(
+    facts: list[SummaryFact],
+    start: str | None = None,
+    end: str | None = None,
+    instant: str | None = None,
+) -> float | None:
+    """Consolidated fact for the period, else the first undimensioned one."""
+    best = None
+    for f in facts:
+        if start and end:
+            if f.start_date != start or f.end_date != end:
+                continue
+        elif instant:
+            if f.instant_date != instant:
+                continue
+
+        dims = f.dimensions or []
+        consolidated = any(d.get("member") == _CONSOLIDATED_MEMBER for d in dims)
+        extra_dims = [d for d in dims if d.get("dimension") != _GROUP_DIMENSION]
+        if consolidated and not extra_dims:
+            return f.value
+        if not dims and best is None:
+            best = f
+    return best.value if best else None
+
+
+def compute_summary(
+    facts: Iterable[SummaryFact],
+    durations: Iterable[tuple[str | None, str | None]],
+    balance_sheet_date: str | None,
+    period_start: str | None,
+    period_end: str | None,
+) -> dict[str, Any]:
+    """
+    Compute a filing's summary row.
+
+    Args:
+        facts: The filing's numeric facts (only SUMMARY_CONCEPT_NAMES are used)
+        durations: (start, end) of the filing's duration contexts, in any order
+        balance_sheet_date, period_start, period_end: The filing's ISO dates
+
+    Returns:
+        Dict keyed by SUMMARY_COLUMNS (missing values are None)
+    """
+    by_concept: dict[str, list[SummaryFact]] = {}
+    for f in facts:
+        if f.concept in SUMMARY_CONCEPT_NAMES:
+            by_concept.setdefault(f.concept, []).append(f)
+
+    prior = derive_prior_period(durations, period_start, period_end)
+    summary: dict[str, Any] = {
+        "prior_period_start_date": prior[0] if prior else None,
+        "prior_period_end_date": prior[1] if prior else None,
+    }
+
+    for column, (kind, concepts) in SUMMARY_CONCEPTS.items():
+        current = previous = None
+        for concept in concepts:
+            concept_facts = by_concept.get(concept)
+            if not concept_facts:
+                continue
+            if kind == "duration":
+                current = _select_value(concept_facts, start=period_start, end=period_end)
+                if prior:
+                    previous = _select_value(concept_facts, start=prior[0], end=prior[1])
+            else:
+                current = _select_value(concept_facts, instant=balance_sheet_date)
+                if prior:
+                    previous = _select_value(concept_facts, instant=prior[1])
+            if current is not None or previous is not None:
+                break
+        summary[column] = current
+        summary[f"{column}_prior"] = previous
+
+    return summary
+
+
+def summarise_parsed(
+    parsed: ParsedIXBRL,
+    normalize_date: Callable[[str | None], str | None],
+    balance_sheet_date: str | None,
+    period_start: str | None,
+    period_end: str | None,
+) -> dict[str, Any]:
+    """Compute a summary straight from parser output (used at load time).
+
+    Args:
+        normalize_date: Date normaliser applied to context dates, so they
+            compare equal to the ISO dates stored on the filing
+    """
+    contexts = {ctx.context_ref: ctx for ctx in parsed.contexts}
+    periods: dict[str, tuple[str | None, str | None, str | None, list[dict] | None]] = {}
+    for ref, ctx in contexts.items():
+        periods[ref] = (
+            normalize_date(ctx.instant_date),
+            normalize_date(ctx.start_date),
+            normalize_date(ctx.end_date),
+            (ctx.dimensions or {}).get("explicit"),
+        )
+
+    facts = [
+        SummaryFact(f.concept, *periods[f.context_ref][:3], periods[f.context_ref][3], f.value)
+        for f in parsed.numeric_facts
+        if f.concept in SUMMARY_CONCEPT_NAMES and f.context_ref in periods
+    ]
+
+    durations = []
+    seen: set[str] = set()
+    for f in (*parsed.numeric_facts, *parsed.text_facts):
+        ref = f.context_ref
+        if ref in seen or ref not in contexts:
+            continue
+        seen.add(ref)
+        if contexts[ref].period_type == "duration":
+            durations.append(periods[ref][1:3])
+
+    return compute_summary(facts, durations, balance_sheet_date, period_start, period_end)
+
+
+def insert_summary(conn: sqlite3.Connection, filing_id: int, summary: dict[str, Any]) -> None:
+    """Write (or replace) a filing's summary row."""
+    conn.execute(_INSERT_SQL, (filing_id, *(summary[c] for c in SUMMARY_COLUMNS)))
+
+
+def _dimensions(dims_json: str | None) -> list[dict] | None:
+    if not dims_json:
+        return None
+    try:
+        return json.loads(dims_json).get("explicit")
+    except (ValueError, AttributeError):
+        return None
+
+
+def backfill_summaries(conn: sqlite3.Connection) -> int:
+    """
+    Compute summaries for every filing that has none, from stored facts.
+
+    Processes filings in chunks of BACKFILL_CHUNK_SIZE, committing after each
+    chunk, so it can be interrupted and resumed.
+
+    Returns:
+        Number of summaries written
+    """
+    placeholders = ",".join("?" * len(SUMMARY_CONCEPT_NAMES))
+    concepts = sorted(SUMMARY_CONCEPT_NAMES)
+    written = 0
+
+    while True:
+        filings = conn.execute(
+            """
+            SELECT f.id, f.balance_sheet_date, f.period_start_date, f.period_end_date
+            FROM filings f
+            LEFT JOIN filing_summaries s ON s.filing_id = f.id
+            WHERE s.filing_id IS NULL
+            ORDER BY f.id
+            LIMIT ?
+            """,
+            (BACKFILL_CHUNK_SIZE,)
+        ).fetchall()
+        if not filings:
+            break
+
+        first, last = filings[0]["id"], filings[-1]["id"]
+        facts: dict[int, list[SummaryFact]] = {}
+        for row in conn.execute(
+            f"""
+            SELECT nf.filing_id, c.concept, cd.instant_date, cd.start_date, cd.end_date,
+                   dp.dimensions, nf.value
+            FROM numeric_facts nf
+            JOIN concepts c ON nf.concept_id = c.id
+            JOIN context_definitions cd ON nf.context_id = cd.id
+            LEFT JOIN dimension_patterns dp ON cd.dimension_pattern_id = dp.id
+            WHERE nf.filing_id BETWEEN ? AND ? AND c.concept IN ({placeholders})
+            ORDER BY nf.id
+            """,
+            (first, last, *concepts)
+        ):
+            facts.setdefault(row[0], []).append(SummaryFact(
+                row[1], row[2], row[3], row[4], _dimensions(row[5]), row[6]
+            ))
+
+        # Duration contexts per filing (derive_prior_period ignores their order)
+        durations: dict[int, dict[int, tuple[str | None, str | None]]] = {}
+        for table in ("numeric_facts", "text_facts"):
+            for row in conn.execute(
+                f"""
+                SELECT t.filing_id, cd.id, cd.start_date, cd.end_date
+                FROM {table} t
+                JOIN context_definitions cd ON t.context_id = cd.id
+                WHERE t.filing_id BETWEEN ? AND ? AND cd.period_type = 'duration'
+                """,
+                (first, last)
+            ):
+                durations.setdefault(row[0], {}).setdefault(row[1], (row[2], row[3]))
+
+        for filing in filings:
+            summary = compute_summary(
+                facts.get(filing["id"], []),
+                durations.get(filing["id"], {}).values(),
+                filing["balance_sheet_date"],
+                filing["period_start_date"],
+                filing["period_end_date"],
+            )
+            insert_summary(conn, filing["id"], summary)
+
+        # Not a batch, so the API's watermark wouldn't otherwise move
+        bump_data_version(conn)
+        conn.commit()
+        written += len(filings)
+        logger.info(f"Backfilled summaries: {written:,} filings (up to id {last})")
+
+    return written
+
+
+if __name__ == "__main__":
+    from backend.db.connection import get_connection, init_db
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    init_db()
+    conn = get_connection()
+    try:
+        count = backfill_summaries(conn)
+        print(f"Summaries written: {count:,}")
+    finally:
+        conn.close()
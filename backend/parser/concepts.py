@@ -0,0 +1,67 @@
+"""
+Process-wide interned concept and measure names for the parsers.
+
+Every fact carries its concept name, but the whole corpus only has a few
+thousand distinct concepts (and a handful of measures). Rather than split
+and allocate new strings for every fact, each raw name is normalised once
+per process and the interned strings are reused:
+
+- Facts for the same concept share one string object, so parser workers
+  hold one copy and pickle sends each name once per result (pickle memoises
+  repeated objects) instead of once per fact.
+- intern_concept() also returns the namespace, so the loader's concepts
+  table insert uses the same split.
+
+The tables stop growing at MAX_INTERNED entries; names beyond that (only
+malformed documents would get there) are still normalised, just not kept.
+
+Usage:
+    concept_raw, concept, namespace = intern_concept(elem.get("name", ""))
+    measure_raw, measure = intern_measure(text)
+"""
+
+from __future__ import annotations
+
+import sys
+
+MAX_INTERNED = 100_000  # Distinct names kept per table, per process
+
+# concept_raw -> (concept_raw, concept, namespace), all interned
+_concepts: dict[str, tuple[str, str, str | None]] = {}
+# measure_raw -> (measure_raw, measure), all interned
+_measures: dict[str, tuple[str, str]] = {}
+
+
+def intern_concept(concept_raw: str) -> tuple[str, str, str | None]:
+    """Interned (concept_raw, concept, namespace) for a raw concept name.
+
+    uk-core:Equity -> ("uk-core:Equity", "Equity", "uk-core");
+    Equity -> ("Equity", "Equity", None).
+    """
+    entry = _concepts.get(concept_raw)
+    if entry is not None:
+        return entry
+
+    concept_raw = sys.intern(concept_raw)
+    if ":" in concept_raw:
+        parts = concept_raw.split(":")
+        entry = (concept_raw, sys.intern(parts[-1]), sys.intern(parts[0]))
+    else:
+        entry = (concept_raw, concept_raw, None)
+    if len(_concepts) < MAX_INTERNED:
+        _concepts[concept_raw] = entry
+    return entry
+
+
+def intern_measure(measure_raw: str) -> tuple[str, str]:
+    """Interned (measure_raw, measure) for a raw unit measure: iso4217:GBP -> GBP."""
+    entry = _measures.get(measure_raw)
+    if entry is not None:
+        return entry
+
+    measure_raw = sys.intern(measure_raw)
+    measure = sys.intern(measure_raw.split(":")[-1]) if ":" in measure_raw else measure_raw
+    entry = (measure_raw, measure)
+    if len(_measures) < MAX_INTERNED:
+        _measures[measure_raw] = entry
+    return entry
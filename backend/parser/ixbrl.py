@@ -25,8 +25,11 @@ from typing import Any
 
 from bs4 import BeautifulSoup, Tag
 
+# The parsed-record classes are slotted (no per-instance __dict__): a filing
+# produces thousands of them in each parser worker. See scripts/bench_parser_memory.py
 
-@dataclass
+
+@dataclass(slots=True)
 class Context:
     """Parsed context from <xbrli:context> element."""
     context_ref: str
@@ -40,7 +43,7 @@ class Context:
     segment_raw: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Unit:
     """Parsed unit from <xbrli:unit> element."""
     unit_ref: str
@@ -48,7 +51,7 @@ class Unit:
     measure: str
 
 
-@dataclass
+@dataclass(slots=True)
 class NumericFact:
     """Parsed numeric fact from <ix:nonFraction> element."""
     concept_raw: str
@@ -63,7 +66,7 @@ class NumericFact:
     format: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TextFact:
     """Parsed text fact from <ix:nonNumeric> element."""
     concept_raw: str
@@ -74,7 +77,7 @@ class TextFact:
     escape: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedIXBRL:
     """Complete parsed result from an iXBRL file."""
     contexts: list[Context] = field(default_factory=list)
@@ -3,18 +3,24 @@ Fast iXBRL Parser using lxml.etree directly.
 
 5-10x faster than BeautifulSoup version by:
 - Using lxml's native XML/HTML parsing (no BeautifulSoup overhead)
-- Using XPath queries with proper namespace handling
-- Single-pass element iteration
-- Pre-compiled XPath patterns
+- Namespace-aware tag dispatch: one tree.iter() pass filtered in C on the
+  standard ix/xbrli tags, so XHTML presentation markup never reaches Python
+- Memoised local names for everything else (no per-element tag splitting)
 
 Maintains identical output format to ixbrl.py for drop-in replacement.
+
+Documents larger than STREAM_THRESHOLD_BYTES are parsed incrementally with
+iterparse (see parse_ixbrl_stream), so peak memory doesn't grow with the
+size of the HTML around the facts.
 """
 
 from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
-from typing import Any
+from io import BytesIO
+from operator import itemgetter
+from typing import Any, BinaryIO
 
 from lxml import etree
 
@@ -23,6 +29,7 @@ from backend.parser.ixbrl import (
     Context, Unit, NumericFact, TextFact, ParsedIXBRL,
     parse_numeric_value, normalize_concept, normalize_measure, parse_int_attr
 )
+from backend.parser.concepts import intern_concept, intern_measure
 
 # Common iXBRL/XBRL namespaces
 NAMESPACES = {
@@ -33,6 +40,42 @@ NAMESPACES = {
     'xlink': 'http://www.w3.org/1999/xlink',
 }
 
+# Inline XBRL 1.1 and 1.0 (older filings)
+_IX_NAMESPACES = ('http://www.xbrl.org/2013/inlineXBRL', 'http://www.xbrl.org/2008/inlineXBRL')
+
+# Clark-notation tags extracted by the parser -> lowercased local name
+_TAG_KINDS = {
+    f"{{{NAMESPACES['xbrli']}}}context": "context",
+    f"{{{NAMESPACES['xbrli']}}}unit": "unit",
+    **{f"{{{ns}}}nonFraction": "nonfraction" for ns in _IX_NAMESPACES},
+    **{f"{{{ns}}}nonNumeric": "nonnumeric" for ns in _IX_NAMESPACES},
+}
+
+# tag -> lowercased local name, memoised (documents share a few hundred tags)
+_local_names: dict[str, str] = {}
+_MAX_LOCAL_NAMES = 10_000
+
+# Documents above this size are parsed with iterparse instead of a full tree
+STREAM_THRESHOLD_BYTES = 2 * 1024 * 1024
+
+# Concepts whose values are used as filing metadata (dates, identifiers).
+# For these, always use text-only extraction even if the element has
+# escape="true", which would otherwise store raw HTML markup.
+_METADATA_CONCEPTS = {
+    "UKCompaniesHouseRegisteredNumber", "CompaniesHouseRegisteredNumber",
+    "EntityCurrentLegalOrRegisteredName", "EntityCurrentLegalName",
+    "BalanceSheetDate", "StartDateForPeriodCoveredByReport",
+    "EndDateForPeriodCoveredByReport",
+}
+
+# nonNumeric start/end tags and their attributes in raw document bytes, for
+# text_fact_ranges (case-insensitive, like the HTML parser fallback)
+_NON_NUMERIC_TAG_RE = re.compile(rb"<(/?)(?:[\w.-]+:)?nonNumeric\b([^>]*)>", re.IGNORECASE)
+_NAME_ATTR_RE = re.compile(rb"""(?<![\w:.-])name\s*=\s*(["'])(.*?)\1""", re.DOTALL)
+_CONTEXT_REF_ATTR_RE = re.compile(
+    rb"""(?<![\w:.-])contextRef\s*=\s*(["'])(.*?)\1""", re.IGNORECASE | re.DOTALL
+)
+
 
 def _get_text(elem) -> str:
     """Get text content of element, stripping whitespace."""
@@ -49,28 +92,42 @@ def _get_all_text(elem) -> str:
     return "".join(elem.itertext()).strip()
 
 
+def _local_name(elem) -> str | None:
+    """Lowercased local name of an element (None for comments/PIs).
+
+    Strips the namespace ({uri}nonFraction) or, in trees from the recovering
+    HTML parser, the prefix (ix:nonfraction), which HTML keeps in the tag.
+    """
+    tag = elem.tag
+    if not isinstance(tag, str):
+        return None
+    local = _local_names.get(tag)
+    if local is None:
+        local = tag.rpartition('}')[2].rpartition(':')[2].lower()
+        if len(_local_names) < _MAX_LOCAL_NAMES:
+            _local_names[tag] = local
+    return local
+
+
+def _get_attr(elem, name: str, default: str | None = None) -> str | None:
+    """Attribute by name, also trying it lowercased as the HTML parser leaves it."""
+    value = elem.get(name)
+    if value is None:
+        value = elem.get(name.lower(), default)
+    return value
+
+
 def _find_child(elem, *local_names):
-    """Find first child with any of the given local names (ignoring namespace)."""
+    """Find first child with any of the given (lowercase) local names."""
     for child in elem:
-        # Get local name (strip namespace)
-        tag = child.tag
-        if isinstance(tag, str):
-            local = tag.split('}')[-1] if '}' in tag else tag
-            if local in local_names:
-                return child
+        if _local_name(child) in local_names:
+            return child
     return None
 
 
 def _find_children(elem, *local_names):
-    """Find all children with any of the given local names."""
-    results = []
-    for child in elem:
-        tag = child.tag
-        if isinstance(tag, str):
-            local = tag.split('}')[-1] if '}' in tag else tag
-            if local in local_names:
-                results.append(child)
-    return results
+    """Find all children with any of the given (lowercase) local names."""
+    return [child for child in elem if _local_name(child) in local_names]
 
 
 def parse_context_fast(context_elem) -> Context:
@@ -97,8 +154,8 @@ def parse_context_fast(context_elem) -> Context:
             period_type = "instant"
             instant_date = _get_text(instant_elem)
         else:
-            start_elem = _find_child(period_elem, "startDate")
-            end_elem = _find_child(period_elem, "endDate")
+            start_elem = _find_child(period_elem, "startdate")
+            end_elem = _find_child(period_elem, "enddate")
             if start_elem is not None or end_elem is not None:
                 period_type = "duration"
                 start_date = _get_text(start_elem) if start_elem is not None else None
@@ -118,13 +175,13 @@ def parse_context_fast(context_elem) -> Context:
     dimensions: dict[str, Any] = {"explicit": [], "typed": []}
 
     if segment_elem is not None:
-        for member in _find_children(segment_elem, "explicitMember"):
+        for member in _find_children(segment_elem, "explicitmember"):
             dimensions["explicit"].append({
                 "dimension": member.get("dimension", ""),
                 "member": _get_text(member)
             })
 
-        for member in _find_children(segment_elem, "typedMember"):
+        for member in _find_children(segment_elem, "typedmember"):
             children = list(member)
             dimensions["typed"].append({
                 "dimension": member.get("dimension", ""),
@@ -150,13 +207,13 @@ def parse_unit_fast(unit_elem) -> Unit:
     """Parse a unit element using lxml."""
     unit_ref = unit_elem.get("id", "")
     measure_elem = _find_child(unit_elem, "measure")
-    measure_raw = _get_text(measure_elem) if measure_elem is not None else ""
-    return Unit(unit_ref=unit_ref, measure_raw=measure_raw, measure=normalize_measure(measure_raw))
+    measure_raw, measure = intern_measure(_get_text(measure_elem) if measure_elem is not None else "")
+    return Unit(unit_ref=unit_ref, measure_raw=measure_raw, measure=measure)
 
 
 def parse_numeric_fact_fast(elem) -> NumericFact:
     """Parse a nonFraction element using lxml."""
-    concept_raw = elem.get("name", "")
+    concept_raw, concept, _ = intern_concept(elem.get("name", ""))
     value_raw = _get_all_text(elem)
     sign = elem.get("sign")
     decimals = parse_int_attr(elem.get("decimals"))
@@ -165,9 +222,9 @@ def parse_numeric_fact_fast(elem) -> NumericFact:
 
     return NumericFact(
         concept_raw=concept_raw,
-        concept=normalize_concept(concept_raw),
-        context_ref=elem.get("contextRef", ""),
-        unit_ref=elem.get("unitRef"),
+        concept=concept,
+        context_ref=_get_attr(elem, "contextRef", ""),
+        unit_ref=_get_attr(elem, "unitRef"),
         value_raw=value_raw,
         value=parse_numeric_value(value_raw, sign, scale, format_attr),
         sign=sign,
@@ -179,7 +236,7 @@ def parse_numeric_fact_fast(elem) -> NumericFact:
 
 def parse_text_fact_fast(elem) -> TextFact:
     """Parse a nonNumeric element using lxml."""
-    concept_raw = elem.get("name", "")
+    concept_raw, concept, _ = intern_concept(elem.get("name", ""))
     escape_attr = elem.get("escape")
 
     if escape_attr:
@@ -195,18 +252,40 @@ def parse_text_fact_fast(elem) -> TextFact:
 
     return TextFact(
         concept_raw=concept_raw,
-        concept=normalize_concept(concept_raw),
-        context_ref=elem.get("contextRef", ""),
+        concept=concept,
+        context_ref=_get_attr(elem, "contextRef", ""),
         value=value if value else None,
         format=elem.get("format"),
         escape=escape_attr,
     )
 
 
+def _metadata_value(fact: TextFact, elem) -> str | None:
+    """Value of a metadata fact: text only, to avoid XBRL markup leaking
+    from escape-attribute elements or PDF-converted filings."""
+    return _get_all_text(elem) if fact.escape else fact.value
+
+
+def _set_metadata(result: ParsedIXBRL, concept: str, value: str | None) -> None:
+    if concept in ("UKCompaniesHouseRegisteredNumber", "CompaniesHouseRegisteredNumber"):
+        result.company_number = value
+    elif concept in ("EntityCurrentLegalOrRegisteredName", "EntityCurrentLegalName"):
+        result.company_name = value
+    elif concept == "BalanceSheetDate":
+        result.balance_sheet_date = value
+    elif concept == "StartDateForPeriodCoveredByReport":
+        result.period_start_date = value
+    elif concept == "EndDateForPeriodCoveredByReport":
+        result.period_end_date = value
+
+
 def parse_ixbrl_fast(html_content: str | bytes) -> ParsedIXBRL:
     """
     Parse an iXBRL HTML file using fast lxml.etree parsing.
 
+    Documents larger than STREAM_THRESHOLD_BYTES are handed to
+    parse_ixbrl_stream; the output is the same either way.
+
     Args:
         html_content: The HTML content as string or bytes
 
@@ -216,6 +295,13 @@ def parse_ixbrl_fast(html_content: str | bytes) -> ParsedIXBRL:
     if isinstance(html_content, str):
         html_content = html_content.encode('utf-8')
 
+    if len(html_content) > STREAM_THRESHOLD_BYTES:
+        return parse_ixbrl_stream(html_content)
+    return _parse_tree(html_content)
+
+
+def _parse_tree(html_content: bytes) -> ParsedIXBRL:
+    """parse_ixbrl_fast for a document parsed into a full tree."""
     # Try XML parser first, fall back to HTML
     try:
         tree = etree.fromstring(html_content)
@@ -226,30 +312,12 @@ def parse_ixbrl_fast(html_content: str | bytes) -> ParsedIXBRL:
 
     result = ParsedIXBRL()
 
-    # Collect all elements by local name in single pass
-    contexts = []
-    units = []
-    numeric_facts = []
-    text_facts = []
-
-    for elem in tree.iter():
-        if not isinstance(elem.tag, str):
-            continue
-
-        # Get local name
-        local = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
-        local_lower = local.lower()
-
-        if local_lower == "context":
-            contexts.append(elem)
-        elif local_lower == "unit":
-            units.append(elem)
-        elif local_lower == "nonfraction":
-            if elem.get("name"):
-                numeric_facts.append(elem)
-        elif local_lower == "nonnumeric":
-            if elem.get("name"):
-                text_facts.append(elem)
+    # Collect the extracted elements by kind, in document order
+    found = _collect_elements(tree)
+    contexts = found["context"]
+    units = found["unit"]
+    numeric_facts = [elem for elem in found["nonfraction"] if elem.get("name")]
+    text_facts = [elem for elem in found["nonnumeric"] if elem.get("name")]
 
     # Parse contexts (dedupe by id)
     seen_ctx = set()
@@ -271,37 +339,132 @@ def parse_ixbrl_fast(html_content: str | bytes) -> ParsedIXBRL:
     for elem in numeric_facts:
         result.numeric_facts.append(parse_numeric_fact_fast(elem))
 
-    # Concepts whose values are used as filing metadata (dates, identifiers).
-    # For these, always use text-only extraction even if the element has
-    # escape="true", which would otherwise store raw HTML markup.
-    _METADATA_CONCEPTS = {
-        "UKCompaniesHouseRegisteredNumber", "CompaniesHouseRegisteredNumber",
-        "EntityCurrentLegalOrRegisteredName", "EntityCurrentLegalName",
-        "BalanceSheetDate", "StartDateForPeriodCoveredByReport",
-        "EndDateForPeriodCoveredByReport",
-    }
-
     for elem in text_facts:
         fact = parse_text_fact_fast(elem)
         result.text_facts.append(fact)
-
-        # Extract metadata using text-only value to avoid XBRL markup
-        # leaking from escape-attribute elements or PDF-converted filings
         if fact.concept in _METADATA_CONCEPTS:
-            metadata_value = _get_all_text(elem) if fact.escape else fact.value
-        else:
+            _set_metadata(result, fact.concept, _metadata_value(fact, elem))
+
+    return result
+
+
+def _collect_elements(tree) -> dict[str, list]:
+    """Context, unit and fact elements of a tree, by lowercased local name.
+
+    Dispatches on the standard namespaced tags (_TAG_KINDS), matched by
+    lxml while iterating. Any kind that pass finds none of (trees from the
+    recovering HTML parser, or an ix namespace not in _IX_NAMESPACES) is
+    then collected by matching every element's local name, as
+    parse_ixbrl_stream does, so both parses return the same facts.
+    """
+    found: dict[str, list] = {"context": [], "unit": [], "nonfraction": [], "nonnumeric": []}
+    for elem in tree.iter(*_TAG_KINDS):
+        found[_TAG_KINDS[elem.tag]].append(elem)
+
+    missing = {kind: elems for kind, elems in found.items() if not elems}
+    if missing:
+        for elem in tree.iter():
+            elems = missing.get(_local_name(elem))
+            if elems is not None:
+                elems.append(elem)
+    return found
+
+
+def parse_ixbrl_stream(source: str | bytes | BinaryIO) -> ParsedIXBRL:
+    """
+    Parse an iXBRL document incrementally with lxml.etree.iterparse.
+
+    Each context, unit and fact is parsed when its end tag is reached, and
+    every element is cleared (with its earlier siblings removed) once
+    nothing still open needs it. Only the path to the current element and
+    the subtree of any fact being read stay in memory, so peak memory is
+    the output plus the largest single fact, whatever the document size.
+
+    Output is identical to the tree-based parse: list slots are reserved at
+    each start tag, so nested facts keep document order, and metadata
+    concepts are applied in document order after the pass.
+
+    Args:
+        source: Document bytes (or str), or a binary file object
+
+    Returns:
+        ParsedIXBRL containing all extracted contexts, units, and facts
+    """
+    if isinstance(source, str):
+        source = source.encode('utf-8')
+    if isinstance(source, bytes):
+        source = BytesIO(source)
+
+    # Try XML parser first, fall back to HTML (restarting from the beginning)
+    start = source.tell()
+    try:
+        return _parse_stream(source, html=False)
+    except etree.XMLSyntaxError:
+        source.seek(start)
+        return _parse_stream(source, html=True)
+
+
+def _parse_stream(source: BinaryIO, html: bool) -> ParsedIXBRL:
+    result = ParsedIXBRL()
+    seen_ctx: set[str] = set()
+    seen_units: set[str] = set()
+    metadata: list[tuple[int, str, str | None]] = []  # (text fact slot, concept, value)
+
+    # Captured elements still open: (element, local name, result slot)
+    open_elems: list[tuple[Any, str, int]] = []
+
+    for event, elem in etree.iterparse(
+        source, events=("start", "end"), html=html, recover=html
+    ):
+        if event == "start":
+            local_lower = _local_name(elem)
+            if local_lower == "context":
+                ctx_id = elem.get("id")
+                if not ctx_id or ctx_id in seen_ctx:
+                    continue
+                seen_ctx.add(ctx_id)
+                target = result.contexts
+            elif local_lower == "unit":
+                unit_id = elem.get("id")
+                if not unit_id or unit_id in seen_units:
+                    continue
+                seen_units.add(unit_id)
+                target = result.units
+            elif local_lower == "nonfraction" and elem.get("name"):
+                target = result.numeric_facts
+            elif local_lower == "nonnumeric" and elem.get("name"):
+                target = result.text_facts
+            else:
+                continue
+            open_elems.append((elem, local_lower, len(target)))
+            target.append(None)
             continue
 
-        if fact.concept in ("UKCompaniesHouseRegisteredNumber", "CompaniesHouseRegisteredNumber"):
-            result.company_number = metadata_value
-        elif fact.concept in ("EntityCurrentLegalOrRegisteredName", "EntityCurrentLegalName"):
-            result.company_name = metadata_value
-        elif fact.concept == "BalanceSheetDate":
-            result.balance_sheet_date = metadata_value
-        elif fact.concept == "StartDateForPeriodCoveredByReport":
-            result.period_start_date = metadata_value
-        elif fact.concept == "EndDateForPeriodCoveredByReport":
-            result.period_end_date = metadata_value
+        if open_elems and open_elems[-1][0] is elem:
+            _, local_lower, slot = open_elems.pop()
+            if local_lower == "context":
+                result.contexts[slot] = parse_context_fast(elem)
+            elif local_lower == "unit":
+                result.units[slot] = parse_unit_fast(elem)
+            elif local_lower == "nonfraction":
+                result.numeric_facts[slot] = parse_numeric_fact_fast(elem)
+            else:
+                fact = parse_text_fact_fast(elem)
+                result.text_facts[slot] = fact
+                if fact.concept in _METADATA_CONCEPTS:
+                    metadata.append((slot, fact.concept, _metadata_value(fact, elem)))
+
+        # Nothing open needs this element's content any more: drop it and
+        # the already-processed siblings before it
+        if not open_elems:
+            elem.clear()
+            parent = elem.getparent()
+            if parent is not None:
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+    for _, concept, value in sorted(metadata, key=itemgetter(0)):
+        _set_metadata(result, concept, value)
 
     return result
 
@@ -309,9 +472,50 @@ def parse_ixbrl_fast(html_content: str | bytes) -> ParsedIXBRL:
 def parse_ixbrl_file_fast(filepath: str) -> ParsedIXBRL:
     """Parse an iXBRL file from disk using fast parser."""
     with open(filepath, "rb") as f:
+        f.seek(0, 2)
+        if f.tell() > STREAM_THRESHOLD_BYTES:
+            # Stream from the file rather than reading it into memory
+            f.seek(0)
+            return parse_ixbrl_stream(f)
+        f.seek(0)
         return parse_ixbrl_fast(f.read())
 
 
+def text_fact_ranges(content: bytes) -> dict[tuple[str, str], list[tuple[int, int]]]:
+    """
+    Byte ranges of nonNumeric elements' content within the raw document.
+
+    Used by the loader's "deferred" text-fact policy, which stores where a
+    fact's content is instead of the content. lxml doesn't report byte
+    offsets, so this pairs the start and end tags in the bytes themselves.
+
+    Returns:
+        (name, contextRef) -> [(offset, length), ...] in document order, for
+        each nonNumeric element with both attributes
+    """
+    ranges: dict[tuple[str, str], list[tuple[int, int]]] = {}
+    open_tags: list[tuple[bytes, int]] = []
+    for match in _NON_NUMERIC_TAG_RE.finditer(content):
+        closing, attrs = match.group(1), match.group(2)
+        if closing:
+            if not open_tags:
+                continue
+            attrs, start = open_tags.pop()
+            end = match.start()
+        elif attrs.endswith(b"/"):
+            # Self-closing: empty, but kept so later ranges stay in step
+            start = end = match.end()
+        else:
+            open_tags.append((attrs, match.end()))
+            continue
+        name = _NAME_ATTR_RE.search(attrs)
+        context_ref = _CONTEXT_REF_ATTR_RE.search(attrs)
+        if name and context_ref:
+            key = (name.group(2).decode("utf-8"), context_ref.group(2).decode("utf-8"))
+            ranges.setdefault(key, []).append((start, end - start))
+    return ranges
+
+
 # Alias for drop-in replacement
 parse_ixbrl = parse_ixbrl_fast
 parse_ixbrl_file = parse_ixbrl_file_fast
@@ -1,2 +1,169 @@
 # Pure XBRL parser for XML files
-# See docs/DATA_SPECIFICATION.md Section 3.2 for format details
+# See backend/docs/SPEC.md Section 3.2 for format details
+"""
+Streaming parser for pure XBRL instance documents (.xml, source_type xbrl_xml).
+
+Older filings are XBRL instances rather than inline XBRL: an <xbrli:xbrl>
+root whose children are the contexts, units and facts themselves. A fact
+is any element with a contextRef attribute, named by its own tag
+(<uk-gaap:Equity contextRef="..." unitRef="...">1234</uk-gaap:Equity>),
+numeric if it has a unitRef. Facts may also be nested inside tuples.
+
+Produces the same ParsedIXBRL as the iXBRL parsers, so the loader treats
+both alike:
+- concept_raw is "prefix:LocalName", using the prefix from the document
+- numeric values are already signed and scaled, so sign/scale/format are
+  None; xsi:nil facts have value None
+- contexts and units are parsed with the iXBRL parser's functions (the
+  xbrli elements are the same)
+
+Parsed with iterparse: each top-level element is dropped once handled, so
+memory doesn't grow with the instance's size. A document whose root isn't
+<xbrli:xbrl> (iXBRL saved as .xml) is handed to parse_ixbrl_fast.
+"""
+
+from __future__ import annotations
+
+from io import BytesIO
+from typing import BinaryIO
+
+from lxml import etree
+
+from backend.parser.concepts import intern_concept
+from backend.parser.ixbrl import (
+    NumericFact, ParsedIXBRL, TextFact, parse_int_attr, parse_numeric_value
+)
+from backend.parser.ixbrl_fast import (
+    NAMESPACES, _METADATA_CONCEPTS, _get_all_text, _set_metadata,
+    parse_context_fast, parse_ixbrl_fast, parse_unit_fast,
+)
+
+_XBRL_ROOT = f"{{{NAMESPACES['xbrli']}}}xbrl"
+_CONTEXT_TAG = f"{{{NAMESPACES['xbrli']}}}context"
+_UNIT_TAG = f"{{{NAMESPACES['xbrli']}}}unit"
+_NIL_ATTR = "{http://www.w3.org/2001/XMLSchema-instance}nil"
+
+
+def _concept_name(elem) -> str:
+    """prefix:LocalName for a fact element, as an iXBRL name attribute would give."""
+    local = etree.QName(elem).localname
+    return f"{elem.prefix}:{local}" if elem.prefix else local
+
+
+def parse_numeric_fact_xbrl(elem) -> NumericFact:
+    """Parse a numeric fact (element with unitRef)."""
+    concept_raw, concept, _ = intern_concept(_concept_name(elem))
+    nil = elem.get(_NIL_ATTR) == "true"
+    value_raw = "" if nil else (elem.text or "").strip()
+
+    return NumericFact(
+        concept_raw=concept_raw,
+        concept=concept,
+        context_ref=elem.get("contextRef", ""),
+        unit_ref=elem.get("unitRef"),
+        value_raw=value_raw,
+        value=None if nil else parse_numeric_value(value_raw),
+        decimals=parse_int_attr(elem.get("decimals")),
+    )
+
+
+def parse_text_fact_xbrl(elem) -> TextFact:
+    """Parse a non-numeric fact (element with contextRef but no unitRef)."""
+    concept_raw, concept, _ = intern_concept(_concept_name(elem))
+    value = None if elem.get(_NIL_ATTR) == "true" else _get_all_text(elem)
+
+    return TextFact(
+        concept_raw=concept_raw,
+        concept=concept,
+        context_ref=elem.get("contextRef", ""),
+        value=value if value else None,
+    )
+
+
+def parse_xbrl(source: str | bytes | BinaryIO) -> ParsedIXBRL:
+    """
+    Parse a pure XBRL instance document.
+
+    Args:
+        source: Document bytes (or str), or a binary file object
+
+    Returns:
+        ParsedIXBRL containing all extracted contexts, units, and facts
+    """
+    if isinstance(source, str):
+        source = source.encode('utf-8')
+    if isinstance(source, bytes):
+        source = BytesIO(source)
+
+    start = source.tell()
+    result = ParsedIXBRL()
+    seen_ctx: set[str] = set()
+    seen_units: set[str] = set()
+    root = None
+
+    for event, elem in etree.iterparse(source, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+                if elem.tag != _XBRL_ROOT:
+                    # Not an instance document: inline XBRL with an .xml name
+                    source.seek(start)
+                    return parse_ixbrl_fast(source.read())
+            continue
+
+        tag = elem.tag
+        if tag == _CONTEXT_TAG:
+            ctx_id = elem.get("id")
+            if ctx_id and ctx_id not in seen_ctx:
+                seen_ctx.add(ctx_id)
+                result.contexts.append(parse_context_fast(elem))
+        elif tag == _UNIT_TAG:
+            unit_id = elem.get("id")
+            if unit_id and unit_id not in seen_units:
+                seen_units.add(unit_id)
+                result.units.append(parse_unit_fast(elem))
+        elif isinstance(tag, str) and elem.get("contextRef") is not None:
+            if elem.get("unitRef") is not None:
+                result.numeric_facts.append(parse_numeric_fact_xbrl(elem))
+            else:
+                fact = parse_text_fact_xbrl(elem)
+                result.text_facts.append(fact)
+                if fact.concept in _METADATA_CONCEPTS:
+                    _set_metadata(result, fact.concept, fact.value)
+
+        # Top-level elements (contexts, units, facts, tuples) are finished
+        # with once they close: drop them and everything before them
+        if elem.getparent() is root:
+            elem.clear()
+            while elem.getprevious() is not None:
+                del root[0]
+
+    return result
+
+
+def parse_xbrl_file(filepath: str) -> ParsedIXBRL:
+    """Parse an XBRL instance file from disk, streaming it."""
+    with open(filepath, "rb") as f:
+        return parse_xbrl(f)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    if len(sys.argv) < 2:
+        print("Usage: python -m backend.parser.xbrl <filepath>")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    result = parse_xbrl_file(sys.argv[1])
+    elapsed = time.perf_counter() - start
+
+    print(f"Parse time: {elapsed*1000:.1f}ms")
+    print(f"Company: {result.company_name} ({result.company_number})")
+    print(f"Balance Sheet Date: {result.balance_sheet_date}")
+    print(f"Period: {result.period_start_date} to {result.period_end_date}")
+    print(f"\nContexts: {len(result.contexts)}")
+    print(f"Units: {len(result.units)}")
+    print(f"Numeric Facts: {len(result.numeric_facts)}")
+    print(f"Text Facts: {len(result.text_facts)}")
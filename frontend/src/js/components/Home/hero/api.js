@@ -29,6 +29,16 @@
     return request(`/search?q=${encodeURIComponent(query)}&limit=${limit}`);
   }
 
+  /**
+   * Typeahead suggestions: companies whose name or number starts with query.
+   * @param {string} query - Prefix (min 1 char)
+   * @param {number} [limit=10] - Max results (1-50)
+   * @returns {Promise<Array<{company_number: string, name: string, jurisdiction: string|null}>>}
+   */
+  function suggestCompanies(query, limit = 10) {
+    return request(`/suggest?q=${encodeURIComponent(query)}&limit=${limit}`);
+  }
+
   /**
    * Get company profile and filings.
    * @param {string} number - Companies House registration number
@@ -47,5 +57,5 @@
     return request(`/filing/${filingId}/facts`);
   }
 
-  window.CompanyWiseAPI = { searchCompanies, getCompany, getFilingFacts };
+  window.CompanyWiseAPI = { searchCompanies, suggestCompanies, getCompany, getFilingFacts };
 })();
@@ -761,21 +761,25 @@
     },
 
     derivePriorPeriod(facts, cur) {
-      // Look for a duration context whose end_date matches the day before our start_date (approx)
+      // The duration context ending closest to our start_date (within 5 days),
+      // then the earliest start - same rule as backend/loader/summaries.py
       if (!facts.contexts) return null;
+      let best = null;
+      let bestGap = null;
       for (const ctx of facts.contexts) {
         if (ctx.period_type === 'duration' && ctx.end_date && ctx.end_date !== cur.end && ctx.start_date !== cur.start) {
-          // Check this looks like a prior-year period (roughly 1 year before)
           const priorEnd = new Date(ctx.end_date);
           const curStart = new Date(cur.start);
-          const diffDays = (curStart - priorEnd) / (1000 * 60 * 60 * 24);
-          if (diffDays >= -5 && diffDays <= 5) {
-            // Also find the matching instant date
-            return { start: ctx.start_date, end: ctx.end_date, instant: ctx.end_date };
+          const gap = Math.abs(Math.round((curStart - priorEnd) / (1000 * 60 * 60 * 24)));
+          if (gap <= 5 && (best === null || gap < bestGap ||
+              (gap === bestGap && (ctx.start_date || '') < (best.start_date || '')))) {
+            best = ctx;
+            bestGap = gap;
           }
         }
       }
-      return null;
+      // The prior instant is the prior period's end
+      return best ? { start: best.start_date, end: best.end_date, instant: best.end_date } : null;
     },
 
     buildAddressSummary(facts) {
@@ -54,7 +54,7 @@
           return;
         }
 
-        this.debounceTimer = setTimeout(() => this.executeSearch(query), DEBOUNCE_MS);
+        this.debounceTimer = setTimeout(() => this.executeSearch(query, true), DEBOUNCE_MS);
       });
 
       // Re-show dropdown on focus if we have results
@@ -83,10 +83,13 @@
       });
     },
 
-    async executeSearch(query) {
+    async executeSearch(query, typeahead = false) {
       this.showDropdownLoading();
       try {
-        const results = await window.CompanyWiseAPI.searchCompanies(query);
+        const api = window.CompanyWiseAPI;
+        const results = typeahead
+          ? await api.suggestCompanies(query)
+          : await api.searchCompanies(query);
         this.lastResults = results;
         this.renderDropdown(results);
       } catch (err) {
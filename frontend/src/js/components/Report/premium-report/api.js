@@ -38,5 +38,28 @@
     return request(`/filing/${filingId}/facts`);
   }
 
-  window.CompanyWisePremiumAPI = { getCompany, getFilingFacts };
+  /**
+   * Get company profile, filings and the latest filing's report facts in one call.
+   * @param {string} number - Companies House registration number
+   * @returns {Promise<{company: Object, filings: Array, facts: Object|null}>}
+   */
+  function getCompanyReport(number) {
+    return request(`/company/${encodeURIComponent(number)}/report`);
+  }
+
+  /**
+   * Get a filing's precomputed headline figures.
+   * @param {number} filingId - Database filing ID
+   * @returns {Promise<Object|null>} null if the filing has no summary (not backfilled yet)
+   */
+  async function getFilingSummary(filingId) {
+    try {
+      return await request(`/filing/${filingId}/summary`);
+    } catch (err) {
+      if (err.status === 404) return null;
+      throw err;
+    }
+  }
+
+  window.CompanyWisePremiumAPI = { getCompany, getFilingFacts, getCompanyReport, getFilingSummary };
 })();
@@ -86,20 +86,17 @@
         var API = window.CompanyWisePremiumAPI;
         var Transformer = window.CompanyWisePremiumTransformer;
 
-        var companyData = await API.getCompany(companyNumber);
-
-        // Fetch filing facts (non-critical)
-        var factsData = null;
-        var latestFiling = (companyData.filings || [])[0];
-        if (latestFiling) {
-          try {
-            factsData = await API.getFilingFacts(latestFiling.id);
-          } catch (_) {
-            // Non-critical — render without financials
-          }
-        }
+        // Company, filings and latest filing's report facts in one request
+        var companyData = await API.getCompanyReport(companyNumber);
+
+        // Headline figures come from the latest filing's precomputed summary
+        // (/api/filing/{id}/summary), which /report already includes
+        var latest = (companyData.filings || [])[0];
+        var summary = companyData.summary !== undefined
+          ? companyData.summary
+          : (latest ? await API.getFilingSummary(latest.id) : null);
 
-        var report = Transformer.transform(companyData, factsData);
+        var report = Transformer.transform(companyData, companyData.facts, summary);
         this.company = report;
         this.render(report);
         this.initScrollReveal();
@@ -187,22 +187,28 @@
   }
 
   // ---- Prior Period Derivation ----
-  // Same logic as hero.js:derivePriorPeriod
+  // Same logic as hero.js:derivePriorPeriod and backend/loader/summaries.py:
+  // the duration ending closest to the current start (within 5 days), then
+  // the earliest start, whatever the order of the contexts
 
   function derivePriorPeriod(facts, cur) {
     if (!facts.contexts) return null;
+    var best = null;
+    var bestGap = null;
     for (var i = 0; i < facts.contexts.length; i++) {
       var ctx = facts.contexts[i];
       if (ctx.period_type === 'duration' && ctx.end_date && ctx.end_date !== cur.end && ctx.start_date !== cur.start) {
         var priorEnd = new Date(ctx.end_date);
         var curStart = new Date(cur.start);
-        var diffDays = (curStart - priorEnd) / (1000 * 60 * 60 * 24);
-        if (diffDays >= -5 && diffDays <= 5) {
-          return { start: ctx.start_date, end: ctx.end_date, instant: ctx.end_date };
+        var gap = Math.abs(Math.round((curStart - priorEnd) / (1000 * 60 * 60 * 24)));
+        if (gap <= 5 && (best === null || gap < bestGap ||
+            (gap === bestGap && (ctx.start_date || '') < (best.start_date || '')))) {
+          best = ctx;
+          bestGap = gap;
         }
       }
     }
-    return null;
+    return best ? { start: best.start_date, end: best.end_date, instant: best.end_date } : null;
   }
 
   // ---- Financial Extraction ----
@@ -264,20 +270,7 @@
 
     var employees = getDuration('AverageNumberEmployeesDuringPeriod');
 
-    // Only build financials if at least one metric exists
-    var hasAnything = turnover || grossProfit || operatingProfit || profitLoss || netAssets || equity ||
-      currentAssets !== undefined || currentLiabilities !== undefined ||
-      cash !== undefined || debtors !== undefined || stocks !== undefined ||
-      fixedAssets !== undefined || netCurrentAssets !== undefined ||
-      totalAssetsLessCurrentLiabilities !== undefined || creditors !== undefined ||
-      creditorsAfterOneYear !== undefined || employees;
-
-    if (!hasAnything) return null;
-
-    return {
-      accountsDate: bsDate,
-      periodStart: pStart,
-      periodEnd: pEnd,
+    return buildFinancials(filing, {
       turnover: turnover,
       grossProfit: grossProfit,
       operatingProfit: operatingProfit,
@@ -295,7 +288,64 @@
       creditors: creditors,
       creditorsAfterOneYear: creditorsAfterOneYear,
       employees: employees
-    };
+    });
+  }
+
+  // ---- Financials from the Precomputed Summary ----
+  // /api/filing/{id}/summary: the same selections as extractFinancials,
+  // made once at load time (backend/loader/summaries.py)
+
+  function summaryFinancials(summary, filing) {
+    if (!summary || !filing) return null;
+
+    function getPair(column) {
+      var cur = summary[column];
+      var pri = summary[column + '_prior'];
+      if (cur == null && pri == null) return null;
+      return { current: cur, previous: pri };
+    }
+
+    // undefined, as for a missing fact, so empty rows aren't rendered
+    function getSingle(column) {
+      return summary[column] == null ? undefined : summary[column];
+    }
+
+    return buildFinancials(filing, {
+      turnover: getPair('turnover'),
+      grossProfit: getPair('gross_profit'),
+      operatingProfit: getPair('operating_profit'),
+      profitLoss: getPair('profit_loss'),
+      netAssets: getPair('net_assets'),
+      equity: getPair('equity'),
+      currentAssets: getSingle('current_assets'),
+      currentLiabilities: getSingle('current_liabilities'),
+      cash: getSingle('cash'),
+      debtors: getSingle('debtors'),
+      stocks: getSingle('stocks'),
+      fixedAssets: getSingle('fixed_assets'),
+      netCurrentAssets: getSingle('net_current_assets'),
+      totalAssetsLessCurrentLiabilities: getSingle('total_assets_less_current_liabilities'),
+      creditors: getSingle('creditors'),
+      creditorsAfterOneYear: getSingle('creditors_after_one_year'),
+      employees: getPair('employees')
+    });
+  }
+
+  function buildFinancials(filing, m) {
+    // Only build financials if at least one metric exists
+    var hasAnything = m.turnover || m.grossProfit || m.operatingProfit || m.profitLoss || m.netAssets || m.equity ||
+      m.currentAssets !== undefined || m.currentLiabilities !== undefined ||
+      m.cash !== undefined || m.debtors !== undefined || m.stocks !== undefined ||
+      m.fixedAssets !== undefined || m.netCurrentAssets !== undefined ||
+      m.totalAssetsLessCurrentLiabilities !== undefined || m.creditors !== undefined ||
+      m.creditorsAfterOneYear !== undefined || m.employees;
+
+    if (!hasAnything) return null;
+
+    m.accountsDate = filing.balance_sheet_date;
+    m.periodStart = filing.period_start_date;
+    m.periodEnd = filing.period_end_date;
+    return m;
   }
 
   // ---- Health Signals ----
@@ -394,7 +444,7 @@
 
   // ---- Main Transform Function ----
 
-  function transform(companyData, factsData) {
+  function transform(companyData, factsData, summary) {
     var company = companyData.company;
     var filings = companyData.filings || [];
     var latest = filings[0] || null;
@@ -420,7 +470,10 @@
     }
 
     // -- Financials (current + prior year) --
-    var financials = factsData ? extractFinancials(factsData, latest) : null;
+    // From the filing's summary; derived from the facts if it has none yet
+    var financials = summary
+      ? summaryFinancials(summary, latest)
+      : (factsData ? extractFinancials(factsData, latest) : null);
 
     // -- Health signals --
     var signals = buildSignals(financials, filing);
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for bulk_loader.normalize_date_to_iso().
+
+Times the date normaliser on a workload shaped like a bulk load: a few
+thousand distinct non-ISO date strings (long text, numeric spaced, dotted,
+slashed, dashed, US text) recurring many times over. Compares:
+
+- strptime:  the strptime format cascade alone (the previous implementation)
+- tokenizer: the hand-written tokenizer alone
+- uncached:  the full normaliser (cleanup + tokenizer + fallback), no memo
+- cached:    normalize_date_to_iso() as the loader calls it
+
+Before timing, checks the tokenizer agrees with strptime on every sample,
+including invalid dates and near-miss formats.
+
+Usage:
+    python scripts/bench_dates.py
+    python scripts/bench_dates.py --calls 500000 --distinct 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.loader.bulk_loader import (
+    _normalize_date,
+    _strptime_date,
+    _tokenize_date,
+    normalize_date_to_iso,
+)
+
+# One renderer per documented non-ISO format
+FORMATTERS = [
+    lambda d: f"{d.day} {d:%B %Y}",
+    lambda d: f"{d:%d %B %Y}",
+    lambda d: f"{d:%d %m %Y}",
+    lambda d: f"{d.day} {d.month} {d.year}",
+    lambda d: f"{d.day}.{d.month}.{d:%y}",
+    lambda d: f"{d:%d.%m.%Y}",
+    lambda d: f"{d:%d/%m/%Y}",
+    lambda d: f"{d.day}-{d.month}-{d.year}",
+    lambda d: f"{d:%B} {d.day}, {d.year}",
+]
+
+# Strings the tokenizer must reject or agree with strptime on
+EDGE_CASES = [
+    "31 February 2023", "29 February 2024", "29.2.23", "0.1.22", "1.13.22",
+    "28 FEBRUARY 2023", "february 28, 2023", "28 Feb 2023", "Feb 28, 2023",
+    "28-2-23", "28/2/23", "2023/02/28", "28.02.69", "28.02.68", "1 1 0999",
+    "28 02 2023 extra", "February 28 2023", "February 28 ,2023", "28..2.23",
+    "1.3.2022", "001.3.22", "1 3 22", "28 ２ 2023", "Twenty 2 2023",
+]
+
+
+def build_samples(distinct: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    start = date(1995, 1, 1)
+    samples = set(EDGE_CASES)
+    while len(samples) < distinct:
+        day = start + timedelta(days=rng.randrange(365 * 32))
+        samples.add(rng.choice(FORMATTERS)(day))
+    return sorted(samples)
+
+
+def check_agreement(samples: list[str]) -> int:
+    mismatches = 0
+    for sample in samples:
+        fast = _tokenize_date(sample)
+        if fast is not None and fast != _strptime_date(sample):
+            mismatches += 1
+            print(f"  MISMATCH {sample!r}: tokenizer={fast!r} strptime={_strptime_date(sample)!r}")
+        elif fast is None and _strptime_date(sample) is not None:
+            print(f"  fallback {sample!r} -> {_strptime_date(sample)!r}")
+    return mismatches
+
+
+def bench(name: str, fn, workload: list[str]) -> float:
+    start = time.perf_counter()
+    for value in workload:
+        fn(value)
+    elapsed = time.perf_counter() - start
+    print(f"  {name:<10} {elapsed:8.3f}s  {len(workload) / elapsed:>12,.0f} dates/s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark normalize_date_to_iso()")
+    parser.add_argument("--calls", type=int, default=200_000, help="Dates normalised per run")
+    parser.add_argument("--distinct", type=int, default=3_000, help="Distinct date strings")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    args = parser.parse_args()
+    # Edge cases that don't parse would log a warning on every uncached call
+    logging.getLogger("backend.loader.bulk_loader").setLevel(logging.ERROR)
+
+    samples = build_samples(args.distinct, args.seed)
+    print(f"Checking tokenizer against strptime on {len(samples):,} strings...")
+    mismatches = check_agreement(samples)
+    if mismatches:
+        print(f"{mismatches} mismatches")
+        sys.exit(1)
+
+    workload = random.Random(args.seed).choices(samples, k=args.calls)
+    print(f"\n{args.calls:,} calls over {len(samples):,} distinct strings:")
+    baseline = bench("strptime", _strptime_date, workload)
+    bench("tokenizer", _tokenize_date, workload)
+    bench("uncached", _normalize_date.__wrapped__, workload)
+    _normalize_date.cache_clear()
+    cached = bench("cached", normalize_date_to_iso, workload)
+    info = _normalize_date.cache_info()
+    print(f"\nCache: {info.hits:,} hits, {info.misses:,} misses (maxsize {info.maxsize:,})")
+    print(f"Cached vs strptime: {baseline / cached:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark the fast parser's element dispatch against a per-element scan.
+
+parse_ixbrl_fast() used to visit every element of the tree in Python,
+splitting and lowercasing each tag to find contexts, units and facts.
+It now lets lxml filter on the standard namespaced tags
+(ixbrl_fast._collect_elements). For documents from bulk ZIP files, this
+times:
+
+- scan:      the previous per-element loop (reproduced below)
+- dispatch:  _collect_elements()
+- parse:     the whole of parse_ixbrl_fast(), for scale
+
+and checks both select the same elements, and that the tree parse and
+parse_ixbrl_stream() (used above STREAM_THRESHOLD_BYTES) agree on every
+document; it exits non-zero if they don't.
+
+Usage:
+    python scripts/bench_parser_dispatch.py scripts/data/daily/Accounts_Bulk_Data-2024-01-02.zip
+    python scripts/bench_parser_dispatch.py scripts/data/daily/*.zip --limit 2000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+import time
+import zipfile
+from pathlib import Path
+
+from lxml import etree
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.parser.ixbrl_fast import (
+    _collect_elements, _parse_tree, parse_ixbrl_fast, parse_ixbrl_stream
+)
+
+
+def scan_elements(tree) -> dict[str, list]:
+    """The previous collection loop: split and lowercase every tag."""
+    found: dict[str, list] = {"context": [], "unit": [], "nonfraction": [], "nonnumeric": []}
+    for elem in tree.iter():
+        if not isinstance(elem.tag, str):
+            continue
+        local = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
+        elems = found.get(local.lower())
+        if elems is not None:
+            elems.append(elem)
+    return found
+
+
+def same_elements(tree) -> bool:
+    scanned, dispatched = scan_elements(tree), _collect_elements(tree)
+    return all(
+        len(scanned[kind]) == len(dispatched[kind])
+        and all(a is b for a, b in zip(scanned[kind], dispatched[kind]))
+        for kind in scanned
+    )
+
+
+def iter_documents(zip_paths: list[Path], limit: int):
+    """Yield document bytes from bulk ZIPs, including CIC inner files."""
+    count = 0
+    for zip_path in zip_paths:
+        with zipfile.ZipFile(zip_path) as zf:
+            for name in zf.namelist():
+                if name.endswith('/') or name.startswith('__'):
+                    continue
+                content = zf.read(name)
+                if name.lower().endswith('.zip'):
+                    with zipfile.ZipFile(io.BytesIO(content)) as inner:
+                        docs = [
+                            inner.read(entry) for entry in inner.namelist()
+                            if entry.lower().endswith(('.xhtml', '.html', '.xml'))
+                        ]
+                else:
+                    docs = [content]
+                for doc in docs:
+                    yield doc
+                    count += 1
+                    if count >= limit:
+                        return
+
+
+def parse_tree(content: bytes):
+    try:
+        return etree.fromstring(content)
+    except etree.XMLSyntaxError:
+        return etree.fromstring(content, etree.HTMLParser(recover=True))
+
+
+def bench(name: str, fn, items, repeat: int, total_elements: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            fn(item)
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {name:<10} {elapsed:8.3f}s  {total_elements / elapsed / 1e6:8.1f}M elements/s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parser element dispatch")
+    parser.add_argument("zips", nargs="+", type=Path, help="Bulk data ZIP files")
+    parser.add_argument("--limit", type=int, default=1000, help="Documents to parse")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes over the documents")
+    args = parser.parse_args()
+
+    docs = list(iter_documents(args.zips, args.limit))
+    trees = [parse_tree(doc) for doc in docs]
+    total_elements = sum(1 for tree in trees for _ in tree.iter())
+    print(f"{len(docs):,} documents, {total_elements:,} elements")
+
+    mismatches = sum(1 for tree in trees if not same_elements(tree))
+    print(f"Documents where dispatch and scan differ: {mismatches}")
+    parse_mismatches = sum(1 for doc in docs if _parse_tree(doc) != parse_ixbrl_stream(doc))
+    print(f"Documents where tree and stream parses differ: {parse_mismatches}\n")
+
+    scan = bench("scan", scan_elements, trees, args.repeat, total_elements)
+    dispatch = bench("dispatch", _collect_elements, trees, args.repeat, total_elements)
+    parse = bench("parse", parse_ixbrl_fast, docs, args.repeat, total_elements)
+    print(f"\nDispatch vs scan: {scan / dispatch:.1f}x; "
+          f"saves {(scan - dispatch) / (parse + scan - dispatch) * 100:.0f}% of parse time")
+
+    if parse_mismatches:
+        sys.exit(f"{parse_mismatches} documents parse differently as a tree and as a stream")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Memory and pickling benchmark for the parser's record classes.
+
+Parses documents from bulk ZIP files with the fast parser, then compares
+the slotted dataclasses in backend/parser/ixbrl.py (Context, Unit,
+NumericFact, TextFact, ParsedIXBRL) against equivalent plain dataclasses
+with a per-instance __dict__:
+
+- memory:   bytes allocated for the record objects (field values are shared
+            between both variants, so this is the per-object overhead)
+- pickle:   size and dumps/loads time for each document's ParsedIXBRL
+
+Usage:
+    python scripts/bench_parser_memory.py scripts/data/daily/Accounts_Bulk_Data-2024-01-02.zip
+    python scripts/bench_parser_memory.py scripts/data/daily/*.zip --limit 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import io
+import pickle
+import sys
+import time
+import tracemalloc
+import zipfile
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.parser.ixbrl import Context, NumericFact, ParsedIXBRL, TextFact, Unit
+from backend.parser.ixbrl_fast import parse_ixbrl_fast
+
+SLOTTED = (Context, Unit, NumericFact, TextFact, ParsedIXBRL)
+
+
+def _unslotted(cls: type) -> type:
+    """Plain (__dict__) dataclass with the same fields as cls."""
+    fields = [
+        (f.name, f.type, dataclasses.field(default=f.default, default_factory=f.default_factory))
+        for f in dataclasses.fields(cls)
+    ]
+    plain = dataclasses.make_dataclass(f"{cls.__name__}Dict", fields)
+    plain.__module__ = __name__
+    return plain
+
+
+# Module-level so pickle can find them
+ContextDict, UnitDict, NumericFactDict, TextFactDict, ParsedIXBRLDict = map(_unslotted, SLOTTED)
+PLAIN = dict(zip(SLOTTED, (ContextDict, UnitDict, NumericFactDict, TextFactDict, ParsedIXBRLDict)))
+
+
+def copy_records(parsed: ParsedIXBRL, plain: bool) -> ParsedIXBRL:
+    """Rebuild parsed as new slotted or plain records sharing the field values."""
+    def copy(obj):
+        cls = PLAIN[type(obj)] if plain else type(obj)
+        return cls(*(getattr(obj, f.name) for f in dataclasses.fields(obj)))
+
+    result = copy(parsed)
+    result.contexts = [copy(c) for c in parsed.contexts]
+    result.units = [copy(u) for u in parsed.units]
+    result.numeric_facts = [copy(f) for f in parsed.numeric_facts]
+    result.text_facts = [copy(f) for f in parsed.text_facts]
+    return result
+
+
+def iter_documents(zip_paths: list[Path], limit: int):
+    """Yield document bytes from bulk ZIPs, including CIC inner files."""
+    count = 0
+    for zip_path in zip_paths:
+        with zipfile.ZipFile(zip_path) as zf:
+            for name in zf.namelist():
+                if name.endswith('/') or name.startswith('__'):
+                    continue
+                content = zf.read(name)
+                if name.lower().endswith('.zip'):
+                    with zipfile.ZipFile(io.BytesIO(content)) as inner:
+                        docs = [
+                            inner.read(entry) for entry in inner.namelist()
+                            if entry.lower().endswith(('.xhtml', '.html', '.xml'))
+                        ]
+                else:
+                    docs = [content]
+                for doc in docs:
+                    yield doc
+                    count += 1
+                    if count >= limit:
+                        return
+
+
+def measure(parsed: list[ParsedIXBRL], plain: bool) -> dict[str, float]:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    records = [copy_records(p, plain) for p in parsed]
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    pickles = [pickle.dumps(r, protocol=pickle.HIGHEST_PROTOCOL) for r in records]
+    dumps_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for data in pickles:
+        pickle.loads(data)
+    loads_time = time.perf_counter() - start
+
+    return {
+        "memory": allocated,
+        "pickle_bytes": sum(len(p) for p in pickles),
+        "dumps": dumps_time,
+        "loads": loads_time,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parser record memory and pickling")
+    parser.add_argument("zips", nargs="+", type=Path, help="Bulk data ZIP files")
+    parser.add_argument("--limit", type=int, default=1000, help="Documents to parse")
+    args = parser.parse_args()
+
+    parsed = [parse_ixbrl_fast(doc) for doc in iter_documents(args.zips, args.limit)]
+    records = sum(
+        1 + len(p.contexts) + len(p.units) + len(p.numeric_facts) + len(p.text_facts)
+        for p in parsed
+    )
+    print(f"{len(parsed):,} documents, {records:,} records")
+
+    plain = measure(parsed, plain=True)
+    slotted = measure(parsed, plain=False)
+
+    print(f"\n{'':<14}{'__dict__':>14}{'slots':>14}{'change':>10}")
+    for key, label, unit, scale in (
+        ("memory", "memory", "MB", 1024 * 1024),
+        ("pickle_bytes", "pickle size", "MB", 1024 * 1024),
+        ("dumps", "pickle dumps", "s", 1),
+        ("loads", "pickle loads", "s", 1),
+    ):
+        before, after = plain[key] / scale, slotted[key] / scale
+        change = (after - before) / before * 100 if before else 0.0
+        print(f"{label:<14}{before:>12.2f}{unit:>2}{after:>12.2f}{unit:>2}{change:>+9.0f}%")
+    print(f"\nPer record: {plain['memory'] / records:.0f} -> {slotted['memory'] / records:.0f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Compare the loader's text-fact policies: load time, database size, reads.
+
+Large escaped text facts (HTML notes and policies) can be stored in full,
+zlib-compressed, or deferred to a byte range in the source ZIP (see
+backend/db/text_values.py). This loads the same bulk ZIPs into a fresh
+temporary database under each policy and reports:
+
+- load:        load_batch() time for all ZIPs
+- db size:     database size (pages in use) after VACUUM
+- text values: bytes stored in text_facts.value
+- read:        get_text_facts() for every filing, values resolved to text
+               (read back: the characters returned)
+
+Deferred reads open the source ZIPs, so they are found in the directories
+of the ZIPs given here.
+
+Usage:
+    python scripts/bench_text_facts.py scripts/data/daily/Accounts_Bulk_Data-2024-01-02.zip
+    python scripts/bench_text_facts.py scripts/data/daily/*.zip --workers 8 --keep
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.db import queries, text_values
+from backend.db.connection import get_connection, init_db
+from backend.db.text_values import TEXT_FACT_POLICIES
+from backend.loader.bulk_loader import (
+    ParserPool,
+    ResolutionCache,
+    configure_for_bulk_load,
+    load_batch,
+    restore_normal_config,
+)
+
+
+def load(db_path: Path, zips: list[Path], pool: ParserPool, policy: str) -> float:
+    init_db(db_path)
+    conn = get_connection(db_path)
+    try:
+        configure_for_bulk_load(conn)
+        cache = ResolutionCache(conn)
+        start = time.perf_counter()
+        for zip_path in zips:
+            load_batch(zip_path, conn=conn, cache=cache, pool=pool, text_facts_policy=policy)
+        elapsed = time.perf_counter() - start
+        restore_normal_config(conn)
+        conn.commit()
+        conn.execute("VACUUM")
+        return elapsed
+    finally:
+        conn.close()
+
+
+def measure(db_path: Path) -> dict[str, float]:
+    conn = get_connection(db_path, read_only=True)
+    try:
+        value_bytes, deferred = conn.execute(
+            """
+            SELECT COALESCE(SUM(LENGTH(value)), 0),
+                   (SELECT COUNT(*) FROM text_fact_sources)
+            FROM text_facts
+            """
+        ).fetchone()
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        filing_ids = [row[0] for row in conn.execute("SELECT id FROM filings")]
+
+        start = time.perf_counter()
+        resolved = sum(
+            len(fact["value"])
+            for filing_id in filing_ids
+            for fact in queries.get_text_facts(filing_id, conn=conn)
+            if fact["value"] is not None
+        )
+        read = time.perf_counter() - start
+    finally:
+        conn.close()
+
+    return {
+        "db_size": page_count * page_size,
+        "value_bytes": value_bytes,
+        "deferred": deferred,
+        "read": read,
+        "resolved": resolved,
+        "filings": len(filing_ids),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark text-fact storage policies")
+    parser.add_argument("zips", nargs="+", type=Path, help="Bulk data ZIP files")
+    parser.add_argument("--workers", type=int, default=4, help="Parser workers")
+    parser.add_argument(
+        "--policies", nargs="+", choices=TEXT_FACT_POLICIES, default=list(TEXT_FACT_POLICIES),
+        help="Policies to compare (default: all)"
+    )
+    parser.add_argument("--keep", action="store_true", help="Keep the databases (prints their paths)")
+    args = parser.parse_args()
+
+    logging.getLogger("backend.loader.bulk_loader").setLevel(logging.WARNING)
+
+    # Deferred values are read back from the ZIPs being loaded
+    text_values.SOURCE_DATA_DIRS[:0] = sorted({p.resolve().parent for p in args.zips})
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="bench_text_facts_"))
+    results = {}
+    with ParserPool(workers=args.workers) as pool:
+        for policy in args.policies:
+            db_path = tmp_dir / f"{policy}.db"
+            load_time = load(db_path, args.zips, pool, policy)
+            results[policy] = {"load": load_time, **measure(db_path)}
+
+    mb = 1024 * 1024
+    print(f"{results[args.policies[0]]['filings']:,} filings\n")
+    print(
+        f"{'policy':<12}{'load':>9}{'db size':>11}{'text values':>14}"
+        f"{'deferred':>10}{'read':>9}{'read back':>12}"
+    )
+    for policy, r in results.items():
+        print(
+            f"{policy:<12}{r['load']:>8.1f}s{r['db_size'] / mb:>9.1f}MB"
+            f"{r['value_bytes'] / mb:>12.1f}MB{r['deferred']:>10,}{r['read']:>8.2f}s"
+            f"{r['resolved'] / mb:>10.1f}MB"
+        )
+
+    if "full" in results:
+        base = results["full"]["db_size"]
+        print()
+        for policy, r in results.items():
+            if policy != "full":
+                print(f"{policy}: database {(r['db_size'] - base) / base * 100:+.1f}% vs full")
+
+    if args.keep:
+        print(f"\nDatabases kept in {tmp_dir}")
+    else:
+        for path in tmp_dir.iterdir():
+            path.unlink()
+        tmp_dir.rmdir()
+
+
+if __name__ == "__main__":
+    main()
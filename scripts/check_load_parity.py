@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Check that a loader change leaves the loaded data unchanged.
+
+Loads the same bulk ZIPs into fresh databases with two versions of the
+loader - a git revision (checked out into a temporary worktree) and the
+working tree, or a second revision - and compares:
+
+- content:  SHA-256 of every filing, fact and company row, with ids resolved
+            to their values (concept, context, dimensions), so row ids and
+            internal dedup keys don't matter; compressed text facts are
+            decompressed
+- reload:   files processed/skipped when copies of the ZIPs are loaded
+            again under new batch names (all of them should be skipped)
+
+and reports, for scale:
+
+- load:     load_batch() time for all ZIPs
+- results:  pickled size of the parse_file_content() results for every ZIP
+            entry (what a parser worker sends back), and the time for one
+            pickle round trip of them
+
+Exits non-zero if the content or reload counts differ.
+
+--synthetic DIR writes a reproducible set of synthetic bulk ZIPs to DIR and
+uses them: seeded iXBRL documents, some delivered again in the second batch
+and some inside CIC ZIPs. They exercise the loader's code paths but not the
+variety of real filings, so check real ZIPs too.
+
+Usage:
+    python scripts/check_load_parity.py --baseline HEAD~1 scripts/data/daily/*.zip
+    python scripts/check_load_parity.py --baseline d222e21^ --candidate d222e21 --synthetic /tmp/fixtures
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import io
+import json
+import logging
+import pickle
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+import zlib
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+# =============================================================================
+# Synthetic bulk ZIPs
+# =============================================================================
+
+_CONTEXT = (
+    '<xbrli:context id="{id}"><xbrli:entity>'
+    '<xbrli:identifier scheme="http://www.companieshouse.gov.uk/">{number}</xbrli:identifier>'
+    '{segment}</xbrli:entity><xbrli:period>{period}</xbrli:period></xbrli:context>'
+)
+
+_DOCUMENT = """<?xml version="1.0" encoding="UTF-8"?>
+<html xmlns="http://www.w3.org/1999/xhtml" xmlns:ix="http://www.xbrl.org/2013/inlineXBRL" \
+xmlns:xbrli="http://www.xbrl.org/2003/instance" xmlns:xbrldi="http://xbrl.org/2006/xbrldi" \
+xmlns:uk-core="http://xbrl.frc.org.uk/fr/2021-01-01/core" \
+xmlns:uk-bus="http://xbrl.frc.org.uk/cd/2021-01-01/business" \
+xmlns:iso4217="http://www.xbrl.org/2003/iso4217">
+<head><title>Accounts</title></head><body>
+<div style="display:none"><ix:header><ix:resources>
+{contexts}
+<xbrli:unit id="GBP"><xbrli:measure>iso4217:GBP</xbrli:measure></xbrli:unit>
+<xbrli:unit id="shares"><xbrli:measure>xbrli:shares</xbrli:measure></xbrli:unit>
+</ix:resources></ix:header></div>
+<p>Registered number <ix:nonNumeric name="uk-bus:UKCompaniesHouseRegisteredNumber" contextRef="d1">{number}</ix:nonNumeric></p>
+<p><ix:nonNumeric name="uk-bus:EntityCurrentLegalOrRegisteredName" contextRef="d1">{name}</ix:nonNumeric></p>
+<p><ix:nonNumeric name="uk-bus:BalanceSheetDate" contextRef="c1" format="ixt:datelonguk">31 March {year}</ix:nonNumeric></p>
+<p><ix:nonNumeric name="uk-bus:StartDateForPeriodCoveredByReport" contextRef="d1">{start}</ix:nonNumeric></p>
+<p><ix:nonNumeric name="uk-bus:EndDateForPeriodCoveredByReport" contextRef="d1">{end}</ix:nonNumeric></p>
+<p><ix:nonNumeric name="uk-bus:EntityDormantTruefalse" contextRef="d1">false</ix:nonNumeric></p>
+<p><ix:nonNumeric name="uk-core:AccountingPoliciesNote" contextRef="d1" escape="true"><span>Policy \
+<b>text</b> for {name}. {note}</span><ix:nonFraction name="uk-core:Equity" contextRef="c3" \
+unitRef="GBP" decimals="0">100</ix:nonFraction></ix:nonNumeric></p>
+<table>{rows}</table>
+</body></html>"""
+
+_INSTANT_CONCEPTS = (
+    "Equity", "NetAssetsLiabilities", "CurrentAssets", "Creditors", "NetCurrentAssetsLiabilities",
+    "TotalAssetsLessCurrentLiabilities", "CashBankOnHand", "Debtors", "FixedAssets",
+)
+_DURATION_CONCEPTS = ("AverageNumberEmployeesDuringPeriod", "TurnoverRevenue", "ProfitLoss")
+_NAMES = ("ACME", "WIDGET", "BRIGHT STAR", "NORTHERN", "OAK TREE", "BLUE SKY", "RED LION")
+
+
+def synthetic_document(index: int) -> tuple[str, bytes]:
+    """(company number, iXBRL bytes) of synthetic filing `index`; same index, same bytes."""
+    rng = random.Random(index)
+    number = f"{index:08d}"
+    year = rng.choice((2021, 2022, 2023))
+    end, previous, start = f"{year}-03-31", f"{year - 1}-03-31", f"{year - 1}-04-01"
+    member = (
+        '<xbrli:segment><xbrldi:explicitMember dimension="uk-core:EquityClassesDimension">'
+        'uk-core:ShareCapitalMember</xbrldi:explicitMember></xbrli:segment>'
+    )
+    contexts = "\n".join(
+        _CONTEXT.format(id=cid, number=number, segment=segment, period=period)
+        for cid, segment, period in (
+            ("c1", "", f"<xbrli:instant>{end}</xbrli:instant>"),
+            ("c2", "", f"<xbrli:instant>{previous}</xbrli:instant>"),
+            ("d1", "", f"<xbrli:startDate>{start}</xbrli:startDate><xbrli:endDate>{end}</xbrli:endDate>"),
+            ("c3", member, f"<xbrli:instant>{end}</xbrli:instant>"),
+        )
+    )
+    facts = [(c, ctx) for c in _INSTANT_CONCEPTS for ctx in ("c1", "c2")]
+    facts += [(c, "d1") for c in _DURATION_CONCEPTS]
+    rows = []
+    for concept, ctx in facts:
+        unit = "shares" if concept == "AverageNumberEmployeesDuringPeriod" else "GBP"
+        sign = ' sign="-"' if rng.random() < 0.1 else ""
+        rows.append(
+            f'<tr><td><ix:nonFraction name="uk-core:{concept}" contextRef="{ctx}" unitRef="{unit}" '
+            f'decimals="0" format="ixt:numdotdecimal"{sign}>{rng.randint(1, 900000):,}'
+            f'</ix:nonFraction></td></tr>'
+        )
+    suffix = rng.choice(("HOLDINGS ", "SERVICES ", "TRADING ", ""))
+    name = f"{rng.choice(_NAMES)} {suffix}{index} LIMITED"
+    document = _DOCUMENT.format(
+        contexts=contexts, number=number, name=name, year=year, start=start, end=end,
+        note="lorem ipsum " * 40, rows="".join(rows),
+    )
+    return number, document.encode("utf-8")
+
+
+def write_synthetic_zips(out_dir: Path) -> list[Path]:
+    """Two daily batches: 300 + 200 filings, 50 of them in both, 3 CIC ZIPs each."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    batches = []
+    for filename, first, count in (
+        ("Accounts_Bulk_Data-2023-12-01.zip", 0, 300),
+        ("Accounts_Bulk_Data-2023-12-02.zip", 250, 200),
+    ):
+        zip_path = out_dir / filename
+        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+            for index in range(first, first + count):
+                number, document = synthetic_document(index)
+                zf.writestr(f"Prod223_3521_{number}_20230331.html", document)
+            for index in range(first + 10_000, first + 10_003):
+                number, document = synthetic_document(index)
+                inner = io.BytesIO()
+                with zipfile.ZipFile(inner, "w") as cic:
+                    cic.writestr(f"{number}.xhtml", document)
+                zf.writestr(f"Prod224_0001_{number}_20230331.zip", inner.getvalue())
+        batches.append(zip_path)
+    return batches
+
+
+# =============================================================================
+# Measuring one loader version (run in a subprocess with its tree on sys.path)
+# =============================================================================
+
+_CONTENT_QUERIES = (
+    """
+    SELECT source_file, company_number, balance_sheet_date, period_start_date,
+           period_end_date, source_type
+    FROM filings ORDER BY source_file
+    """,
+    """
+    SELECT f.source_file, co.concept, cd.period_type, cd.instant_date, cd.start_date,
+           cd.end_date, dp.dimensions, nf.unit, nf.value
+    FROM numeric_facts nf
+    JOIN filings f ON f.id = nf.filing_id
+    JOIN concepts co ON co.id = nf.concept_id
+    JOIN context_definitions cd ON cd.id = nf.context_id
+    LEFT JOIN dimension_patterns dp ON dp.id = cd.dimension_pattern_id
+    ORDER BY 1, 2, 3, 4, 5, 6, 7, 8, 9
+    """,
+    """
+    SELECT f.source_file, co.concept, cd.period_type, cd.instant_date, cd.start_date,
+           cd.end_date, dp.dimensions, tf.value
+    FROM text_facts tf
+    JOIN filings f ON f.id = tf.filing_id
+    JOIN concepts co ON co.id = tf.concept_id
+    JOIN context_definitions cd ON cd.id = tf.context_id
+    LEFT JOIN dimension_patterns dp ON dp.id = cd.dimension_pattern_id
+    ORDER BY 1, 2, 3, 4, 5, 6, 7
+    """,
+    "SELECT company_number, name FROM companies ORDER BY company_number",
+)
+
+
+def content_digest(conn) -> tuple[int, str]:
+    """(row count, SHA-256) of the database's content, independent of row ids."""
+    digest = hashlib.sha256()
+    rows = 0
+    for query in _CONTENT_QUERIES:
+        for row in conn.execute(query):
+            row = tuple(
+                zlib.decompress(v).decode("utf-8") if isinstance(v, bytes) else v for v in row
+            )
+            digest.update(repr(row).encode("utf-8") + b"\n")
+            rows += 1
+    return rows, digest.hexdigest()
+
+
+def measure(db_path: Path, zips: list[Path], workers: int) -> dict:
+    from backend.db.connection import get_connection, init_db
+    from backend.loader import bulk_loader
+
+    logging.getLogger("backend.loader.bulk_loader").setLevel(logging.WARNING)
+
+    init_db(db_path)
+    conn = get_connection(db_path)
+    try:
+        # batches.filename is unique: the reload uses copies under new names
+        copies = []
+        for zip_path in zips:
+            copy = db_path.parent / f"redelivered-{zip_path.name}"
+            shutil.copyfile(zip_path, copy)
+            copies.append(copy)
+
+        loads = []
+        start = time.perf_counter()
+        for batch in (zips, copies):
+            processed = skipped = failed = 0
+            for zip_path in batch:
+                result = bulk_loader.load_batch(zip_path, workers=workers, conn=conn)
+                processed += result.files_processed
+                skipped += result.files_skipped
+                failed += result.files_failed
+            loads.append((processed, skipped, failed))
+            if len(loads) == 1:
+                load_time = time.perf_counter() - start
+        rows, content = content_digest(conn)
+        for copy in copies:
+            copy.unlink()
+    finally:
+        conn.close()
+
+    results = []
+    for zip_path in zips:
+        with zipfile.ZipFile(zip_path) as zf:
+            for entry in zf.namelist():
+                source_type = bulk_loader.detect_source_type(entry)
+                results.append(bulk_loader.parse_file_content((entry, zf.read(entry), source_type)))
+    pickled = [pickle.dumps(r, protocol=pickle.HIGHEST_PROTOCOL) for r in results]
+    start = time.perf_counter()
+    for r in results:
+        pickle.loads(pickle.dumps(r, protocol=pickle.HIGHEST_PROTOCOL))
+    round_trip = time.perf_counter() - start
+
+    return {
+        "rows": rows,
+        "content": content,
+        "load": loads[0],
+        "reload": loads[1],
+        "load_time": load_time,
+        "entries": len(results),
+        "pickle_bytes": sum(len(p) for p in pickled),
+        "round_trip": round_trip,
+    }
+
+
+# =============================================================================
+# Driver
+# =============================================================================
+
+def run_version(root: Path, zips: list[Path], workers: int, tmp_dir: Path, label: str) -> dict:
+    """measure() with the loader from `root`, in a fresh interpreter."""
+    output = subprocess.run(
+        [
+            sys.executable, str(Path(__file__).resolve()), "--measure", str(root),
+            "--db", str(tmp_dir / f"{label}.db"), "--workers", str(workers),
+            *(str(p.resolve()) for p in zips),
+        ],
+        check=True, stdout=subprocess.PIPE, text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare loaded data between two loader versions")
+    parser.add_argument("zips", nargs="*", type=Path, help="Bulk data ZIP files")
+    parser.add_argument("--baseline", help="Git revision to compare against")
+    parser.add_argument("--candidate", help="Git revision to check (default: the working tree)")
+    parser.add_argument("--synthetic", type=Path, metavar="DIR", help="Write synthetic bulk ZIPs to DIR and use them")
+    parser.add_argument("--workers", type=int, default=2, help="Parser workers")
+    parser.add_argument("--measure", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--db", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        sys.path.insert(0, str(args.measure))
+        print(json.dumps(measure(args.db, args.zips, args.workers)))
+        return
+
+    if not args.baseline:
+        parser.error("--baseline is required")
+    zips = list(args.zips)
+    if args.synthetic:
+        zips += write_synthetic_zips(args.synthetic)
+    if not zips:
+        parser.error("give bulk ZIPs, or --synthetic DIR")
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="check_load_parity_"))
+    worktrees = []
+    try:
+        roots = {}
+        for label, revision in (("baseline", args.baseline), ("candidate", args.candidate)):
+            if revision is None:
+                roots[label] = PROJECT_ROOT
+                continue
+            worktree = tmp_dir / label
+            subprocess.run(
+                ["git", "-C", str(PROJECT_ROOT), "worktree", "add", "--detach", "-q", str(worktree), revision],
+                check=True,
+            )
+            worktrees.append(worktree)
+            roots[label] = worktree
+
+        results = {
+            label: run_version(root, zips, args.workers, tmp_dir, label)
+            for label, root in roots.items()
+        }
+    finally:
+        for worktree in worktrees:
+            subprocess.run(
+                ["git", "-C", str(PROJECT_ROOT), "worktree", "remove", "--force", str(worktree)],
+                check=False,
+            )
+        for path in tmp_dir.glob("*.db*"):
+            path.unlink()
+        tmp_dir.rmdir()
+
+    base, cand = results["baseline"], results["candidate"]
+    print(f"{len(zips)} ZIPs, {base['entries']:,} entries\n")
+    print(f"{'':<11}{'rows':>8}  {'content':<18}{'load':>8}  {'loaded':<12}{'reloaded':<12}{'results':>10}{'round trip':>12}")
+    for label, r in results.items():
+        print(
+            f"{label:<11}{r['rows']:>8,}  {r['content'][:16]:<18}{r['load_time']:>7.2f}s  "
+            f"{'/'.join(map(str, r['load'])):<12}{'/'.join(map(str, r['reload'])):<12}"
+            f"{r['pickle_bytes'] / 1024:>8.0f}KB{r['round_trip'] * 1000:>10.1f}ms"
+        )
+    print("(loaded, reloaded: files processed/skipped/failed)\n")
+    speedup = base["round_trip"] / cand["round_trip"]
+    print(
+        f"Results: {(cand['pickle_bytes'] - base['pickle_bytes']) / base['pickle_bytes'] * 100:+.0f}% "
+        f"pickled size, round trip "
+        + (f"{speedup:.1f}x faster" if speedup >= 1 else f"{1 / speedup:.1f}x slower")
+    )
+
+    problems = []
+    if (base["rows"], base["content"]) != (cand["rows"], cand["content"]):
+        problems.append("loaded content differs")
+    if (base["load"], base["reload"]) != (cand["load"], cand["reload"]):
+        problems.append("file counts differ")
+    if problems:
+        sys.exit("; ".join(problems))
+    print("Loaded content identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ Usage:
     python scripts/load_all_batches.py
     python scripts/load_all_batches.py --dry-run     # Preview what would be loaded
     python scripts/load_all_batches.py --limit 5     # Process only 5 batches
+    python scripts/load_all_batches.py --text-facts compressed  # zlib large escaped text facts
 """
 
 from __future__ import annotations
@@ -28,8 +29,10 @@ PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from backend.db.connection import get_connection, init_db
+from backend.db.text_values import TEXT_FACT_POLICIES, TEXT_FACT_POLICY
 from backend.loader.bulk_loader import (
     BatchResult,
+    ParserPool,
     ResolutionCache,
     configure_for_bulk_load,
     drop_indexes_for_bulk_load,
@@ -138,8 +141,9 @@ def cleanup_incomplete_batch(conn: sqlite3.Connection, filename: str) -> None:
     """Remove an incomplete batch and all its associated data.
 
     Queries for a batch row with the given filename where processed_at IS NULL.
-    If found, deletes numeric_facts, text_facts, filings, and the batch row
-    in FK-safe order so the filename can be reused on retry.
+    If found, deletes numeric_facts, text_fact_sources, text_facts,
+    filing_summaries, filings, and the batch row in FK-safe order so the
+    filename can be reused on retry.
     """
     row = conn.execute(
         "SELECT id FROM batches WHERE filename = ? AND processed_at IS NULL",
@@ -151,21 +155,44 @@ def cleanup_incomplete_batch(conn: sqlite3.Connection, filename: str) -> None:
 
     batch_id = row["id"]
 
-    # Delete facts -> filings -> batch (FK-safe order)
-    conn.execute(
+    # Delete facts/summaries -> filings -> batch (FK-safe order)
+    numeric_count = conn.execute(
         "DELETE FROM numeric_facts WHERE filing_id IN "
         "(SELECT id FROM filings WHERE batch_id = ?)",
         (batch_id,)
-    )
+    ).rowcount
     conn.execute(
+        "DELETE FROM text_fact_sources WHERE text_fact_id IN "
+        "(SELECT tf.id FROM text_facts tf JOIN filings f ON f.id = tf.filing_id "
+        "WHERE f.batch_id = ?)",
+        (batch_id,)
+    )
+    text_count = conn.execute(
         "DELETE FROM text_facts WHERE filing_id IN "
         "(SELECT id FROM filings WHERE batch_id = ?)",
         (batch_id,)
+    ).rowcount
+    conn.execute(
+        "DELETE FROM filing_summaries WHERE filing_id IN "
+        "(SELECT id FROM filings WHERE batch_id = ?)",
+        (batch_id,)
     )
     filing_count = conn.execute(
         "DELETE FROM filings WHERE batch_id = ?", (batch_id,)
     ).rowcount
     conn.execute("DELETE FROM batches WHERE id = ?", (batch_id,))
+
+    # Keep maintained row counts (db_stats) in step, in the same transaction
+    for table, removed in (
+        ("numeric_facts", numeric_count),
+        ("text_facts", text_count),
+        ("filings", filing_count),
+        ("batches", 1),
+    ):
+        conn.execute(
+            "UPDATE db_stats SET row_count = row_count - ? WHERE table_name = ?",
+            (removed, table)
+        )
     conn.commit()
 
     logger.info(
@@ -217,6 +244,7 @@ def load_all_batches(
     dry_run: bool = False,
     limit: int | None = None,
     data_dirs: list[Path] | None = None,
+    text_facts_policy: str = TEXT_FACT_POLICY,
 ) -> dict:
     """
     Load all pending batches into the database.
@@ -225,6 +253,7 @@ def load_all_batches(
         dry_run: If True, only show what would be loaded
         limit: Maximum number of batches to process (None = all)
         data_dirs: Directories to scan for ZIPs (default: daily/ + monthly/)
+        text_facts_policy: How large escaped text facts are stored (see load_batch)
 
     Returns:
         Statistics dict with results
@@ -266,14 +295,16 @@ def load_all_batches(
     failed_batches: list[tuple[str, str]] = []
     start_time = time.time()
 
-    # Set up shared connection, cache, and indexes for entire run
+    # Set up shared connection, cache, parser pool and indexes for entire run
     init_db()
     conn = get_connection()
+    pool = ParserPool()
 
     try:
         configure_for_bulk_load(conn)
         drop_indexes_for_bulk_load(conn)
         cache = ResolutionCache(conn)
+        pool.start()
 
         # Process each batch
         for i, batch_path in enumerate(pending, 1):
@@ -295,7 +326,10 @@ def load_all_batches(
                 # Fix 1: clean up any incomplete previous attempt for this file
                 cleanup_incomplete_batch(conn, batch_path.name)
 
-                result = load_batch(batch_path, conn=conn, cache=cache)
+                result = load_batch(
+                    batch_path, conn=conn, cache=cache, pool=pool,
+                    text_facts_policy=text_facts_policy,
+                )
                 results.append(result)
 
                 batch_duration = time.time() - batch_start
@@ -340,6 +374,7 @@ def load_all_batches(
                     cache = ResolutionCache(conn)
 
     finally:
+        pool.close()
         # Fix 4: recreate indexes in finally so they're restored even on crash
         try:
             logger.info("Recreating indexes...")
@@ -423,6 +458,13 @@ def main():
         default=None,
         help="Specific directory to scan (default: both daily/ and monthly/)"
     )
+    parser.add_argument(
+        "--text-facts",
+        choices=TEXT_FACT_POLICIES,
+        default=TEXT_FACT_POLICY,
+        help="How large escaped text facts are stored: full, compressed (zlib) "
+             "or deferred (byte range into the source ZIP) (default: %(default)s)"
+    )
 
     args = parser.parse_args()
 
@@ -444,6 +486,7 @@ def main():
             dry_run=args.dry_run,
             limit=args.limit,
             data_dirs=data_dirs,
+            text_facts_policy=args.text_facts,
         )
 
         if not args.dry_run:
@@ -0,0 +1,76 @@
+"""Shared test setup: project root on sys.path, and fixtures for loading iXBRL filings."""
+
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.db.connection import get_connection, init_db  # noqa: E402
+from backend.loader.bulk_loader import load_batch_sequential  # noqa: E402
+
+_NAMESPACES = (
+    'xmlns="http://www.w3.org/1999/xhtml" xmlns:ix="http://www.xbrl.org/2013/inlineXBRL" '
+    'xmlns:xbrli="http://www.xbrl.org/2003/instance" '
+    'xmlns:uk-core="http://xbrl.frc.org.uk/fr/2021-01-01/core" '
+    'xmlns:uk-bus="http://xbrl.frc.org.uk/cd/2021-01-01/business" '
+    'xmlns:iso4217="http://www.xbrl.org/2003/iso4217"'
+)
+
+
+def _ixbrl_document(number: str, start: str, end: str, contexts: dict, facts: list) -> str:
+    """iXBRL filing: contexts {id: (start, end)} besides "cur"; facts [(concept, context id, value)]."""
+    contexts = {"cur": (start, end), **contexts}
+    context_xml = "".join(
+        f'<xbrli:context id="{cid}"><xbrli:entity><xbrli:identifier '
+        f'scheme="http://www.companieshouse.gov.uk/">{number}</xbrli:identifier></xbrli:entity>'
+        f'<xbrli:period><xbrli:startDate>{s}</xbrli:startDate><xbrli:endDate>{e}</xbrli:endDate>'
+        f'</xbrli:period></xbrli:context>'
+        for cid, (s, e) in contexts.items()
+    )
+    fact_xml = "".join(
+        f'<ix:nonFraction name="uk-core:{concept}" contextRef="{cid}" unitRef="GBP" '
+        f'decimals="0">{value}</ix:nonFraction>'
+        for concept, cid, value in facts
+    )
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?><html {_NAMESPACES}><body>'
+        f'<ix:header><ix:resources>{context_xml}'
+        f'<xbrli:unit id="GBP"><xbrli:measure>iso4217:GBP</xbrli:measure></xbrli:unit>'
+        f'</ix:resources></ix:header>'
+        f'<ix:nonNumeric name="uk-bus:UKCompaniesHouseRegisteredNumber" contextRef="cur">{number}</ix:nonNumeric>'
+        f'<ix:nonNumeric name="uk-bus:BalanceSheetDate" contextRef="cur">{end}</ix:nonNumeric>'
+        f'<ix:nonNumeric name="uk-bus:StartDateForPeriodCoveredByReport" contextRef="cur">{start}</ix:nonNumeric>'
+        f'<ix:nonNumeric name="uk-bus:EndDateForPeriodCoveredByReport" contextRef="cur">{end}</ix:nonNumeric>'
+        f'{fact_xml}</body></html>'
+    )
+
+
+@pytest.fixture
+def ixbrl_document():
+    return _ixbrl_document
+
+
+@pytest.fixture
+def load_documents(tmp_path):
+    """Load {ZIP entry name: document} as one batch into a fresh database; yields its connection."""
+    conns = []
+
+    def load(documents: dict[str, str]):
+        zip_path = tmp_path / "Accounts_Bulk_Data-2024-04-02.zip"
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            for name, document in documents.items():
+                zf.writestr(name, document)
+        db_path = tmp_path / "test.db"
+        init_db(db_path)
+        conn = get_connection(db_path)
+        conns.append(conn)
+        result = load_batch_sequential(zip_path, conn=conn)
+        assert result.files_processed == len(documents), result.errors
+        return conn
+
+    yield load
+    for conn in conns:
+        conn.close()
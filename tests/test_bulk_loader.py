@@ -0,0 +1,44 @@
+"""Tests for backend.loader.bulk_loader."""
+
+import io
+import zipfile
+
+from backend.loader.bulk_loader import parse_file_content
+
+XBRL_INSTANCE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<xbrli:xbrl xmlns:xbrli="http://www.xbrl.org/2003/instance"
+    xmlns:iso4217="http://www.xbrl.org/2003/iso4217"
+    xmlns:uk-gaap="http://www.xbrl.org/uk/gaap/core/2009-09-01"
+    xmlns:uk-bus="http://www.xbrl.org/uk/cd/business/2009-09-01">
+  <xbrli:context id="c1">
+    <xbrli:entity><xbrli:identifier scheme="http://www.companieshouse.gov.uk/">01234567</xbrli:identifier></xbrli:entity>
+    <xbrli:period><xbrli:instant>2012-03-31</xbrli:instant></xbrli:period>
+  </xbrli:context>
+  <xbrli:unit id="GBP"><xbrli:measure>iso4217:GBP</xbrli:measure></xbrli:unit>
+  <uk-bus:UKCompaniesHouseRegisteredNumber contextRef="c1">01234567</uk-bus:UKCompaniesHouseRegisteredNumber>
+  <uk-gaap:ShareholderFunds contextRef="c1" unitRef="GBP" decimals="0">1234</uk-gaap:ShareholderFunds>
+</xbrli:xbrl>
+"""
+
+
+def cic_zip(entries: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        for name, content in entries.items():
+            zf.writestr(name, content)
+    return buffer.getvalue()
+
+
+def test_cic_xbrl_instance_uses_xbrl_parser():
+    outer = "Prod224_0001_01234567_20120331.zip"
+    content = cic_zip({"CIC-01234567/accounts/instance.xml": XBRL_INSTANCE})
+
+    [parsed] = parse_file_content((outer, content, "cic_zip"))
+
+    assert parsed.error is None
+    assert parsed.source_file == f"{outer}!CIC-01234567/accounts/instance.xml"
+    assert parsed.source_type == "xbrl_xml"
+    assert parsed.rows.company_number == "01234567"
+    assert [(f[0], f[3]) for f in parsed.rows.numeric_facts] == [
+        ("uk-gaap:ShareholderFunds", 1234.0)
+    ]
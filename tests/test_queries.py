@@ -0,0 +1,23 @@
+"""Tests for backend.db.queries."""
+
+from backend.db.queries import REPORT_CONCEPTS, get_company_report
+
+
+def test_report_keeps_prior_period_used_only_by_other_concepts(ixbrl_document, load_documents):
+    assert "DividendsPaid" not in REPORT_CONCEPTS
+    document = ixbrl_document("00000003", "2023-04-01", "2024-03-31", {
+        "prior": ("2022-04-01", "2023-03-31"),
+    }, [
+        ("TurnoverRevenue", "cur", "120"),
+        ("DividendsPaid", "prior", "10"),
+    ])
+    conn = load_documents({"Prod223_0001_00000003_20240331.html": document})
+
+    report = get_company_report("00000003", conn=conn)
+
+    durations = {
+        (c["start_date"], c["end_date"])
+        for c in report["facts"]["contexts"] if c["period_type"] == "duration"
+    }
+    assert ("2022-04-01", "2023-03-31") in durations
+    assert [f["concept"] for f in report["facts"]["numeric_facts"]] == ["TurnoverRevenue"]
@@ -0,0 +1,44 @@
+"""Tests for backend.loader.summaries."""
+
+from backend.loader.summaries import backfill_summaries
+
+
+def test_backfill_matches_load_time_summary(ixbrl_document, load_documents):
+    # The first filing creates ProfitLoss before TurnoverRevenue, so in the
+    # second, facts stored in concept_id order put context "a" first while
+    # the document uses "b" first; both end within tolerance of the start
+    first = ixbrl_document("00000001", "2022-04-01", "2023-03-31", {}, [
+        ("ProfitLoss", "cur", "5"), ("TurnoverRevenue", "cur", "50"),
+    ])
+    second = ixbrl_document("00000002", "2023-04-01", "2024-03-31", {
+        "a": ("2022-04-01", "2023-03-31"),   # ends 1 day before the current start
+        "b": ("2022-04-03", "2023-03-29"),   # ends 3 days before
+    }, [
+        ("TurnoverRevenue", "b", "90"),
+        ("ProfitLoss", "a", "7"),
+        ("TurnoverRevenue", "a", "100"),
+        ("TurnoverRevenue", "cur", "120"),
+    ])
+    conn = load_documents({
+        "Prod223_0001_00000001_20230331.html": first,
+        "Prod223_0001_00000002_20240331.html": second,
+    })
+
+    filing_id = conn.execute(
+        "SELECT id FROM filings WHERE company_number = '00000002'"
+    ).fetchone()[0]
+    loaded = dict(conn.execute(
+        "SELECT * FROM filing_summaries WHERE filing_id = ?", (filing_id,)
+    ).fetchone())
+    assert (loaded["prior_period_start_date"], loaded["prior_period_end_date"]) == (
+        "2022-04-01", "2023-03-31"
+    )
+    assert (loaded["turnover"], loaded["turnover_prior"]) == (120, 100)
+
+    conn.execute("DELETE FROM filing_summaries")
+    conn.commit()
+    assert backfill_summaries(conn) == 2
+    backfilled = dict(conn.execute(
+        "SELECT * FROM filing_summaries WHERE filing_id = ?", (filing_id,)
+    ).fetchone())
+    assert backfilled == loaded